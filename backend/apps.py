@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class BackendConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'backend'
+
+    def ready(self):
+        from backend.utils.entropy import secret_keys
+        from backend.utils.key_schedule import key_schedule_cache
+
+        cache_size = getattr(settings, 'VIGENERE_KEY_SCHEDULE_CACHE_SIZE', None)
+        if cache_size is not None:
+            key_schedule_cache.resize(cache_size)
+
+        queue_size = getattr(settings, 'SECRET_KEY_QUEUE_SIZE', None)
+        if queue_size is not None:
+            secret_keys.resize(queue_size)
@@ -0,0 +1,218 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from rest_framework import status
+
+from backend.conditional import etag_matches, input_etag, not_modified
+from backend.guards import exceeds_text_limit, limit_request_body
+from backend.limits import MAX_NUM_COUNT, MAX_REQUEST_BODY_SIZE, MAX_SMALL_REQUEST_BODY_SIZE
+from backend.result_cache import (
+    cached_caesar_cipher,
+    cached_vigenere_cipher,
+    caesar_parameters,
+    input_digest,
+    vigenere_parameters,
+)
+from backend.utils.entropy import secret_keys
+from backend.utils.parallel_cipher import get_pool
+from backend.utils.random_numbers import generate_random_numbers
+
+
+# Work on up to this many characters runs on the event loop itself
+INLINE_MAX_SIZE = 64 * 1024
+# Up to this many characters it runs on a thread; beyond, on the process pool
+THREAD_MAX_SIZE = 1024 * 1024
+# Bodies Django parses into request.POST; an empty type is a request without a body
+FORM_CONTENT_TYPES = ('application/x-www-form-urlencoded', 'multipart/form-data', '')
+
+_thread_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='eye-diskage')
+
+
+async def run_by_cost(size, function, *args, processes=True):
+    """
+    Run function(*args) where its cost will not stall the event loop.
+
+    Small inputs run inline, as handing them off would cost more than the
+    work. Medium ones go to a thread pool, which keeps the loop free to
+    switch between requests. Large ones go to the process pool so they do
+    not compete with the loop for the GIL either, unless processes is False:
+    work that is cheap next to pickling its input and output both ways, or
+    that releases the GIL, such as hashing, stays on the thread pool.
+
+    :param size: The size of the input, in characters.
+    :param function: A module-level function, so it can be pickled.
+    :param processes: Whether large inputs may go to the process pool.
+    :return: The return value of function.
+    """
+    if size <= INLINE_MAX_SIZE:
+        return function(*args)
+
+    executor = _thread_pool if size <= THREAD_MAX_SIZE or not processes else get_pool()
+    return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+
+
+class UnsupportedMediaType(Exception):
+    """The request body is neither JSON nor form data"""
+
+
+async def read_fields(request):
+    """Returns the fields of a JSON or form body; raises ValueError on bad JSON, UnsupportedMediaType on other types"""
+
+    if request.content_type in FORM_CONTENT_TYPES:
+        return request.POST
+    if request.content_type != 'application/json':
+        raise UnsupportedMediaType(f'Unsupported media type "{request.content_type}" in request.')
+
+    # Read the stream directly: request.body would refuse JSON texts over
+    # DATA_UPLOAD_MAX_MEMORY_SIZE that the body guard already admitted
+    body = request.read()
+    if not body:
+        return {}
+
+    data = await run_by_cost(len(body), json.loads, body, processes=False)
+    if not isinstance(data, dict):
+        raise ValueError("Expected a JSON object.")
+    return data
+
+
+async def result_response(result):
+    """Returns the {"result": ...} response, encoding large results off the loop"""
+
+    content = await run_by_cost(len(result), json.dumps, {"result": result}, processes=False)
+    return HttpResponse(content, content_type='application/json', status=status.HTTP_200_OK)
+
+
+async def conditional_result_response(request, digest, function, *args):
+    """Returns 304 if the client holds the result of digest, else the result of function(*args) with its ETag"""
+
+    # json.dumps escapes non-ASCII, so these bodies differ from the DRF views'
+    etag = input_etag(digest, 'ascii-json')
+    # A 304 on POST rather than RFC 9110's 412; see not_modified
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    response = await result_response(await run_by_cost(len(args[0]), function, *args))
+    response['ETag'] = etag
+    return response
+
+
+def error_response(message, status_code=status.HTTP_400_BAD_REQUEST):
+    return JsonResponse({"error": message}, status=status_code)
+
+
+# These are plain Django views, so they are exempted from CSRF explicitly to
+# take the same unauthenticated API calls as the DRF views api_view exempts
+@limit_request_body(MAX_SMALL_REQUEST_BODY_SIZE)
+@csrf_exempt
+@require_POST
+async def generator_async_view(request):
+    return JsonResponse({'key': secret_keys.get()}, status=status.HTTP_200_OK)
+
+
+@limit_request_body(MAX_REQUEST_BODY_SIZE)
+@csrf_exempt
+@require_POST
+async def caesar_cipher_async_view(request):
+    try:
+        data = await read_fields(request)
+    except UnsupportedMediaType as e:
+        return error_response(str(e), status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+    except ValueError as e:
+        return error_response(f"JSON parse error - {e}")
+
+    text = data.get('text', '')
+    mode = data.get('mode', 'encrypt')
+
+    if not isinstance(text, str):
+        return error_response(f"Wrong data type! text must be a string, not {type(text).__name__}")
+
+    if exceeds_text_limit(text):
+        return error_response("Text size exceeds the allowed limit.")
+
+    try:
+        shift = int(data.get('shift', 3))
+    except TypeError as type_error:
+        return error_response(f"Wrong data type! {type_error}")
+    except ValueError as val_error:
+        return error_response(f"Wrong shift type! {val_error}")
+
+    digest = await run_by_cost(len(text), input_digest, 'caesar', caesar_parameters(shift, mode), text, processes=False)
+
+    return await conditional_result_response(request, digest, cached_caesar_cipher, text, shift, mode, digest)
+
+
+@limit_request_body(MAX_REQUEST_BODY_SIZE)
+@csrf_exempt
+@require_POST
+async def vigenere_cipher_async_view(request):
+    try:
+        data = await read_fields(request)
+    except UnsupportedMediaType as e:
+        return error_response(str(e), status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+    except ValueError as e:
+        return error_response(f"JSON parse error - {e}")
+
+    text = data.get('text', '')
+    key = data.get('key', '')
+    mode = data.get('mode', 'encrypt')
+
+    if not isinstance(text, str):
+        return error_response(f"Wrong data type! text must be a string, not {type(text).__name__}")
+
+    if exceeds_text_limit(text):
+        return error_response("Text size exceeds the allowed limit.")
+
+    if not key:
+        return error_response("Key is required.")
+
+    # Validate the key here, before any work is shipped out
+    try:
+        parameters = vigenere_parameters(key, mode)
+    except (TypeError, ValueError) as e:
+        return error_response(f"Wrong data type! {e}")
+
+    digest = await run_by_cost(len(text), input_digest, 'vigenere', parameters, text, processes=False)
+
+    return await conditional_result_response(request, digest, cached_vigenere_cipher, text, key, mode, digest)
+
+
+@limit_request_body(MAX_SMALL_REQUEST_BODY_SIZE)
+@csrf_exempt
+@require_POST
+async def secure_random_numbers_async_view(request):
+    try:
+        data = await read_fields(request)
+    except UnsupportedMediaType as e:
+        return error_response(str(e), status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+    except ValueError as e:
+        return error_response(f"JSON parse error - {e}")
+
+    min_value = data.get('min_value')
+    max_value = data.get('max_value')
+
+    if min_value is None or max_value is None:
+        return error_response("min_value and max_value are required.")
+
+    try:
+        min_value = int(min_value)
+        max_value = int(max_value)
+        count = int(data.get('count', 1))
+        unique = bool(data.get('unique', True))
+
+        if count > MAX_NUM_COUNT:
+            return error_response(f"count cannot be more than {MAX_NUM_COUNT}")
+        elif count <= 0:
+            return error_response("count cannot be less or equal 0")
+
+        # At most MAX_NUM_COUNT draws, cheap enough to run inline
+        random_numbers = generate_random_numbers(min_value, max_value, count, unique)
+    except (TypeError, ValueError) as e:
+        return error_response(str(e))
+
+    return JsonResponse({"random_numbers": random_numbers}, status=status.HTTP_200_OK)
@@ -0,0 +1,163 @@
+import json
+
+from rest_framework import status
+
+from backend.guards import exceeds_text_limit
+from backend.limits import MAX_BATCH_SIZE, MAX_NUM_COUNT
+from backend.result_cache import cached_caesar_cipher, cached_vigenere_cipher
+from backend.utils.entropy import secret_keys
+from backend.utils.random_numbers import generate_random_numbers
+
+
+class OperationError(Exception):
+    """A batch operation was rejected; carries the status the endpoint would use"""
+
+    def __init__(self, message, status_code=status.HTTP_400_BAD_REQUEST):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+def _validate_text(text):
+    if not isinstance(text, str):
+        raise OperationError(f"Wrong data type! text must be a string, not {type(text).__name__}")
+    if exceeds_text_limit(text):
+        raise OperationError("Text size exceeds the allowed limit.")
+
+
+def caesar_cipher_operation(params):
+    """Runs one caesar-cipher operation, mirroring caesar_cipher_view"""
+
+    text = params.get('text', '')
+    _validate_text(text)
+
+    try:
+        result = cached_caesar_cipher(text, shift=params.get('shift', 3), mode=params.get('mode', 'encrypt'))
+    except TypeError as type_error:
+        raise OperationError(f"Wrong data type! {type_error}")
+    except ValueError as val_error:
+        raise OperationError(f"Wrong shift type! {val_error}")
+
+    return {"result": result}
+
+
+def vigenere_cipher_operation(params):
+    """Runs one vigenere-cipher operation, mirroring vigenere_cipher_view"""
+
+    text = params.get('text', '')
+    key = params.get('key', '')
+    _validate_text(text)
+
+    if not key:
+        raise OperationError("Key is required.")
+
+    try:
+        result = cached_vigenere_cipher(text, key=key, mode=params.get('mode', 'encrypt'))
+    except TypeError as type_error:
+        raise OperationError(f"Wrong data type! {type_error}")
+
+    return {"result": result}
+
+
+def secure_random_numbers_operation(params):
+    """Runs one secure-random-numbers operation, mirroring secure_random_numbers_view"""
+
+    min_value = params.get('min_value')
+    max_value = params.get('max_value')
+
+    if min_value is None or max_value is None:
+        raise OperationError("min_value and max_value are required.")
+
+    try:
+        min_value = int(min_value)
+        max_value = int(max_value)
+        count = int(params.get('count', 1))
+        unique = bool(params.get('unique', True))
+
+        if count > MAX_NUM_COUNT:
+            raise OperationError(f"count cannot be more than {MAX_NUM_COUNT}")
+        elif count <= 0:
+            raise OperationError("count cannot be less or equal 0")
+
+        random_numbers = generate_random_numbers(min_value, max_value, count, unique)
+    except (TypeError, ValueError) as e:
+        raise OperationError(str(e))
+
+    return {"random_numbers": random_numbers}
+
+
+def django_key_generate_operation(params):
+    """Runs one django-ker-generate operation, mirroring generator_view"""
+
+    return {"key": secret_keys.get()}
+
+
+# Operation names match the path segments of the single-operation endpoints
+OPERATIONS = {
+    'caesar-cipher': caesar_cipher_operation,
+    'vigenere-cipher': vigenere_cipher_operation,
+    'secure-random-numbers': secure_random_numbers_operation,
+    'django-ker-generate': django_key_generate_operation,
+}
+
+# Only pure functions of their input may be merged. Merging two random
+# operations would hand the same numbers or secret key to both of them.
+DETERMINISTIC_OPERATIONS = frozenset({'caesar-cipher', 'vigenere-cipher'})
+
+
+def run_operation(operation):
+    """
+    Run a single batch operation.
+
+    :param operation: A dict with an 'operation' name and its parameters.
+    :return: A (status_code, body) tuple; body holds 'error' on failure.
+    """
+    if isinstance(operation, Exception):
+        return status.HTTP_400_BAD_REQUEST, {"error": str(operation)}
+    if not isinstance(operation, dict):
+        return status.HTTP_400_BAD_REQUEST, {"error": "Each operation must be an object."}
+
+    handler = OPERATIONS.get(operation.get('operation'))
+    if handler is None:
+        return status.HTTP_400_BAD_REQUEST, {"error": f"Unknown operation: {operation.get('operation')!r}."}
+
+    try:
+        return status.HTTP_200_OK, handler(operation)
+    except OperationError as e:
+        return e.status_code, {"error": e.message}
+    except Exception as e:
+        return status.HTTP_500_INTERNAL_SERVER_ERROR, {"error": f"An unexpected error occurred. {e}"}
+
+
+def run_batch(operations):
+    """
+    Run batch operations in order, merging identical deterministic ones.
+
+    :param operations: An iterable of operation dicts; may be lazy.
+    :return: A generator of (index, status_code, body) tuples in input order.
+    """
+    merged = {}
+
+    for index, operation in enumerate(operations):
+        if index >= MAX_BATCH_SIZE:
+            yield index, status.HTTP_400_BAD_REQUEST, {
+                "error": f"A batch cannot hold more than {MAX_BATCH_SIZE} operations."
+            }
+            return
+
+        if isinstance(operation, dict) and operation.get('operation') in DETERMINISTIC_OPERATIONS:
+            merge_key = json.dumps(operation, sort_keys=True)
+            if merge_key not in merged:
+                merged[merge_key] = run_operation(operation)
+            status_code, body = merged[merge_key]
+        else:
+            status_code, body = run_operation(operation)
+
+        yield index, status_code, body
+
+
+def iter_batch_lines(operations):
+    """Yields one encoded NDJSON line per batch operation result"""
+
+    for index, status_code, body in run_batch(operations):
+        yield json.dumps({"index": index, "status": status_code, **body}).encode('utf-8') + b'\n'
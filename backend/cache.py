@@ -0,0 +1,101 @@
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+
+# Byte accounting per cache name, shared like LocMemCache's own stores
+_budgets = {}
+
+
+class _ByteBudget:
+    def __init__(self):
+        self.sizes = {}
+        self.bytes = 0
+        self.evictions = 0
+
+
+class ByteBudgetLocMemCache(LocMemCache):
+    """
+    LocMemCache that keeps its pickled values under a total byte budget.
+
+    When a set pushes the total past OPTIONS['MAX_BYTES'] (default 64 MB),
+    least recently used entries are evicted until it fits again; a single
+    value larger than the whole budget is not stored. MAX_ENTRIES still
+    applies on top.
+    """
+
+    def __init__(self, name, params):
+        super().__init__(name, params)
+        self._max_bytes = int(params.get('OPTIONS', {}).get('MAX_BYTES', DEFAULT_MAX_BYTES))
+        self._budget = _budgets.setdefault(name, _ByteBudget())
+
+    def _forget(self, key):
+        size = self._budget.sizes.pop(key, None)
+        if size is not None:
+            self._budget.bytes -= size
+
+    def _evict_oldest(self):
+        key, _ = self._cache.popitem()
+        del self._expire_info[key]
+        self._forget(key)
+        self._budget.evictions += 1
+
+    def _set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        self._forget(key)
+        if len(value) > self._max_bytes:
+            super()._delete(key)
+            return
+
+        super()._set(key, value, timeout)
+        self._budget.sizes[key] = len(value)
+        self._budget.bytes += len(value)
+
+        while self._budget.bytes > self._max_bytes:
+            self._evict_oldest()
+
+    def _cull(self):
+        if self._cull_frequency == 0:
+            self._budget.evictions += len(self._cache)
+            self._cache.clear()
+            self._expire_info.clear()
+            self._budget.sizes.clear()
+            self._budget.bytes = 0
+        else:
+            for _ in range(len(self._cache) // self._cull_frequency):
+                self._evict_oldest()
+
+    def _delete(self, key):
+        self._forget(key)
+        return super()._delete(key)
+
+    def incr(self, key, delta=1, version=None):
+        value = super().incr(key, delta, version)
+        key = self.make_and_validate_key(key, version=version)
+        with self._lock:
+            if key in self._cache:
+                self._forget(key)
+                self._budget.sizes[key] = len(self._cache[key])
+                self._budget.bytes += len(self._cache[key])
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._expire_info.clear()
+            self._budget.sizes.clear()
+            self._budget.bytes = 0
+
+    def info(self):
+        """
+        Report the state of the cache.
+
+        :return: A dict with 'entries', 'bytes', 'max_bytes' and 'evictions'.
+        """
+        with self._lock:
+            return {
+                'entries': len(self._cache),
+                'bytes': self._budget.bytes,
+                'max_bytes': self._max_bytes,
+                'evictions': self._budget.evictions,
+            }
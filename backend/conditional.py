@@ -0,0 +1,55 @@
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
+
+
+def input_etag(digest, representation=None):
+    """
+    Return the strong ETag of a response that is a pure function of its inputs.
+
+    :param digest: The input_digest of the call.
+    :param representation: Names the encoding of the body when one input can
+        be served in more than one, so each gets its own tag.
+    :return: The quoted ETag.
+    """
+    return quote_etag(f"{digest}.{representation}" if representation else digest)
+
+
+def etag_matches(request, etag):
+    """
+    Check whether the request's If-None-Match names etag.
+
+    The comparison is weak, as RFC 9110 asks for If-None-Match, so a client
+    holding the W/ tag the gzip middleware put on a compressed copy still
+    matches.
+
+    :param request: The request.
+    :param etag: A quoted ETag.
+    :return: True if the client already holds this representation.
+    """
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header:
+        return False
+
+    etags = parse_etags(header)
+    if '*' in etags:
+        return True
+    return etag.removeprefix('W/') in (tag.removeprefix('W/') for tag in etags)
+
+
+def not_modified(etag):
+    """
+    Return an empty 304 response carrying etag.
+
+    The cipher endpoints answer a matching If-None-Match on POST with this
+    304 too, where RFC 9110 section 13.1.2 asks for 412 on methods other
+    than GET and HEAD. Their POST is a pure function of its body, so the
+    304 tells the client its copy of the result is still current. Proxies
+    do not cache POST responses, so they only pass it through.
+
+    :param etag: A quoted ETag.
+    :return: An HttpResponseNotModified.
+    """
+
+    response = HttpResponseNotModified()
+    response['ETag'] = etag
+    return response
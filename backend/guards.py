@@ -0,0 +1,131 @@
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.http import JsonResponse
+
+from rest_framework import status
+
+from backend.limits import MAX_TEXT_SIZE
+
+
+class RequestBodyTooLarge(Exception):
+    """The request body grew past the limit while it was being read"""
+
+
+class SizeLimitedStream:
+    """
+    Wraps a request body stream and counts the bytes read from it.
+
+    Reads are clamped to one byte past the limit, so a body without a
+    truthful Content-Length is never buffered further than that before
+    RequestBodyTooLarge is raised.
+    """
+
+    def __init__(self, stream, limit):
+        self.stream = stream
+        self.limit = limit
+        self.bytes_read = 0
+
+    def _clamp(self, size):
+        remaining = self.limit + 1 - self.bytes_read
+        if size is None or size < 0 or size > remaining:
+            return remaining
+        return size
+
+    def _count(self, data):
+        self.bytes_read += len(data)
+        if self.bytes_read > self.limit:
+            raise RequestBodyTooLarge(f"Request body exceeds {self.limit} bytes.")
+        return data
+
+    def read(self, size=-1):
+        return self._count(self.stream.read(self._clamp(size)))
+
+    def readline(self, size=-1):
+        return self._count(self.stream.readline(self._clamp(size)))
+
+    def __iter__(self):
+        return iter(self.readline, b'')
+
+    def close(self):
+        self.stream.close()
+
+
+def _too_large_response():
+    return JsonResponse(
+        {"error": "Request body exceeds the allowed limit."},
+        status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    )
+
+
+def limit_request_body(max_size):
+    """
+    Reject request bodies larger than max_size bytes with 413.
+
+    Goes outermost on a view, so a declared Content-Length over the limit is
+    refused before CSRF checks or any parser touch the body. Bodies that do
+    not declare their size truthfully are counted as they are read and cut
+    off as soon as they pass the limit. Works on sync and async views.
+
+    :param max_size: The largest accepted body, in bytes.
+    :return: A view decorator.
+    """
+    def guard(request):
+        try:
+            content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            content_length = 0
+
+        if content_length > max_size:
+            return _too_large_response()
+
+        request._stream = SizeLimitedStream(request._stream, max_size)
+        return None
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def wrapped_async_view(request, *args, **kwargs):
+                response = guard(request)
+                if response is not None:
+                    return response
+                try:
+                    return await view(request, *args, **kwargs)
+                except RequestBodyTooLarge:
+                    return _too_large_response()
+
+            return wrapped_async_view
+
+        @wraps(view)
+        def wrapped_view(request, *args, **kwargs):
+            response = guard(request)
+            if response is not None:
+                return response
+            try:
+                return view(request, *args, **kwargs)
+            except RequestBodyTooLarge:
+                return _too_large_response()
+
+        return wrapped_view
+
+    return decorator
+
+
+def exceeds_text_limit(text, limit=MAX_TEXT_SIZE):
+    """
+    Check whether the UTF-8 encoding of a text is longer than limit bytes.
+
+    Every character encodes to between one and four bytes, so the character
+    count settles the question without encoding unless the text is non-ASCII
+    and falls between those bounds.
+
+    :param text: The text to measure.
+    :param limit: The largest accepted size, in bytes.
+    :return: True if the encoded text would exceed limit.
+    """
+    length = len(text)
+    if length > limit:
+        return True
+    if text.isascii() or 4 * length <= limit:
+        return False
+    return len(text.encode('utf-8', 'surrogatepass')) > limit
@@ -0,0 +1,13 @@
+MAX_TEXT_SIZE = 10 * 1024 * 1024  # 10 MB
+MAX_NUM_COUNT = 1000  # 1000 numbers can be generated
+MAX_STREAM_NUM_COUNT = 10 ** 7  # numbers one streamed response can carry
+MAX_TOKEN_COUNT = 10 ** 6  # tokens one streamed response can carry
+MAX_PASSWORD_COUNT = 10000  # passwords generated by one request
+STREAM_CHUNK_SIZE = 64 * 1024  # characters ciphered per streamed chunk
+MAX_BATCH_SIZE = 10000  # operations accepted by one batch request
+# Request body accepted by the text endpoints: a \uXXXX escape spends at most
+# three body bytes per UTF-8 byte of text, plus room for the other fields
+MAX_REQUEST_BODY_SIZE = 3 * MAX_TEXT_SIZE + 64 * 1024
+MAX_SMALL_REQUEST_BODY_SIZE = 64 * 1024  # endpoints that take a few scalar fields
+MAX_UPLOAD_SIZE = 256 * 1024 * 1024  # 256 MB, files are ciphered from disk window by window
+MAX_UPLOAD_BODY_SIZE = MAX_UPLOAD_SIZE + 64 * 1024  # the file plus its multipart envelope
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.utils.parallel_cipher import parallel_caesar_cipher, parallel_vigenere_cipher, shutdown_pool
+
+
+class Command(BaseCommand):
+    help = "Encrypts or decrypts a UTF-8 text file with the Caesar or Vigenère cipher on all cores."
+
+    def add_arguments(self, parser):
+        parser.add_argument('input', help="Path of the text file to read.")
+        parser.add_argument('output', help="Path of the file to write the result to.")
+        cipher = parser.add_mutually_exclusive_group(required=True)
+        cipher.add_argument('--shift', type=int, help="Caesar shift.")
+        cipher.add_argument('--key', help="Vigenère key.")
+        parser.add_argument('--decrypt', action='store_true', help="Decrypt instead of encrypt.")
+        parser.add_argument('--workers', type=int, default=None, help="Number of chunks (default: CPU count).")
+
+    def handle(self, *args, **options):
+        mode = 'decrypt' if options['decrypt'] else 'encrypt'
+
+        try:
+            with open(options['input'], encoding='utf-8', newline='') as source:
+                text = source.read()
+        except (OSError, UnicodeDecodeError) as e:
+            raise CommandError(f"Cannot read {options['input']}: {e}")
+
+        try:
+            if options['key'] is not None:
+                result = parallel_vigenere_cipher(text, options['key'], mode, workers=options['workers'])
+            else:
+                result = parallel_caesar_cipher(text, options['shift'], mode, workers=options['workers'])
+        except (TypeError, ValueError) as e:
+            raise CommandError(str(e))
+        finally:
+            shutdown_pool()
+
+        with open(options['output'], 'w', encoding='utf-8', newline='') as target:
+            target.write(result)
+
+        self.stdout.write(self.style.SUCCESS(f"Wrote {len(result)} characters to {options['output']}"))
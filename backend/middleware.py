@@ -0,0 +1,161 @@
+import zlib
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.middleware.gzip import GZipMiddleware
+from django.utils.deprecation import MiddlewareMixin
+
+from rest_framework import status
+
+from backend.guards import RequestBodyTooLarge
+from backend.limits import MAX_REQUEST_BODY_SIZE, STREAM_CHUNK_SIZE
+
+
+# zlib window bits for each supported request Content-Encoding
+CONTENT_ENCODING_WBITS = {
+    'gzip': 16 + zlib.MAX_WBITS,
+    'x-gzip': 16 + zlib.MAX_WBITS,
+    'deflate': zlib.MAX_WBITS,
+}
+
+
+class ContentDecodingError(ValueError):
+    """The request body is not valid data for its Content-Encoding"""
+
+
+class DecompressingStream:
+    """
+    File-like view of a compressed request body that inflates it on read.
+
+    Compressed input is pulled STREAM_CHUNK_SIZE bytes at a time and each
+    step inflates at most that much output, so a small body that expands
+    enormously is refused with RequestBodyTooLarge after max_size bytes
+    rather than inflated into memory.
+    """
+
+    def __init__(self, stream, wbits, max_size):
+        self.stream = stream
+        self.max_size = max_size
+        self.decompressor = zlib.decompressobj(wbits)
+        self.buffer = bytearray()
+        self.bytes_inflated = 0
+        self.finished = False
+
+    def _inflate(self):
+        """Inflates one more piece into the buffer; returns False at the end of the body"""
+
+        if self.finished:
+            return False
+
+        compressed = self.decompressor.unconsumed_tail
+        if not compressed:
+            compressed = self.stream.read(STREAM_CHUNK_SIZE)
+
+        try:
+            if compressed and not self.decompressor.eof:
+                data = self.decompressor.decompress(compressed, STREAM_CHUNK_SIZE)
+            else:
+                if not self.decompressor.eof:
+                    raise ContentDecodingError("Compressed request body is truncated.")
+                data = b''
+                self.finished = True
+        except zlib.error as exc:
+            raise ContentDecodingError(f"Malformed compressed request body. {exc}")
+
+        self.bytes_inflated += len(data)
+        if self.bytes_inflated > self.max_size:
+            raise RequestBodyTooLarge(f"Decompressed request body exceeds {self.max_size} bytes.")
+
+        self.buffer += data
+        return True
+
+    def _take(self, size):
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+    def read(self, size=-1):
+        while (size is None or size < 0 or len(self.buffer) < size) and self._inflate():
+            pass
+        return self._take(len(self.buffer) if size is None or size < 0 else size)
+
+    def readline(self, size=-1):
+        while b'\n' not in self.buffer and (size is None or size < 0 or len(self.buffer) < size) and self._inflate():
+            pass
+        end = self.buffer.find(b'\n') + 1 or len(self.buffer)
+        if size is not None and size >= 0:
+            end = min(end, size)
+        return self._take(end)
+
+    def __iter__(self):
+        return iter(self.readline, b'')
+
+    def close(self):
+        self.stream.close()
+
+
+def _error_response(message, status_code):
+    return JsonResponse({"error": message}, status=status_code)
+
+
+class RequestDecompressionMiddleware(MiddlewareMixin):
+    """
+    Inflates request bodies sent with Content-Encoding gzip or deflate.
+
+    The body stream is swapped for a DecompressingStream before any view or
+    parser reads it, so the body is inflated chunk by chunk as it is parsed.
+    Content-Length still counts the compressed bytes; the inflated size is
+    capped by REQUEST_DECOMPRESSION_MAX_SIZE. Multipart bodies are refused
+    with 415, as their parser trusts Content-Length to bound the body.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.max_size = getattr(settings, 'REQUEST_DECOMPRESSION_MAX_SIZE', None) or MAX_REQUEST_BODY_SIZE
+
+    def process_request(self, request):
+        content_encoding = request.META.get('HTTP_CONTENT_ENCODING', '').strip().lower()
+        if not content_encoding or content_encoding == 'identity':
+            return None
+
+        wbits = CONTENT_ENCODING_WBITS.get(content_encoding)
+        if wbits is None:
+            return _error_response(
+                f"Unsupported Content-Encoding: {content_encoding}.", status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            )
+        if request.content_type == 'multipart/form-data':
+            return _error_response(
+                "Compressed multipart bodies are not supported.", status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            )
+
+        request._stream = DecompressingStream(request._stream, wbits, self.max_size)
+        # Content-Length no longer bounds the body the views read
+        request.content_encoding = content_encoding
+        del request.META['HTTP_CONTENT_ENCODING']
+        return None
+
+    def process_exception(self, request, exception):
+        if isinstance(exception, RequestBodyTooLarge):
+            return _error_response("Request body exceeds the allowed limit.", status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        if isinstance(exception, ContentDecodingError):
+            return _error_response(str(exception), status.HTTP_400_BAD_REQUEST)
+        return None
+
+
+class ResponseCompressionMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that leaves responses under a size threshold alone.
+
+    Responses shorter than RESPONSE_COMPRESSION_MIN_SIZE bytes are sent
+    as they are, since the gzip framing would eat most of the saving.
+    Streamed responses are compressed chunk by chunk as they are produced.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.min_size = getattr(settings, 'RESPONSE_COMPRESSION_MIN_SIZE', 1024)
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+        return super().process_response(request, response)
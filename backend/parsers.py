@@ -0,0 +1,333 @@
+import codecs
+import json
+import re
+from collections import deque
+from collections.abc import Mapping
+
+from django.conf import settings
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from backend.guards import RequestBodyTooLarge
+from backend.limits import MAX_SMALL_REQUEST_BODY_SIZE, MAX_TEXT_SIZE, STREAM_CHUNK_SIZE
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses newline delimited JSON into a lazy iterator of values.
+
+    Lines are read from the request stream only as the iterator is consumed.
+    A line that is not valid JSON yields a ParseError instance in its place
+    instead of aborting the whole stream, and blank lines are skipped. A body
+    that outgrows its size limit while being read ends the stream with one
+    last ParseError.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        return self._iter_values(stream, encoding)
+
+    @staticmethod
+    def _iter_values(stream, encoding):
+        if stream is None:
+            return
+        lines = iter(stream)
+        while True:
+            try:
+                line = next(lines, None)
+            except RequestBodyTooLarge as exc:
+                yield ParseError(str(exc))
+                return
+            if line is None:
+                return
+
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line.decode(encoding))
+            except ValueError as exc:
+                yield ParseError(f"NDJSON parse error - {exc}")
+
+
+class OctetStreamParser(BaseParser):
+    """
+    Reads a raw body into a single bytearray for the raw cipher modes.
+
+    The buffer is sized from Content-Length up front and filled chunk by
+    chunk through a memoryview, so the body is copied once and never decoded.
+    Whatever follows, as when a compressed body inflates, is appended.
+    """
+    media_type = 'application/octet-stream'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if stream is None:
+            return bytearray()
+
+        parser_context = parser_context or {}
+        request = parser_context.get('request')
+        try:
+            length = int(request.META.get('CONTENT_LENGTH') or 0) if request is not None else 0
+        except ValueError:
+            length = 0
+
+        data = bytearray(length)
+        filled = 0
+        with memoryview(data) as view:
+            while filled < length:
+                chunk = stream.read(min(STREAM_CHUNK_SIZE, length - filled))
+                if not chunk:
+                    break
+                view[filled:filled + len(chunk)] = chunk
+                filled += len(chunk)
+        del data[filled:]
+
+        # A compressed body inflates past its Content-Length
+        while chunk := stream.read(STREAM_CHUNK_SIZE):
+            data += chunk
+
+        return data
+
+
+class PlainTextParser(OctetStreamParser):
+    """Reads a text/plain body as raw bytes; see OctetStreamParser"""
+    media_type = 'text/plain'
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Complete tokens of a JSON string body. A high surrogate escape is only
+# taken once the escape after it is known, so a pair is never split
+_STRING_CONTENT = re.compile(r'''
+    (?: [^"\\\x00-\x1f]+
+      | \\["\\/bfnrt]
+      | \\u[dD][89abAB][0-9a-fA-F]{2}\\u[dD][c-fC-F][0-9a-fA-F]{2}
+      | \\u(?![dD][89abAB])[0-9a-fA-F]{4}
+      | \\u[0-9a-fA-F]{4}(?=[^\\]|\\[^u]|\\u[0-9a-fA-F]{4})
+    )*
+''', re.VERBOSE)
+
+# The longest token _STRING_CONTENT may still be waiting to complete
+_LONGEST_PARTIAL_TOKEN = 12
+
+
+class _JSONStreamReader:
+    """Decodes a JSON body chunk by chunk and reads values off the front"""
+
+    def __init__(self, stream, encoding, chunk_size=STREAM_CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder(encoding)()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """Reads one more chunk into the buffer; returns False at the end of the body"""
+
+        if self.eof:
+            return False
+
+        data = self.stream.read(self.chunk_size)
+        self.eof = not data
+        self.buffer = self.buffer[self.pos:] + self.decoder.decode(data, final=self.eof)
+        self.pos = 0
+        return not self.eof
+
+    def peek(self):
+        """Skips whitespace and returns the next character, or '' at the end"""
+
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, characters):
+        char = self.peek()
+        if not char or char not in characters:
+            raise ValueError(f"Expecting one of {characters!r} at {char!r}")
+        self.pos += 1
+        return char
+
+    def read_value(self, max_size=MAX_SMALL_REQUEST_BODY_SIZE):
+        """Reads one complete JSON value of at most max_size characters"""
+
+        self.peek()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                if len(self.buffer) - self.pos > max_size or not self.fill():
+                    raise
+                continue
+
+            # A number at the end of the buffer may go on in the next chunk
+            if end == len(self.buffer) and self.fill():
+                continue
+
+            self.pos = end
+            return value
+
+    def iter_string(self):
+        """Yields the decoded content of the string whose opening quote was just read"""
+
+        while True:
+            end = _STRING_CONTENT.match(self.buffer, self.pos).end()
+            if end > self.pos:
+                segment = self.buffer[self.pos:end]
+                yield json.loads(f'"{segment}"') if '\\' in segment else segment
+                self.pos = end
+
+            if end < len(self.buffer):
+                if self.buffer[end] == '"':
+                    self.pos += 1
+                    return
+                if len(self.buffer) - end >= _LONGEST_PARTIAL_TOKEN:
+                    raise ValueError(f"Invalid string content at {self.buffer[end:end + 2]!r}")
+
+            if not self.fill():
+                raise ValueError("Unterminated string")
+
+
+class StreamingJSONParser(JSONParser):
+    """
+    JSON parser that can stream one string field instead of loading it.
+
+    When the view puts a field name under 'stream_field' in the parser
+    context, the top-level object is read incrementally. The fields before
+    that one are parsed as usual and the field itself becomes a lazy iterator
+    of decoded text chunks, read from the body as it is consumed; see
+    StreamedObject for fields that come after it. A text longer than
+    MAX_TEXT_SIZE or a malformed body raises ParseError, from the iterator if
+    the text is being streamed. Without 'stream_field' this is the plain
+    JSONParser.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        field = parser_context.get('stream_field')
+        if field is None:
+            return super().parse(stream, media_type, parser_context)
+
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        reader = _JSONStreamReader(stream, encoding)
+        try:
+            reader.expect('{')
+            if reader.peek() == '}':
+                reader.pos += 1
+                return _finish(reader, {})
+            return _read_members(reader, {}, field)
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+def _read_members(reader, data, field=None):
+    """Reads members into data up to the closing brace, or up to the opening quote of field"""
+
+    while True:
+        name = reader.read_value()
+        if not isinstance(name, str):
+            raise ValueError("Object keys must be strings")
+        reader.expect(':')
+
+        if name == field and reader.peek() == '"':
+            reader.pos += 1
+            return StreamedObject(reader, data, field)
+
+        data[name] = reader.read_value()
+        if reader.expect(',}') == '}':
+            return _finish(reader, data)
+
+
+def _finish(reader, data):
+    if reader.peek():
+        raise ValueError("Extra data after the JSON object")
+    return data
+
+
+class StreamedObject(Mapping):
+    """
+    A JSON object whose stream field is still being read from the body.
+
+    Looking up a field that was not seen before the stream field cannot be
+    answered until the rest of the object is read, so such a lookup first
+    reads the remaining text into memory and parses the fields after it.
+    The text iterator then yields the buffered chunks before it goes on
+    reading. Sending every other field before the text therefore keeps the
+    text out of memory; any order gives the same data.
+    """
+
+    def __init__(self, reader, fields, field):
+        self._reader = reader
+        self._fields = fields
+        self._field = field
+        self._strings = reader.iter_string()
+        self._buffered = deque()
+        self._size = 0
+        self._complete = False
+        fields[field] = self._iter_text()
+
+    def __getitem__(self, name):
+        if name not in self._fields:
+            self._read_rest()
+        return self._fields[name]
+
+    def __iter__(self):
+        self._read_rest()
+        return iter(self._fields)
+
+    def __len__(self):
+        self._read_rest()
+        return len(self._fields)
+
+    def _next_chunk(self):
+        """Returns the next chunk of the text off the body, or None after its closing quote"""
+
+        chunk = next(self._strings, None)
+        if chunk is not None:
+            self._size += len(chunk) if chunk.isascii() else len(chunk.encode('utf-8', 'surrogatepass'))
+            if self._size > MAX_TEXT_SIZE:
+                raise ParseError("Text size exceeds the allowed limit.")
+        return chunk
+
+    def _read_after_text(self):
+        """Parses the members after the text, once its closing quote was read"""
+
+        if self._complete:
+            return
+        self._complete = True
+
+        reader = self._reader
+        if reader.expect(',}') == '}':
+            _finish(reader, None)
+            return
+
+        fields = _read_members(reader, {})
+        if self._field in fields:
+            raise ValueError(f"Duplicate {self._field!r} field")
+        self._fields.update(fields)
+
+    def _read_rest(self):
+        try:
+            while (chunk := self._next_chunk()) is not None:
+                self._buffered.append(chunk)
+            self._read_after_text()
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+    def _iter_text(self):
+        try:
+            while True:
+                chunk = self._buffered.popleft() if self._buffered else self._next_chunk()
+                if chunk is None:
+                    break
+                yield chunk
+            self._read_after_text()
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
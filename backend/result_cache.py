@@ -0,0 +1,188 @@
+import hashlib
+import itertools
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+
+from backend.utils.caesar_cipher import caesar_cipher
+from backend.utils.key_schedule import key_schedule_cache
+from backend.utils.shift_tables import ALPHABET_SIZE
+from backend.utils.vigenere_cipher import vigenere_cipher
+
+
+DEFAULT_RESULT_CACHE_ALIAS = 'cipher_results'
+# Texts longer than this are ciphered directly: hashing and storing them
+# costs about as much as the cipher itself
+DEFAULT_RESULT_CACHE_MAX_TEXT_SIZE = 1024 * 1024
+
+
+def input_digest(name, parameters, data):
+    """
+    Digest one cipher call by its inputs.
+
+    The cipher output is a pure function of these, so the digest serves both
+    as the result cache key and as the ETag of the result.
+
+    :param name: The cipher and representation, e.g. 'caesar' or 'caesar-raw'.
+    :param parameters: A string of the normalised cipher parameters.
+    :param data: The input text, or its bytes.
+    :return: name followed by the hex BLAKE2b-128 digest of the inputs.
+    """
+    if isinstance(data, str):
+        data = data.encode('ascii') if data.isascii() else data.encode('utf-8', 'surrogatepass')
+    elif not isinstance(data, (bytes, bytearray, memoryview)):
+        raise TypeError(f"text must be a string, not {type(data).__name__}")
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{name}\0{parameters}\0".encode('utf-8'))
+    digest.update(data)
+    return f"{name}-{digest.hexdigest()}"
+
+
+def caesar_parameters(shift, mode='encrypt'):
+    """Returns the effective Caesar shift as a string; raises like caesar_cipher on a bad shift"""
+
+    shift = int(shift)
+    return str((-shift if mode == 'decrypt' else shift) % ALPHABET_SIZE)
+
+
+def vigenere_parameters(key, mode='encrypt'):
+    """Returns the Vigenère shift schedule as a string; raises like vigenere_cipher on a bad key"""
+
+    # Every shift is below 26, so the pairs pack into one byte each
+    return bytes(itertools.chain.from_iterable(key_schedule_cache.get(key, mode).shifts)).hex()
+
+
+class ResultCache:
+    """
+    Content-addressed cache of cipher results on a Django cache alias.
+
+    Keys are input digests over the text and the normalised parameters, so
+    'decrypt 3' and 'encrypt 23' share an entry, as do Vigenère keys with the
+    same shifts.
+    Texts over max_text_size bypass the cache, as do lookups the backend
+    fails to answer. Hits, misses and bypasses are counted per process.
+    """
+
+    def __init__(self, alias=None, max_text_size=None):
+        self._alias = alias
+        self._max_text_size = max_text_size
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+
+    @property
+    def alias(self):
+        return self._alias or getattr(settings, 'CIPHER_RESULT_CACHE_ALIAS', DEFAULT_RESULT_CACHE_ALIAS)
+
+    @property
+    def max_text_size(self):
+        if self._max_text_size is not None:
+            return self._max_text_size
+        return getattr(settings, 'CIPHER_RESULT_CACHE_MAX_TEXT_SIZE', DEFAULT_RESULT_CACHE_MAX_TEXT_SIZE)
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get_or_compute(self, digest, size, compute):
+        """
+        Return a cached result, computing and storing it on a miss.
+
+        :param digest: The input_digest of the call.
+        :param size: The length of the input text.
+        :param compute: A callable returning the result.
+        :return: The result of compute, possibly from the cache.
+        """
+        if size > self.max_text_size:
+            self._count('bypasses')
+            return compute()
+
+        try:
+            result = self.cache.get(digest)
+        except Exception:
+            # An unreachable shared backend must not take the ciphers down
+            self._count('bypasses')
+            return compute()
+
+        if result is not None:
+            self._count('hits')
+            return result
+
+        self._count('misses')
+        result = compute()
+        try:
+            self.cache.set(digest, result)
+        except Exception:
+            pass
+        return result
+
+    def reset_stats(self):
+        """Sets the hit, miss and bypass counters back to zero"""
+
+        with self._lock:
+            self.hits = self.misses = self.bypasses = 0
+
+    def stats(self):
+        """
+        Report the counters of this process and the state of the backend.
+
+        :return: A dict with 'hits', 'misses', 'bypasses', 'hit_rate' and,
+            when the backend reports them, its own figures such as
+            'entries', 'bytes' and 'evictions'.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                'hits': self.hits,
+                'misses': self.misses,
+                'bypasses': self.bypasses,
+                'hit_rate': round(self.hits / lookups, 6) if lookups else 0.0,
+            }
+
+        backend_info = getattr(self.cache, 'info', None)
+        if callable(backend_info):
+            stats.update(backend_info())
+        return stats
+
+
+result_cache = ResultCache()
+
+
+def cached_caesar_cipher(text, shift, mode='encrypt', digest=None):
+    """
+    Encrypts or decrypts a text using the Caesar cipher, through the result cache.
+
+    Takes the arguments of caesar_cipher and raises the same errors.
+
+    :param digest: The input_digest of the call, if the caller already has it.
+    :return: The encrypted or decrypted text.
+    """
+    parameters = caesar_parameters(shift, mode)
+    if not isinstance(text, str):
+        return caesar_cipher(text, shift, mode)
+
+    digest = digest or input_digest('caesar', parameters, text)
+    return result_cache.get_or_compute(digest, len(text), lambda: caesar_cipher(text, int(parameters)))
+
+
+def cached_vigenere_cipher(text, key, mode='encrypt', digest=None):
+    """
+    Encrypts or decrypts a text using the Vigenère cipher, through the result cache.
+
+    Takes the arguments of vigenere_cipher and raises the same errors.
+
+    :param digest: The input_digest of the call, if the caller already has it.
+    :return: The encrypted or decrypted text.
+    """
+    if not isinstance(text, str):
+        return vigenere_cipher(text, key, mode)
+
+    digest = digest or input_digest('vigenere', vigenere_parameters(key, mode), text)
+    return result_cache.get_or_compute(digest, len(text), lambda: vigenere_cipher(text, key, mode))
@@ -0,0 +1,45 @@
+def reference_caesar_cipher(text, shift, mode='encrypt'):
+    """Returns text ciphered by the original character by character
+    Caesar loop, used to check the table driven engine against it"""
+
+    result = ""
+    shift = int(shift)
+
+    if mode == 'decrypt':
+        shift = -shift
+
+    for char in text:
+        if char.isupper():
+            result += chr((ord(char) + shift - 65) % 26 + 65)
+        elif char.islower():
+            result += chr((ord(char) + shift - 97) % 26 + 97)
+        else:
+            result += char
+
+    return result
+
+
+def reference_vigenere_cipher(text, key, mode='encrypt'):
+    """Returns text ciphered by the original character by character
+    Vigenère loop, used to check the column strided engine against it"""
+
+    result = ""
+
+    if mode == 'decrypt':
+        key_shift = -1
+    else:
+        key_shift = 1
+
+    key_repeated = (key * (len(text) // len(key) + 1))[:len(text)]
+
+    for i, char in enumerate(text):
+        if char.isupper():
+            shift = (ord(key_repeated[i].upper()) - 65) * key_shift
+            result += chr((ord(char) + shift - 65) % 26 + 65)
+        elif char.islower():
+            shift = (ord(key_repeated[i].lower()) - 97) * key_shift
+            result += chr((ord(char) + shift - 97) % 26 + 97)
+        else:
+            result += char
+
+    return result
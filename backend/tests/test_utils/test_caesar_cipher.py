@@ -1,6 +1,8 @@
 import pytest
 
-from backend.utils.caesar_cipher import caesar_cipher
+from backend.utils.caesar_cipher import caesar_cipher, caesar_cipher_bytes, caesar_cipher_chunks
+from backend.tests.config.config_make_string import make_random_string
+from backend.tests.config.config_reference_ciphers import reference_caesar_cipher
 
 
 def test_encrypt_uppercase():
@@ -68,3 +70,72 @@ def test_decrypt_with_invalid_mode():
     """Test decryption with an invalid mode."""
     with pytest.raises(TypeError):
         caesar_cipher("KHOOR", None, mode='invalid_mode')
+
+def test_encrypt_with_non_string_text():
+    """Test encryption with a text that is not a string."""
+    with pytest.raises(TypeError):
+        caesar_cipher(12345, 3)
+
+def test_encrypt_matches_reference_loop():
+    """Test that the table driven engine matches the original loop."""
+    text = make_random_string(500)
+    for shift in range(-30, 31):
+        assert caesar_cipher(text, shift) == reference_caesar_cipher(text, shift)
+
+def test_decrypt_matches_reference_loop():
+    """Test that table driven decryption matches the original loop."""
+    text = make_random_string(500)
+    for shift in range(-30, 31):
+        assert caesar_cipher(text, shift, mode='decrypt') == reference_caesar_cipher(text, shift, mode='decrypt')
+
+def test_encrypt_leaves_non_ascii_letters_unchanged():
+    """Test that non-ASCII letters are not pushed through the A-Z arithmetic."""
+    assert caesar_cipher("Éclair über Ωmega 日本 straße", 5) == "Éhqfnw ügjw Ωrjlf 日本 xywfßj"
+
+def test_decrypt_leaves_non_ascii_letters_unchanged():
+    """Test decrypting text with non-ASCII letters."""
+    assert caesar_cipher("Éhqfnw ügjw Ωrjlf 日本 xywfßj", 5, mode='decrypt') == "Éclair über Ωmega 日本 straße"
+
+def test_encrypt_non_ascii_ascii_letters_match_reference_loop():
+    """Test that ASCII letters in non-ASCII text shift like the original loop."""
+    text = make_random_string(500)
+    assert caesar_cipher(text + "é", 7) == reference_caesar_cipher(text, 7) + "é"
+
+def test_encrypt_lone_surrogate():
+    """Test that a lone surrogate passes through unchanged."""
+    assert caesar_cipher("a\ud800b", 1) == "b\ud800c"
+
+def test_cipher_chunks_match_whole_text():
+    """Test that chunked ciphering equals ciphering the joined text."""
+    text = make_random_string(500)
+    chunks = [text[start:start + 37] for start in range(0, len(text), 37)]
+    assert ''.join(caesar_cipher_chunks(chunks, 7)) == caesar_cipher(text, 7)
+
+def test_cipher_chunks_with_invalid_shift():
+    """Test that an invalid shift is rejected before any chunk is read."""
+    with pytest.raises(ValueError):
+        caesar_cipher_chunks(iter(()), 'invalid')
+
+
+def test_caesar_cipher_bytes_matches_text():
+    """Test that the bytes path agrees with the text path on UTF-8 input."""
+    text = 'Hello, Wörld! ß'
+    assert caesar_cipher_bytes(text.encode('utf-8'), 5).decode('utf-8') == caesar_cipher(text, 5)
+
+
+def test_caesar_cipher_bytes_keeps_binary():
+    """Test that bytes above 0x7f are passed through untouched."""
+    assert caesar_cipher_bytes(bytes(range(128, 256)), 7) == bytes(range(128, 256))
+
+
+def test_caesar_cipher_bytes_bytearray_in_place():
+    """Test that a bytearray is ciphered in place."""
+    data = bytearray(b'HELLO')
+    caesar_cipher_bytes(data, 3)
+    assert data == bytearray(b'KHOOR')
+
+
+def test_caesar_cipher_bytes_bytearray_across_slices():
+    """Test that in place ciphering covers every slice of a long bytearray."""
+    text = 'Hello, World! ' * 10000
+    assert caesar_cipher_bytes(bytearray(text, 'ascii'), 5).decode('ascii') == caesar_cipher(text, 5)
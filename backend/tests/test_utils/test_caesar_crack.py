@@ -0,0 +1,49 @@
+import pytest
+
+from backend.utils.caesar_cipher import caesar_cipher
+from backend.utils.caesar_crack import crack_caesar, score_histogram
+from backend.utils.letter_frequency import letter_histogram, rotate_histogram
+
+
+PLAINTEXT = (
+    "It was the best of times, it was the worst of times, it was the age of "
+    "wisdom, it was the age of foolishness, it was the epoch of belief."
+)
+
+
+def test_letter_histogram_folds_case():
+    """Test that upper and lower case letters are counted together."""
+    assert letter_histogram("AaB!é")[:3] == [2, 1, 0]
+
+def test_rotate_histogram_matches_decryption():
+    """Test that rotating the ciphertext histogram gives the plaintext histogram."""
+    ciphertext = caesar_cipher(PLAINTEXT, 7)
+    assert rotate_histogram(letter_histogram(ciphertext), 7) == letter_histogram(PLAINTEXT)
+
+def test_score_histogram_empty():
+    """Test that a text without letters scores zero."""
+    assert score_histogram([0] * 26) == (0.0, 0.0)
+
+def test_crack_caesar_finds_shift():
+    """Test that the best candidate is the shift used to encrypt."""
+    for shift in (1, 7, 13, 25):
+        assert crack_caesar(caesar_cipher(PLAINTEXT, shift))[0]['shift'] == shift
+
+def test_crack_caesar_preview():
+    """Test that the best candidate previews the plaintext."""
+    best = crack_caesar(caesar_cipher(PLAINTEXT, 11), preview_length=20)[0]
+    assert best['preview'] == PLAINTEXT[:20]
+
+def test_crack_caesar_returns_all_shifts():
+    """Test that every shift is ranked by default."""
+    candidates = crack_caesar(caesar_cipher(PLAINTEXT, 3))
+    assert sorted(candidate['shift'] for candidate in candidates) == list(range(26))
+
+def test_crack_caesar_top():
+    """Test limiting the number of candidates."""
+    assert len(crack_caesar(caesar_cipher(PLAINTEXT, 3), top=3)) == 3
+
+def test_crack_caesar_non_string():
+    """Test cracking a text that is not a string."""
+    with pytest.raises(TypeError):
+        crack_caesar(12345)
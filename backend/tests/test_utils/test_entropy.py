@@ -0,0 +1,221 @@
+import os
+import random
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from backend.utils.entropy import SECRET_KEY_CHARS, SECRET_KEY_LENGTH, EntropyBuffer, SecretKeyQueue
+
+
+class CountingSource:
+    """Seeded stand-in for os.urandom that counts its calls"""
+
+    def __init__(self, seed=0, prefix=b''):
+        self.random = random.Random(seed)
+        self.prefix = prefix
+        self.calls = 0
+        self.threads = []
+
+    def __call__(self, size):
+        self.calls += 1
+        self.threads.append(threading.get_ident())
+        if self.calls == 1 and self.prefix:
+            return (self.prefix * size)[:size]
+        return self.random.randbytes(size)
+
+
+def chi_square(counts, outcomes, trials):
+    expected = trials / outcomes
+    return sum((counts[outcome] - expected) ** 2 / expected for outcome in range(outcomes))
+
+
+def test_token_bytes_length():
+    """Test that token_bytes returns as many bytes as asked."""
+    assert len(EntropyBuffer().token_bytes(33)) == 33
+
+
+def test_token_bytes_reuses_block():
+    """Test that small reads are served from one block."""
+    source = CountingSource()
+    buffer = EntropyBuffer(block_size=1024, source=source)
+    for _ in range(100):
+        buffer.token_bytes(8)
+    assert source.calls == 1
+
+
+def test_randbelow_invalid_bound():
+    """Test that a bound below 1 raises like secrets.randbelow."""
+    with pytest.raises(ValueError):
+        EntropyBuffer().randbelow(0)
+
+
+def test_randbelow_large_bound():
+    """Test that bounds past 64 bits are served too."""
+    assert 0 <= EntropyBuffer().randbelow(1 << 100) < 1 << 100
+
+
+def test_randbelow_many_few_syscalls():
+    """Test that fifty thousand numbers cost a handful of reads from the OS."""
+    source = CountingSource()
+    EntropyBuffer(source=source).randbelow_many(1000, 50000)
+    assert source.calls <= 3
+
+
+def test_randbelow_many_range():
+    """Test that the numbers are within the range."""
+    numbers = EntropyBuffer().randbelow_many(1000, 10000)
+    assert len(numbers) == 10000 and all(0 <= number < 1000 for number in numbers)
+
+
+def test_randbelow_many_tops_up_rejected_words():
+    """Test that rejected words are replaced until count numbers are accepted."""
+    # 0xFF is past the largest multiple of 3 a byte holds, so every word of the first block is rejected
+    buffer = EntropyBuffer(block_size=64, source=CountingSource(prefix=b'\xff'))
+    assert len(buffer.randbelow_many(3, 10)) == 10
+
+
+def test_randbelow_many_uniform():
+    """Test that the numbers are uniform over a range that forces rejections."""
+    numbers = EntropyBuffer(source=CountingSource()).randbelow_many(6, 60000)
+    assert chi_square(Counter(numbers), 6, 60000) < 20.515  # p = 0.001, 5 degrees of freedom
+
+
+def test_randbelow_many_beyond_64_bits():
+    """Test that bounds past 64 bits fall back to one number at a time."""
+    numbers = EntropyBuffer().randbelow_many(1 << 80, 5)
+    assert len(numbers) == 5 and all(0 <= number < 1 << 80 for number in numbers)
+
+
+def test_prefetched_randbelow_one_read():
+    """Test that a prefetched randbelow serves its draws from one read."""
+    source = CountingSource()
+    randbelow = EntropyBuffer(block_size=1024, source=source).prefetched_randbelow(100000)
+    for bound in range(1, 1001):
+        randbelow(bound)
+    assert source.calls == 1
+
+
+def test_prefetched_randbelow_uniform():
+    """Test that a prefetched randbelow is uniform."""
+    randbelow = EntropyBuffer(source=CountingSource()).prefetched_randbelow(60000)
+    counts = Counter(randbelow(6) for _ in range(60000))
+    assert chi_square(counts, 6, 60000) < 20.515
+
+
+def test_prefetched_randbelow_falls_back_when_exhausted():
+    """Test that calls past the prefetched words still return numbers."""
+    randbelow = EntropyBuffer().prefetched_randbelow(1)
+    assert all(0 <= randbelow(10) < 10 for _ in range(5))
+
+
+def test_buffer_emptied_in_forked_child():
+    """Test that a forked child does not reuse the parent's buffered entropy."""
+    buffer = EntropyBuffer()
+    parent_next = buffer.token_bytes(16)
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        os.write(write_end, buffer.token_bytes(16))
+        os._exit(0)
+
+    os.close(write_end)
+    child_next = os.read(read_end, 16)
+    os.close(read_end)
+    os.waitpid(pid, 0)
+    assert child_next != buffer.token_bytes(16) and child_next != parent_next
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_token_bytes_wipes_handed_out_bytes():
+    """Test that bytes are zeroed in the buffer once handed out."""
+    buffer = EntropyBuffer(block_size=64, source=CountingSource())
+    buffer.token_bytes(16)
+    assert bytes(buffer._block[:16]) == bytes(16)
+
+
+def test_background_refill_prepares_next_block():
+    """Test that the background thread reads the next block ahead of use."""
+    source = CountingSource()
+    buffer = EntropyBuffer(block_size=64, source=source, background=True)
+    buffer.token_bytes(8)
+    assert wait_for(lambda: source.calls == 2)
+
+
+def test_background_refill_serves_from_spare():
+    """Test that running out of a block takes the spare instead of waiting on the OS."""
+    source = CountingSource()
+    buffer = EntropyBuffer(block_size=64, source=source, background=True)
+    buffer.token_bytes(40)
+    wait_for(lambda: buffer._spare is not None)
+    buffer.token_bytes(40)
+    assert source.threads.count(threading.get_ident()) == 1
+
+
+def test_secret_key_format():
+    """Test that keys look like Django's get_random_secret_key."""
+    key = SecretKeyQueue(EntropyBuffer()).get()
+    assert len(key) == SECRET_KEY_LENGTH and set(key) <= set(SECRET_KEY_CHARS)
+
+
+def test_secret_keys_distinct():
+    """Test that no key is handed out twice."""
+    queue = SecretKeyQueue(EntropyBuffer(), size=16)
+    queue._fill()
+    assert len({queue.get() for _ in range(100)}) == 100
+
+
+def test_secret_key_queue_bounded():
+    """Test that filling stops at the queue size."""
+    queue = SecretKeyQueue(EntropyBuffer(), size=16)
+    queue._fill()
+    queue._fill()
+    assert len(queue) == 16
+
+
+def test_secret_key_queue_background_refill():
+    """Test that taking keys makes the background thread top the queue up."""
+    queue = SecretKeyQueue(EntropyBuffer(), size=16, background=True)
+    queue.get()
+    assert wait_for(lambda: len(queue) == 16)
+
+
+def test_secret_key_queue_resize_drops_keys():
+    """Test that shrinking the queue drops the extra keys."""
+    queue = SecretKeyQueue(EntropyBuffer(), size=16)
+    queue._fill()
+    queue.resize(4)
+    assert len(queue) == 4
+
+
+def test_secret_key_chars_uniform():
+    """Test that every character is equally likely."""
+    keys = SecretKeyQueue(EntropyBuffer(source=CountingSource())).make_keys(1000)
+    counts = Counter(SECRET_KEY_CHARS.index(char) for key in keys for char in key)
+    assert chi_square(counts, len(SECRET_KEY_CHARS), 50000) < 85.351  # p = 0.001, 49 degrees of freedom
+
+
+def test_secret_key_queue_emptied_in_forked_child():
+    """Test that a forked child does not hand out the parent's queued keys."""
+    queue = SecretKeyQueue(EntropyBuffer(), size=16)
+    queue._fill()
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        os.write(write_end, str(len(queue)).encode())
+        os._exit(0)
+
+    os.close(write_end)
+    child_length = os.read(read_end, 16)
+    os.close(read_end)
+    os.waitpid(pid, 0)
+    assert child_length == b'0'
@@ -0,0 +1,86 @@
+import io
+import mmap
+import tempfile
+
+import pytest
+
+from backend.utils.caesar_cipher import caesar_cipher
+from backend.utils.file_cipher import caesar_cipher_file, iter_file_windows, vigenere_cipher_file
+from backend.utils.vigenere_cipher import vigenere_cipher
+
+
+WINDOW = mmap.PAGESIZE
+
+
+@pytest.fixture
+def disk_file():
+    """Returns a factory for temporary files on disk holding the given bytes"""
+
+    files = []
+
+    def make(data):
+        file = tempfile.TemporaryFile()
+        file.write(data)
+        file.flush()
+        files.append(file)
+        return file
+
+    yield make
+    for file in files:
+        file.close()
+
+
+def test_iter_file_windows_disk_round_trip(disk_file):
+    """Test that mapped windows join back into the file contents."""
+    data = bytes(range(256)) * 100
+    assert b''.join(iter_file_windows(disk_file(data), WINDOW)) == data
+
+
+def test_iter_file_windows_disk_window_size(disk_file):
+    """Test that no mapped window is longer than the window size."""
+    windows = list(iter_file_windows(disk_file(b'x' * (3 * WINDOW + 1)), WINDOW))
+    assert [len(window) for window in windows] == [WINDOW, WINDOW, WINDOW, 1]
+
+
+def test_iter_file_windows_empty_file(disk_file):
+    """Test that an empty file yields no windows."""
+    assert list(iter_file_windows(disk_file(b''), WINDOW)) == []
+
+
+def test_iter_file_windows_in_memory():
+    """Test that files without a descriptor are read in windows too."""
+    data = b'x' * (2 * WINDOW + 5)
+    assert b''.join(iter_file_windows(io.BytesIO(data), WINDOW)) == data
+
+
+def test_caesar_cipher_file_matches_text(disk_file):
+    """Test that ciphering a file window by window matches the text cipher."""
+    text = 'Hello, Wörld! ' * 2000
+    result = b''.join(caesar_cipher_file(disk_file(text.encode('utf-8')), 7, window_size=WINDOW))
+    assert result.decode('utf-8') == caesar_cipher(text, 7)
+
+
+def test_vigenere_cipher_file_matches_text(disk_file):
+    """Test that characters split across windows advance the key once."""
+    text = 'Attack at dawn, wörld ß \U0001f600! ' * 2000
+    result = b''.join(vigenere_cipher_file(disk_file(text.encode('utf-8')), 'LEMON', window_size=WINDOW))
+    assert result.decode('utf-8') == vigenere_cipher(text, 'LEMON')
+
+
+def test_vigenere_cipher_file_invalid_utf8_round_trip(disk_file):
+    """Test that bytes which are not valid UTF-8 survive a round trip."""
+    data = b'ab\xffcd\xc3' * 1000
+    encrypted = b''.join(vigenere_cipher_file(disk_file(data), 'KEY', window_size=WINDOW))
+    assert b''.join(vigenere_cipher_file(disk_file(encrypted), 'KEY', 'decrypt', window_size=WINDOW)) == data
+
+
+def test_caesar_cipher_file_invalid_shift():
+    """Test that an invalid shift raises before the file is read."""
+    with pytest.raises(ValueError):
+        caesar_cipher_file(io.BytesIO(b'abc'), 'invalid')
+
+
+def test_vigenere_cipher_file_empty_key():
+    """Test that an empty key raises before the file is read."""
+    with pytest.raises(ValueError):
+        vigenere_cipher_file(io.BytesIO(b'abc'), '')
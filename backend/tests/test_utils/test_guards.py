@@ -0,0 +1,67 @@
+import io
+
+import pytest
+
+from backend.guards import RequestBodyTooLarge, SizeLimitedStream, exceeds_text_limit
+from backend.parsers import NDJSONParser
+
+
+def test_exceeds_text_limit_ascii_within():
+    """Test that ASCII text at the limit is accepted."""
+    assert exceeds_text_limit('a' * 10, limit=10) is False
+
+
+def test_exceeds_text_limit_ascii_over():
+    """Test that ASCII text past the limit is rejected."""
+    assert exceeds_text_limit('a' * 11, limit=10) is True
+
+
+def test_exceeds_text_limit_counts_utf8_bytes():
+    """Test that non-ASCII characters count with their UTF-8 length."""
+    assert exceeds_text_limit('é' * 6, limit=11) is True
+
+
+def test_exceeds_text_limit_non_ascii_within():
+    """Test that non-ASCII text whose UTF-8 form fits is accepted."""
+    assert exceeds_text_limit('é' * 6, limit=12) is False
+
+
+def test_exceeds_text_limit_lone_surrogate():
+    """Test that a lone surrogate is measured instead of raising."""
+    assert exceeds_text_limit('\ud800' * 2, limit=6) is False
+
+
+def test_size_limited_stream_reads_within_limit():
+    """Test that a body within the limit is read unchanged."""
+    stream = SizeLimitedStream(io.BytesIO(b'x' * 10), 10)
+    assert stream.read() == b'x' * 10
+
+
+def test_size_limited_stream_raises_past_limit():
+    """Test that reading past the limit raises RequestBodyTooLarge."""
+    stream = SizeLimitedStream(io.BytesIO(b'x' * 11), 10)
+    with pytest.raises(RequestBodyTooLarge):
+        stream.read()
+
+
+def test_size_limited_stream_clamps_reads():
+    """Test that no read pulls more than one byte past the limit."""
+    source = io.BytesIO(b'x' * 100)
+    stream = SizeLimitedStream(source, 10)
+    with pytest.raises(RequestBodyTooLarge):
+        stream.read(100)
+    assert source.tell() == 11
+
+
+def test_size_limited_stream_readline_raises_past_limit():
+    """Test that readline also counts towards the limit."""
+    stream = SizeLimitedStream(io.BytesIO(b'{}\n' * 10), 10)
+    with pytest.raises(RequestBodyTooLarge):
+        list(iter(stream.readline, b''))
+
+
+def test_ndjson_parser_stops_at_size_limit():
+    """Test that an NDJSON body cut off by the limit ends with one error."""
+    stream = SizeLimitedStream(io.BytesIO(b'{}\n' * 10), 10)
+    values = list(NDJSONParser().parse(stream))
+    assert [type(value).__name__ for value in values] == ['dict', 'dict', 'dict', 'ParseError']
@@ -0,0 +1,75 @@
+import pytest
+
+from backend.utils.key_schedule import MAX_CACHED_KEY_LENGTH, KeyScheduleCache, build_key_schedule
+
+
+def test_build_key_schedule_shifts():
+    """Test the shift pairs of a letter key."""
+    assert build_key_schedule("KEY").shifts == ((10, 10), (4, 4), (24, 24))
+
+def test_build_key_schedule_decrypt_shifts():
+    """Test that decryption uses the additive inverse shifts."""
+    assert build_key_schedule("KEY", mode='decrypt').shifts == ((16, 16), (22, 22), (2, 2))
+
+def test_build_key_schedule_uniform():
+    """Test that a key of one repeated letter is marked uniform."""
+    assert build_key_schedule("kKk").uniform is True
+
+def test_build_key_schedule_empty_key():
+    """Test that an empty key is rejected."""
+    with pytest.raises(ValueError):
+        build_key_schedule("")
+
+def test_cache_returns_same_schedule():
+    """Test that a repeated key is served from the cache."""
+    cache = KeyScheduleCache(maxsize=4)
+    assert cache.get("KEY") is cache.get("KEY")
+
+def test_cache_counts_hits_and_misses():
+    """Test the hit and miss counters."""
+    cache = KeyScheduleCache(maxsize=4)
+    cache.get("KEY")
+    cache.get("KEY")
+    cache.get("KEY", mode='decrypt')
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+def test_cache_shares_entry_for_non_decrypt_modes():
+    """Test that any mode other than decrypt shares the encrypt entry."""
+    cache = KeyScheduleCache(maxsize=4)
+    assert cache.get("KEY", mode='invalid_mode') is cache.get("KEY")
+
+def test_cache_evicts_least_recently_used():
+    """Test that the least recently used key is evicted first."""
+    cache = KeyScheduleCache(maxsize=2)
+    first = cache.get("ONE")
+    cache.get("TWO")
+    cache.get("ONE")
+    cache.get("THREE")
+    assert cache.get("ONE") is first and cache.info().currsize == 2
+
+def test_cache_resize_evicts():
+    """Test that shrinking the cache evicts entries."""
+    cache = KeyScheduleCache(maxsize=4)
+    for key in ("ONE", "TWO", "THREE"):
+        cache.get(key)
+    cache.resize(1)
+    assert cache.info().currsize == 1
+
+def test_cache_does_not_store_invalid_keys():
+    """Test that a key that fails to build is not cached."""
+    cache = KeyScheduleCache(maxsize=4)
+    with pytest.raises(TypeError):
+        cache.get(None)
+    assert cache.info().currsize == 0
+
+def test_cache_does_not_store_long_keys():
+    """Test that a key over the length limit is built but not kept."""
+    cache = KeyScheduleCache(maxsize=4)
+    cache.get("K" * (MAX_CACHED_KEY_LENGTH + 1))
+    assert cache.info().currsize == 0
+
+def test_cache_stores_key_at_length_limit():
+    """Test that a key of exactly the length limit is cached."""
+    cache = KeyScheduleCache(maxsize=4)
+    assert cache.get("K" * MAX_CACHED_KEY_LENGTH) is cache.get("K" * MAX_CACHED_KEY_LENGTH)
@@ -0,0 +1,62 @@
+import pytest
+
+from backend.utils import parallel_cipher
+from backend.utils.caesar_cipher import caesar_cipher
+from backend.utils.parallel_cipher import chunk_bounds, parallel_caesar_cipher, parallel_vigenere_cipher
+from backend.utils.vigenere_cipher import vigenere_cipher
+from backend.tests.config.config_make_string import random_string_no_special_char
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Sends even small texts through the process pool"""
+    monkeypatch.setattr(parallel_cipher, 'PARALLEL_THRESHOLD', 1)
+    monkeypatch.setattr(parallel_cipher, 'MIN_CHUNK_SIZE', 1)
+    yield
+    parallel_cipher.shutdown_pool()
+
+
+def test_chunk_bounds_cover_range():
+    """Test that chunk bounds cover the whole range without gaps."""
+    bounds = chunk_bounds(10 * 1024 * 1024 + 5, 4)
+    assert bounds[0][0] == 0 and bounds[-1][1] == 10 * 1024 * 1024 + 5
+    assert all(stop == start for (_, stop), (start, _) in zip(bounds, bounds[1:]))
+
+def test_chunk_bounds_aligned_to_key_period():
+    """Test that every chunk starts on a multiple of the key period."""
+    bounds = chunk_bounds(10 * 1024 * 1024, 3, alignment=7)
+    assert all(start % 7 == 0 for start, _ in bounds)
+
+def test_parallel_caesar_matches_inline(small_chunks):
+    """Test that pooled Caesar output matches the inline engine."""
+    text = random_string_no_special_char(4000)
+    assert parallel_caesar_cipher(text, 5, workers=3) == caesar_cipher(text, 5)
+
+def test_parallel_caesar_decrypt_matches_inline(small_chunks):
+    """Test that pooled Caesar decryption matches the inline engine."""
+    text = random_string_no_special_char(4000)
+    assert parallel_caesar_cipher(text, 5, mode='decrypt', workers=3) == caesar_cipher(text, 5, mode='decrypt')
+
+def test_parallel_vigenere_matches_inline(small_chunks):
+    """Test that pooled Vigenère output keeps the key phase across chunks."""
+    text = random_string_no_special_char(4000)
+    assert parallel_vigenere_cipher(text, "LEMONADE", workers=3) == vigenere_cipher(text, "LEMONADE")
+
+def test_parallel_vigenere_non_ascii_falls_back_inline(small_chunks):
+    """Test that non-ASCII text is ciphered inline."""
+    text = "Éclair über straße " * 50
+    assert parallel_vigenere_cipher(text, "KEY", workers=3) == vigenere_cipher(text, "KEY")
+
+def test_parallel_vigenere_empty_key():
+    """Test that an invalid key is rejected before any work is shipped out."""
+    with pytest.raises(ValueError):
+        parallel_vigenere_cipher("HELLO", "")
+
+def test_parallel_caesar_invalid_shift():
+    """Test that an invalid shift is rejected before any work is shipped out."""
+    with pytest.raises(ValueError):
+        parallel_caesar_cipher("HELLO", "invalid")
+
+def test_pool_workers_are_not_forked_from_caller(small_chunks):
+    """Test that workers do not inherit the caller's locks through a plain fork."""
+    assert parallel_cipher.get_pool()._mp_context.get_start_method() != 'fork'
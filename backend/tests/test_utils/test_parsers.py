@@ -0,0 +1,124 @@
+import io
+import json
+
+import pytest
+
+from rest_framework.exceptions import ParseError
+
+from backend.parsers import StreamingJSONParser
+
+
+def parse_streamed(body, chunk_size=None):
+    """Parses body with the text field streamed, optionally in tiny reads"""
+
+    stream = io.BytesIO(body.encode('utf-8') if isinstance(body, str) else body)
+    if chunk_size:
+        read = stream.read
+        stream.read = lambda size=-1: read(min(size, chunk_size))
+    return StreamingJSONParser().parse(stream, parser_context={'stream_field': 'text'})
+
+
+def test_streaming_json_parser_small_fields():
+    """Test that the fields before the text are parsed up front."""
+    data = parse_streamed('{"shift": 3, "mode": "decrypt", "text": "abc"}')
+    assert (data['shift'], data['mode']) == (3, 'decrypt')
+
+
+def test_streaming_json_parser_text_chunks():
+    """Test that the streamed text joins back into the original string."""
+    data = parse_streamed('{"shift": 3, "text": "Hello, World"}')
+    assert ''.join(data['text']) == 'Hello, World'
+
+
+@pytest.mark.parametrize('text', [
+    'plain ascii',
+    'quotes " and \\ backslashes\n\t',
+    'wörld ß Ω',
+    'emoji \U0001f600 pair',
+    '\x01 control',
+])
+def test_streaming_json_parser_escapes_across_reads(text):
+    """Test that escapes split across one byte reads decode correctly."""
+    body = json.dumps({'key': 'KEY', 'text': text})
+    assert ''.join(parse_streamed(body, chunk_size=1)['text']) == text
+
+
+def test_streaming_json_parser_utf8_across_reads():
+    """Test that raw UTF-8 split across reads decodes correctly."""
+    body = json.dumps({'text': 'wörld \U0001f600'}, ensure_ascii=False)
+    assert ''.join(parse_streamed(body, chunk_size=1)['text']) == 'wörld \U0001f600'
+
+
+def test_streaming_json_parser_number_across_reads():
+    """Test that a number split across reads is read whole."""
+    assert parse_streamed('{"shift": 12345, "text": ""}', chunk_size=2)['shift'] == 12345
+
+
+def test_streaming_json_parser_without_text():
+    """Test that an object without the text field is returned as it is."""
+    assert parse_streamed('{"shift": 3}') == {'shift': 3}
+
+
+def test_streaming_json_parser_invalid_head():
+    """Test that a malformed body before the text raises ParseError."""
+    with pytest.raises(ParseError):
+        parse_streamed('{"shift": }')
+
+
+def test_streaming_json_parser_field_after_text():
+    """Test that a field after the streamed text is read on lookup."""
+    data = parse_streamed('{"text": "abc", "shift": 3}')
+    assert data['shift'] == 3
+
+
+def test_streaming_json_parser_text_after_lookup():
+    """Test that the text buffered to reach a later field is still yielded whole."""
+    data = parse_streamed('{"text": "Hello, World", "mode": "decrypt"}', chunk_size=4)
+    data.get('mode')
+    assert ''.join(data['text']) == 'Hello, World'
+
+
+def test_streaming_json_parser_missing_field_after_text():
+    """Test that a field missing from the whole object falls back to the default."""
+    data = parse_streamed('{"text": "abc", "shift": 3}')
+    assert data.get('mode', 'encrypt') == 'encrypt'
+
+
+def test_streaming_json_parser_fields_on_both_sides():
+    """Test that fields before and after the text are all returned."""
+    data = parse_streamed('{"key": "KEY", "text": "abc", "mode": "decrypt"}')
+    assert (data['key'], data['mode']) == ('KEY', 'decrypt')
+
+
+def test_streaming_json_parser_field_after_text_does_not_buffer_earlier_lookups():
+    """Test that looking up a field sent before the text leaves the text unread."""
+    data = parse_streamed('{"shift": 3, "text": "abc", "mode": "decrypt"}')
+    data.get('shift')
+    assert not data._buffered and not data._complete
+
+
+def test_streaming_json_parser_invalid_field_after_text():
+    """Test that a malformed member after the text raises ParseError on lookup."""
+    data = parse_streamed('{"text": "abc", "shift": }')
+    with pytest.raises(ParseError):
+        data.get('shift')
+
+
+def test_streaming_json_parser_duplicate_text():
+    """Test that a second text field raises ParseError."""
+    data = parse_streamed('{"text": "abc", "text": "def"}')
+    with pytest.raises(ParseError):
+        list(data['text'])
+
+
+def test_streaming_json_parser_unterminated_text():
+    """Test that a truncated text raises ParseError."""
+    data = parse_streamed('{"text": "abc')
+    with pytest.raises(ParseError):
+        list(data['text'])
+
+
+def test_streaming_json_parser_without_stream_field():
+    """Test that the parser is plain JSON without a stream field."""
+    stream = io.BytesIO(b'{"text": "abc"}')
+    assert StreamingJSONParser().parse(stream, parser_context={}) == {'text': 'abc'}
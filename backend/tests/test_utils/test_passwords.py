@@ -0,0 +1,108 @@
+import random
+from collections import Counter
+
+import pytest
+
+from backend.utils.entropy import EntropyBuffer
+from backend.utils.passwords import (
+    AMBIGUOUS_CHARS,
+    DIGIT_CHARS,
+    LOWER_CHARS,
+    SPECIAL_CHARS,
+    UPPER_CHARS,
+    _shuffle,
+    generate_passwords,
+)
+
+
+def seeded_buffer(seed=0):
+    return EntropyBuffer(source=random.Random(seed).randbytes)
+
+
+def count_in(password, chars):
+    return sum(char in chars for char in password)
+
+
+def test_generate_passwords_count_and_length():
+    """Test that count passwords of the given length are returned."""
+    passwords = generate_passwords(count=100, length=20)
+    assert len(passwords) == 100 and {len(password) for password in passwords} == {20}
+
+
+def test_generate_passwords_meet_minimums():
+    """Test that every password meets the minimum count of each class."""
+    passwords = generate_passwords(count=1000, length=12, min_upper=3, min_lower=3, min_digits=3, min_special=3)
+    assert all(
+        count_in(password, UPPER_CHARS) >= 3 and count_in(password, LOWER_CHARS) >= 3
+        and count_in(password, DIGIT_CHARS) >= 3 and count_in(password, SPECIAL_CHARS) >= 3
+        for password in passwords
+    )
+
+
+def test_generate_passwords_exclude_ambiguous():
+    """Test that ambiguous characters never appear when excluded."""
+    passwords = generate_passwords(count=1000, length=32, exclude_ambiguous=True)
+    assert not set(''.join(passwords)) & set(AMBIGUOUS_CHARS)
+
+
+def test_generate_passwords_exclude():
+    """Test that excluded characters never appear."""
+    passwords = generate_passwords(count=1000, length=32, exclude='abcXYZ')
+    assert not set(''.join(passwords)) & set('abcXYZ')
+
+
+def test_generate_passwords_zero_minimum_class_still_fills():
+    """Test that a class without a minimum can still appear in the fill."""
+    passwords = generate_passwords(count=200, length=32, min_special=0)
+    assert any(count_in(password, SPECIAL_CHARS) for password in passwords)
+
+
+def test_generate_passwords_minimums_exceed_length():
+    """Test that minimums adding up past the length raise ValueError."""
+    with pytest.raises(ValueError):
+        generate_passwords(length=3, min_upper=1, min_lower=1, min_digits=1, min_special=1)
+
+
+def test_generate_passwords_required_class_excluded():
+    """Test that requiring a class whose characters are all excluded raises ValueError."""
+    with pytest.raises(ValueError):
+        generate_passwords(min_digits=1, exclude=DIGIT_CHARS)
+
+
+def test_generate_passwords_negative_minimum():
+    """Test that a negative minimum raises ValueError."""
+    with pytest.raises(ValueError):
+        generate_passwords(min_upper=-1)
+
+
+def test_generate_passwords_length_too_long():
+    """Test that a length past the limit raises ValueError."""
+    with pytest.raises(ValueError):
+        generate_passwords(length=1000)
+
+
+def test_generate_passwords_long_length():
+    """Test lengths whose shuffle needs a draw past 64 bits."""
+    passwords = generate_passwords(count=10, length=100)
+    assert {len(password) for password in passwords} == {100}
+
+
+def test_generate_passwords_few_entropy_reads():
+    """Test that a batch of ten thousand passwords costs a handful of OS reads."""
+    calls = []
+    buffer = EntropyBuffer(source=lambda size: calls.append(size) or random.Random(len(calls)).randbytes(size))
+    generate_passwords(count=10000, length=16, entropy_buffer=buffer)
+    assert len(calls) <= 8
+
+
+def test_shuffle_uniform():
+    """Test that every ordering of four characters is equally likely."""
+    buffer = seeded_buffer()
+    counts = Counter()
+    for draw in buffer.randbelow_many(24, 24000):
+        chars = list('abcd')
+        _shuffle(chars, draw)
+        counts[''.join(chars)] += 1
+    chi_square = sum((counts[key] - 1000) ** 2 / 1000 for key in counts) + 1000 * (24 - len(counts))
+    assert chi_square < 49.728  # p = 0.001, 23 degrees of freedom
+
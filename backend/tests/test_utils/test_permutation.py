@@ -0,0 +1,90 @@
+from collections import Counter
+
+import pytest
+
+from backend.utils.permutation import FeistelPermutation
+
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 64, 100, 257, 1000])
+def test_permutation_is_bijection(size):
+    """Test that every value of the range appears exactly once."""
+    assert sorted(FeistelPermutation(size)) == list(range(size))
+
+
+def test_permutation_same_key_same_order():
+    """Test that a key always gives the same permutation."""
+    assert FeistelPermutation(1000, key=b'seed')[:] == FeistelPermutation(1000, key=b'seed')[:]
+
+
+def test_permutation_keys_differ():
+    """Test that different keys give different permutations."""
+    assert FeistelPermutation(1000, key=b'one')[:] != FeistelPermutation(1000, key=b'two')[:]
+
+
+def test_permutation_random_access_matches_iteration():
+    """Test that indexing agrees with iterating."""
+    permutation = FeistelPermutation(500, key=b'seed')
+    assert [permutation[index] for index in range(500)] == list(permutation)
+
+
+def test_permutation_slice():
+    """Test that a slice returns the values at those positions."""
+    permutation = FeistelPermutation(500, key=b'seed')
+    assert permutation[10:20:3] == [permutation[index] for index in (10, 13, 16, 19)]
+
+
+def test_permutation_negative_index():
+    """Test that negative indexes count from the end."""
+    permutation = FeistelPermutation(500, key=b'seed')
+    assert permutation[-1] == permutation[499]
+
+
+def test_permutation_index_out_of_range():
+    """Test that an index past the end raises IndexError."""
+    with pytest.raises(IndexError):
+        FeistelPermutation(10)[10]
+
+
+def test_permutation_huge_range():
+    """Test that values of a huge range stay within it."""
+    permutation = FeistelPermutation(10 ** 30)
+    assert all(0 <= permutation[index] < 10 ** 30 for index in range(100))
+
+
+def test_permutation_invalid_size():
+    """Test that an empty range is rejected."""
+    with pytest.raises(ValueError):
+        FeistelPermutation(0)
+
+
+def test_permutation_first_value_uniform():
+    """Test that the value at position 0 is uniform across keys."""
+    counts = Counter(FeistelPermutation(10, key=str(seed).encode())[0] for seed in range(10000))
+    chi_square = sum((counts[value] - 1000) ** 2 / 1000 for value in range(10))
+    assert chi_square < 27.877  # p = 0.001, 9 degrees of freedom
+
+
+def test_permutation_iter_chunks():
+    """Test that chunks cover the positions in order."""
+    permutation = FeistelPermutation(100, key=b'seed')
+    chunks = list(permutation.iter_chunks(10, 45, chunk_size=10))
+    assert chunks == [permutation[10:20], permutation[20:30], permutation[30:40], permutation[40:45]]
+
+
+def test_permutation_shards_cover_range():
+    """Test that the shards of all workers together produce the permutation once."""
+    permutation = FeistelPermutation(1000, key=b'seed')
+    values = [permutation[index] for worker in range(7) for index in permutation.shard(worker, 7)]
+    assert values == permutation[:]
+
+
+def test_permutation_invalid_shard():
+    """Test that a worker number past the worker count raises ValueError."""
+    with pytest.raises(ValueError):
+        FeistelPermutation(10).shard(3, 3)
+
+
+def test_permutation_range_of_2_64():
+    """Test that a 2 ** 64 range supports random access at both ends."""
+    permutation = FeistelPermutation(2 ** 64, key=b'seed')
+    assert len({permutation[0], permutation[2 ** 64 - 1], permutation[-2]}) == 3
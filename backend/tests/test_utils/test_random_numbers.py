@@ -1,6 +1,17 @@
+import random
+from collections import Counter
+
 import pytest
 
-from backend.utils.random_numbers import generate_random_numbers
+from backend.utils.entropy import entropy
+from backend.utils.random_numbers import (
+    dense_shuffle_sample,
+    floyd_sample,
+    generate_random_numbers,
+    iter_random_numbers,
+    sample_unique,
+    sparse_shuffle_sample,
+)
 
 
 def test_generate_single_random_number_length():
@@ -108,3 +119,144 @@ def test_generate_random_numbers_with_large_count_range():
     result = generate_random_numbers(1, 100, count=1000, unique=False)
     for num in result:
         assert 1 <= num <= 100
+
+
+# Unique sampling algorithms
+#
+# The statistical tests draw from a seeded generator so they are repeatable,
+# and compare a chi-square statistic against its 0.1% critical value.
+
+SAMPLERS = [floyd_sample, sparse_shuffle_sample, dense_shuffle_sample]
+ORDERED_SAMPLERS = [sparse_shuffle_sample, dense_shuffle_sample]
+TRIALS = 20000
+
+# Chi-square critical values at p = 0.001, by degrees of freedom
+CHI_SQUARE_CRITICAL = {9: 27.877, 19: 43.820, 59: 98.324, 119: 173.617}
+
+
+class CountingRandbelow:
+    """Seeded randbelow that counts its calls"""
+
+    def __init__(self, seed=0):
+        self.random = random.Random(seed)
+        self.calls = 0
+
+    def __call__(self, upper):
+        self.calls += 1
+        return self.random.randrange(upper)
+
+
+def chi_square(counts, outcomes, trials):
+    expected = trials / outcomes
+    observed = list(counts.values()) + [0] * (outcomes - len(counts))
+    return sum((value - expected) ** 2 / expected for value in observed)
+
+
+@pytest.mark.parametrize('sampler', SAMPLERS)
+def test_sampler_draw_count(sampler):
+    """Test that a sampler draws exactly count times."""
+    randbelow = CountingRandbelow()
+    sampler(1000, 1000, randbelow)
+    assert randbelow.calls == 1000
+
+
+@pytest.mark.parametrize('sampler', SAMPLERS)
+def test_sampler_full_range_is_permutation(sampler):
+    """Test that sampling the whole range returns every offset once."""
+    assert sorted(sampler(1000, 1000, CountingRandbelow())) == list(range(1000))
+
+
+@pytest.mark.parametrize('sampler', SAMPLERS)
+def test_sampler_distinct_offsets(sampler):
+    """Test that a sparse sample has distinct offsets within the range."""
+    sample = sampler(10 ** 5, 500, CountingRandbelow())
+    assert len(set(sample)) == 500 and all(0 <= offset < 10 ** 5 for offset in sample)
+
+
+@pytest.mark.parametrize('sampler', SAMPLERS)
+def test_sampler_subsets_uniform(sampler):
+    """Test that every 2-subset of 5 offsets is equally likely."""
+    randbelow = CountingRandbelow()
+    counts = Counter(frozenset(sampler(5, 2, randbelow)) for _ in range(TRIALS))
+    assert chi_square(counts, 10, TRIALS) < CHI_SQUARE_CRITICAL[9]
+
+
+@pytest.mark.parametrize('sampler', ORDERED_SAMPLERS)
+def test_sampler_ordered_samples_uniform(sampler):
+    """Test that every ordered 2-sample of 5 offsets is equally likely."""
+    randbelow = CountingRandbelow()
+    counts = Counter(tuple(sampler(5, 2, randbelow)) for _ in range(TRIALS))
+    assert chi_square(counts, 20, TRIALS) < CHI_SQUARE_CRITICAL[19]
+
+
+@pytest.mark.parametrize('sampler', ORDERED_SAMPLERS)
+def test_sampler_permutations_uniform(sampler):
+    """Test that every ordering of a 5-offset range is equally likely."""
+    randbelow = CountingRandbelow()
+    counts = Counter(tuple(sampler(5, 5, randbelow)) for _ in range(TRIALS * 2))
+    assert chi_square(counts, 120, TRIALS * 2) < CHI_SQUARE_CRITICAL[119]
+
+
+@pytest.mark.parametrize('sampler', SAMPLERS)
+def test_sampler_marginals_uniform(sampler):
+    """Test that each offset of a 60-wide range is picked equally often."""
+    randbelow = CountingRandbelow()
+    counts = Counter(offset for _ in range(TRIALS // 5) for offset in sampler(60, 5, randbelow))
+    assert chi_square(counts, 60, TRIALS) < CHI_SQUARE_CRITICAL[59]
+
+
+@pytest.mark.parametrize('size, count, sampler', [
+    (1000, 1000, dense_shuffle_sample),
+    (1000, 100, sparse_shuffle_sample),
+    (10 ** 6, 100, floyd_sample),
+])
+def test_sample_unique_dispatch(monkeypatch, size, count, sampler):
+    """Test that sample_unique picks the algorithm by density."""
+    chosen = []
+    monkeypatch.setattr(f'backend.utils.random_numbers.{sampler.__name__}', lambda *args: chosen.append(sampler))
+    sample_unique(size, count)
+    assert chosen == [sampler]
+
+
+def test_generate_unique_random_numbers_draw_count(monkeypatch):
+    """Test that drawing a whole 1000-wide range takes 1000 draws."""
+    randbelow = CountingRandbelow()
+    monkeypatch.setattr(entropy, 'prefetched_randbelow', lambda draws: randbelow)
+    generate_random_numbers(1, 1000, count=1000, unique=True)
+    assert randbelow.calls == 1000
+
+
+def test_generate_unique_random_numbers_full_range():
+    """Test that drawing a whole range returns each value once."""
+    assert sorted(generate_random_numbers(-5, 994, count=1000, unique=True)) == list(range(-5, 995))
+
+
+def test_iter_random_numbers_count():
+    """Test that the chunks add up to count numbers."""
+    chunks = list(iter_random_numbers(1, 10 ** 6, count=10000, unique=False, chunk_size=3000))
+    assert [len(chunk) for chunk in chunks] == [3000, 3000, 3000, 1000]
+
+
+def test_iter_random_numbers_range():
+    """Test that streamed numbers are within the range."""
+    numbers = [number for chunk in iter_random_numbers(-5, 5, count=1000, unique=False) for number in chunk]
+    assert all(-5 <= number <= 5 for number in numbers)
+
+
+def test_iter_random_numbers_unique_sampled():
+    """Test that a short unique stream has distinct numbers."""
+    numbers = [number for chunk in iter_random_numbers(1, 1000, count=1000, chunk_size=100) for number in chunk]
+    assert sorted(numbers) == list(range(1, 1001))
+
+
+def test_iter_random_numbers_unique_permutation(monkeypatch):
+    """Test that a long unique stream walks a permutation and stays distinct."""
+    monkeypatch.setattr('backend.utils.random_numbers.STREAM_SAMPLE_MAX_COUNT', 10)
+    numbers = [number for chunk in iter_random_numbers(1, 2000, count=2000, chunk_size=300) for number in chunk]
+    assert sorted(numbers) == list(range(1, 2001))
+
+
+def test_iter_random_numbers_validates_eagerly():
+    """Test that bad arguments raise before any chunk is asked for."""
+    with pytest.raises(ValueError):
+        iter_random_numbers(1, 5, count=10, unique=True)
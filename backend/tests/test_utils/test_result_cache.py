@@ -0,0 +1,161 @@
+import pytest
+
+from backend.cache import ByteBudgetLocMemCache
+from backend.result_cache import ResultCache, cached_caesar_cipher, cached_vigenere_cipher, input_digest, result_cache
+from backend.utils.caesar_cipher import caesar_cipher
+from backend.utils.vigenere_cipher import vigenere_cipher
+
+
+@pytest.fixture
+def budget_cache(request):
+    """Returns an empty byte budget cache of 1000 bytes"""
+
+    cache = ByteBudgetLocMemCache(request.node.name, {'OPTIONS': {'MAX_BYTES': 1000, 'MAX_ENTRIES': 100}})
+    cache.clear()
+    return cache
+
+
+@pytest.fixture
+def fresh_result_cache():
+    """Clears the shared result cache and its counters"""
+
+    result_cache.cache.clear()
+    result_cache.reset_stats()
+    yield result_cache
+    result_cache.cache.clear()
+    result_cache.reset_stats()
+
+
+def test_byte_budget_cache_tracks_bytes(budget_cache):
+    """Test that the cache accounts for the pickled size of its values."""
+    budget_cache.set('a', 'x' * 100)
+    assert 100 < budget_cache.info()['bytes'] < 150
+
+
+def test_byte_budget_cache_replace_does_not_double_count(budget_cache):
+    """Test that replacing a value swaps its size instead of adding to it."""
+    budget_cache.set('a', 'x' * 100)
+    before = budget_cache.info()['bytes']
+    budget_cache.set('a', 'y' * 100)
+    assert budget_cache.info()['bytes'] == before
+
+
+def test_byte_budget_cache_evicts_least_recently_used(budget_cache):
+    """Test that going over budget evicts the least recently used entry."""
+    for key in 'abc':
+        budget_cache.set(key, key * 300)
+    budget_cache.get('a')
+    budget_cache.set('d', 'd' * 300)
+    assert [budget_cache.get(key) is not None for key in 'abcd'] == [True, False, True, True]
+
+
+def test_byte_budget_cache_counts_evictions(budget_cache):
+    """Test that evictions are counted."""
+    for key in 'abcde':
+        budget_cache.set(key, key * 300)
+    assert budget_cache.info()['evictions'] == 2
+
+
+def test_byte_budget_cache_stays_under_budget(budget_cache):
+    """Test that the total never exceeds the budget."""
+    for index in range(50):
+        budget_cache.set(str(index), 'x' * (index * 10))
+    assert budget_cache.info()['bytes'] <= 1000
+
+
+def test_byte_budget_cache_skips_oversized_value(budget_cache):
+    """Test that a value larger than the whole budget is not stored."""
+    budget_cache.set('a', 'x' * 2000)
+    assert budget_cache.get('a') is None
+
+
+def test_byte_budget_cache_delete_frees_bytes(budget_cache):
+    """Test that deleting an entry gives its bytes back."""
+    budget_cache.set('a', 'x' * 100)
+    budget_cache.delete('a')
+    assert budget_cache.info()['bytes'] == 0
+
+
+def test_cached_caesar_cipher_matches_engine(fresh_result_cache):
+    """Test that cached results equal the engine on a miss and on a hit."""
+    results = [cached_caesar_cipher('Hello, World!', 3) for _ in range(2)]
+    assert results == [caesar_cipher('Hello, World!', 3)] * 2
+
+
+def test_cached_caesar_cipher_counts_hit(fresh_result_cache):
+    """Test that the second identical call is a hit."""
+    cached_caesar_cipher('Hello', 3)
+    cached_caesar_cipher('Hello', 3)
+    assert (fresh_result_cache.hits, fresh_result_cache.misses) == (1, 1)
+
+
+def test_cached_caesar_cipher_normalises_shift(fresh_result_cache):
+    """Test that equivalent shifts and modes share one entry."""
+    cached_caesar_cipher('Hello', 3, 'decrypt')
+    cached_caesar_cipher('Hello', 23)
+    assert fresh_result_cache.hits == 1
+
+
+def test_cached_caesar_cipher_invalid_shift(fresh_result_cache):
+    """Test that an invalid shift raises like the engine."""
+    with pytest.raises(ValueError):
+        cached_caesar_cipher('Hello', 'invalid')
+
+
+def test_cached_vigenere_cipher_matches_engine(fresh_result_cache):
+    """Test that cached Vigenère results equal the engine."""
+    results = [cached_vigenere_cipher('Attack at dawn', 'LEMON', 'decrypt') for _ in range(2)]
+    assert results == [vigenere_cipher('Attack at dawn', 'LEMON', 'decrypt')] * 2
+
+
+def test_cached_vigenere_cipher_modes_do_not_collide(fresh_result_cache):
+    """Test that encrypting and decrypting the same text are kept apart."""
+    encrypted = cached_vigenere_cipher('Attack', 'LEMON')
+    assert cached_vigenere_cipher('Attack', 'LEMON', 'decrypt') != encrypted
+
+
+def test_cached_vigenere_cipher_empty_key(fresh_result_cache):
+    """Test that an empty key raises like the engine."""
+    with pytest.raises(ValueError):
+        cached_vigenere_cipher('Attack', '')
+
+
+def test_result_cache_bypasses_large_text(fresh_result_cache):
+    """Test that texts over the threshold skip the cache."""
+    cache = ResultCache(max_text_size=4)
+    cache.get_or_compute(input_digest('caesar', '3', 'Hello'), 5, lambda: 'Khoor')
+    assert (cache.bypasses, cache.misses) == (1, 0)
+
+
+def test_result_cache_stats_include_backend_info(fresh_result_cache):
+    """Test that the stats carry the backend's byte accounting."""
+    cached_caesar_cipher('Hello', 3)
+    assert fresh_result_cache.stats()['entries'] == 1
+
+
+def test_result_cache_stats_hit_rate(fresh_result_cache):
+    """Test the hit rate in the stats."""
+    for _ in range(4):
+        cached_caesar_cipher('Hello', 3)
+    assert fresh_result_cache.stats()['hit_rate'] == 0.75
+
+
+def test_input_digest_str_and_bytes_agree():
+    """Test that a text and its UTF-8 bytes digest alike."""
+    assert input_digest('caesar', '3', 'Grüße') == input_digest('caesar', '3', 'Grüße'.encode('utf-8'))
+
+
+def test_input_digest_depends_on_parameters():
+    """Test that the parameters are part of the digest."""
+    assert input_digest('caesar', '3', 'Hello') != input_digest('caesar', '4', 'Hello')
+
+
+def test_input_digest_separates_fields():
+    """Test that moving bytes between parameters and text changes the digest."""
+    assert input_digest('caesar', '1', '2Hello') != input_digest('caesar', '12', 'Hello')
+
+
+def test_input_digest_rejects_non_text():
+    """Test that a non-string input raises like the engines."""
+    with pytest.raises(TypeError):
+        input_digest('caesar', '3', 42)
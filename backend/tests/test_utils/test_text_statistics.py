@@ -0,0 +1,54 @@
+import pytest
+
+from backend.utils.text_statistics import TextStatistics, letter_codes, text_statistics
+from backend.tests.config.config_english_text import ENGLISH_TEXT
+
+
+def test_letter_codes_fold_case_and_drop_non_letters():
+    """Test that letters become codes 0-25 and everything else is dropped."""
+    assert letter_codes("aZ 1-b!é") == bytes([0, 25, 1])
+
+def test_text_statistics_unigrams():
+    """Test the letter counts."""
+    assert text_statistics("Hello")['unigrams']['l'] == 2
+
+def test_text_statistics_bigrams_span_non_letters():
+    """Test that bigrams run over letters only."""
+    assert text_statistics("ab, c")['bigrams'] == {'ab': 1, 'bc': 1}
+
+def test_text_statistics_trigrams():
+    """Test the trigram counts."""
+    assert text_statistics("the theme")['trigrams'] == {'the': 2, 'het': 1, 'eth': 1, 'hem': 1, 'eme': 1}
+
+def test_text_statistics_letters():
+    """Test the total number of letters."""
+    assert text_statistics("Hi, you!")['letters'] == 5
+
+def test_text_statistics_short_texts():
+    """Test texts with fewer letters than a trigram."""
+    assert [text_statistics(text)['letters'] for text in ("", "a", "ab")] == [0, 1, 2]
+
+def test_text_statistics_english_index_of_coincidence():
+    """Test that English text has an English-like index of coincidence."""
+    assert 0.06 < text_statistics(ENGLISH_TEXT)['index_of_coincidence'] < 0.075
+
+def test_text_statistics_entropy_of_uniform_letters():
+    """Test the entropy of equally frequent letters."""
+    assert text_statistics("abcd")['entropy'] == 2.0
+
+def test_text_statistics_chunking_does_not_change_counts():
+    """Test that n-grams across chunk boundaries are counted once."""
+    expected = text_statistics(ENGLISH_TEXT)
+    for chunk_size in (1, 2, 3, 7, 100):
+        assert text_statistics(ENGLISH_TEXT, chunk_size=chunk_size) == expected
+
+def test_text_statistics_flat_array_index():
+    """Test the flat array layout of the counts."""
+    statistics = TextStatistics()
+    statistics.update("th")
+    assert statistics.bigrams[19 * 26 + 7] == 1
+
+def test_text_statistics_non_string():
+    """Test analysing a text that is not a string."""
+    with pytest.raises(TypeError):
+        text_statistics(12345)
@@ -0,0 +1,128 @@
+import base64
+import uuid
+from collections import Counter
+
+import pytest
+
+from backend.utils.entropy import SECRET_KEY_CHARS
+from backend.utils.tokens import (
+    BASE62_CHARS,
+    CROCKFORD_BASE32_CHARS,
+    TOKEN_FORMATS,
+    api_key_is_valid,
+    generate_tokens,
+    iter_tokens,
+)
+
+
+@pytest.mark.parametrize('token_format', TOKEN_FORMATS)
+def test_generate_tokens_count(token_format):
+    """Test that each format returns count tokens."""
+    assert len(generate_tokens(token_format, 1000)) == 1000
+
+
+@pytest.mark.parametrize('token_format', TOKEN_FORMATS)
+def test_generate_tokens_distinct(token_format):
+    """Test that no token repeats within a batch."""
+    assert len(set(generate_tokens(token_format, 1000))) == 1000
+
+
+def test_django_tokens_match_secret_key_format():
+    """Test that Django keys have the length and characters of get_random_secret_key."""
+    tokens = generate_tokens('django', 100)
+    assert all(len(token) == 50 and set(token) <= set(SECRET_KEY_CHARS) for token in tokens)
+
+
+def test_django_tokens_custom_length():
+    """Test that length sets the number of characters."""
+    assert {len(token) for token in generate_tokens('django', 100, length=20)} == {20}
+
+
+def test_django_token_characters_uniform():
+    """Test that every character of the alphabet is equally likely."""
+    counts = Counter(''.join(generate_tokens('django', 1000)))
+    expected = 50000 / len(SECRET_KEY_CHARS)
+    chi_square = sum((counts[char] - expected) ** 2 / expected for char in SECRET_KEY_CHARS)
+    assert chi_square < 85.351  # p = 0.001, 49 degrees of freedom
+
+
+def test_hex_tokens_length():
+    """Test that hex tokens encode length random bytes."""
+    assert {len(bytes.fromhex(token)) for token in generate_tokens('hex', 100, length=16)} == {16}
+
+
+def test_urlsafe_tokens_decode():
+    """Test that urlsafe tokens are unpadded base64url of length bytes."""
+    token = generate_tokens('urlsafe', 1, length=32)[0]
+    assert len(base64.urlsafe_b64decode(token + '=')) == 32
+
+
+def test_uuid4_tokens_version():
+    """Test that UUIDv4 tokens carry version 4 and the RFC variant."""
+    tokens = [uuid.UUID(token) for token in generate_tokens('uuid4', 100)]
+    assert all(token.version == 4 and token.variant == uuid.RFC_4122 for token in tokens)
+
+
+def test_uuid7_tokens_version():
+    """Test that UUIDv7 tokens carry version 7 and the RFC variant."""
+    tokens = [uuid.UUID(token) for token in generate_tokens('uuid7', 100)]
+    assert all(token.version == 7 and token.variant == uuid.RFC_4122 for token in tokens)
+
+
+def test_uuid7_tokens_timestamp():
+    """Test that UUIDv7 tokens start with the millisecond timestamp."""
+    token = uuid.UUID(generate_tokens('uuid7', 1, timestamp=1469918176385)[0])
+    assert token.int >> 80 == 1469918176385
+
+
+def test_ulid_tokens_timestamp():
+    """Test that a ULID encodes its timestamp as in the ULID spec example."""
+    assert generate_tokens('ulid', 1, timestamp=1469918176385)[0][:10] == '01ARYZ6S41'
+
+
+def test_ulid_tokens_alphabet():
+    """Test that ULIDs are 26 Crockford base32 characters."""
+    tokens = generate_tokens('ulid', 100)
+    assert all(len(token) == 26 and set(token) <= set(CROCKFORD_BASE32_CHARS) for token in tokens)
+
+
+@pytest.mark.parametrize('token_format', ['uuid7', 'ulid'])
+def test_time_ordered_tokens_sorted_across_chunks(token_format):
+    """Test that time-ordered tokens stay sorted across chunks."""
+    tokens = [token for chunk in iter_tokens(token_format, 5000, chunk_size=1000) for token in chunk]
+    assert tokens == sorted(tokens)
+
+
+def test_api_keys_validate():
+    """Test that generated API keys pass their checksum."""
+    assert all(api_key_is_valid(key) for key in generate_tokens('api-key', 100))
+
+
+def test_api_key_typo_fails_checksum():
+    """Test that changing a character of an API key fails the checksum."""
+    key = generate_tokens('api-key', 1)[0]
+    changed = key[:10] + ('A' if key[10] != 'A' else 'B') + key[11:]
+    assert not api_key_is_valid(changed)
+
+
+def test_api_key_secret_alphabet():
+    """Test that the secret part of an API key is base62."""
+    key = generate_tokens('api-key', 1, length=40)[0]
+    assert set(key[4:-6]) <= set(BASE62_CHARS) and len(key[4:-6]) == 40
+
+
+def test_generate_tokens_unknown_format():
+    """Test that an unknown format raises ValueError."""
+    with pytest.raises(ValueError):
+        generate_tokens('base58', 1)
+
+
+def test_generate_tokens_length_too_long():
+    """Test that a length past the limit raises ValueError."""
+    with pytest.raises(ValueError):
+        generate_tokens('hex', 1, length=10 ** 6)
+
+
+def test_iter_tokens_chunks():
+    """Test that the chunks add up to count tokens."""
+    assert [len(chunk) for chunk in iter_tokens('hex', 2500, chunk_size=1000)] == [1000, 1000, 500]
@@ -1,6 +1,9 @@
 import pytest
 
-from backend.utils.vigenere_cipher import vigenere_cipher
+from backend.utils.vigenere_cipher import vigenere_cipher, vigenere_cipher_bytes, vigenere_cipher_chunks
+from backend.tests.config.config_make_string import make_random_string
+from backend.tests.config.config_random_generation import generate_random_any_string
+from backend.tests.config.config_reference_ciphers import reference_vigenere_cipher
 
 
 def test_encrypt_uppercase():
@@ -76,3 +79,78 @@ def test_encrypt_with_mixed_case_text():
 def test_decrypt_with_mixed_case_text():
     """Test decryption with mixed case text."""
     assert vigenere_cipher("RiJvS", "key", mode='decrypt') == "HeLlO"
+
+def test_encrypt_with_empty_key():
+    """Test encryption with an empty key."""
+    with pytest.raises(ValueError):
+        vigenere_cipher("HELLO", "")
+
+def test_encrypt_matches_reference_loop():
+    """Test that the column strided engine matches the original loop."""
+    text = make_random_string(500)
+    for key_length in range(1, 20):
+        key = generate_random_any_string(key_length)
+        assert vigenere_cipher(text, key) == reference_vigenere_cipher(text, key)
+
+def test_decrypt_matches_reference_loop():
+    """Test that column strided decryption matches the original loop."""
+    text = make_random_string(500)
+    for key_length in range(1, 20):
+        key = generate_random_any_string(key_length)
+        assert vigenere_cipher(text, key, mode='decrypt') == reference_vigenere_cipher(text, key, mode='decrypt')
+
+def test_encrypt_with_non_letter_key_matches_reference_loop():
+    """Test that non-letter key characters shift like the original loop."""
+    text = "Hello, World! Mixed CASE text 42"
+    assert vigenere_cipher(text, "k3y!9") == reference_vigenere_cipher(text, "k3y!9")
+
+def test_encrypt_leaves_non_ascii_letters_unchanged():
+    """Test that non-ASCII letters are left unchanged but advance the key."""
+    assert vigenere_cipher("Éclair über Ωmega", "B") == "Édmbjs ücfs Ωnfhb"
+
+def test_encrypt_non_ascii_advances_key():
+    """Test that a non-ASCII character takes up one key position."""
+    assert vigenere_cipher("aéa", "BCD") == "béd"
+
+def test_decrypt_non_ascii_round_trip():
+    """Test that decryption restores text with non-ASCII runs."""
+    text = "Здравствуй, world! Ünïcödé straße 日本語 text"
+    assert vigenere_cipher(vigenere_cipher(text, "LEMON"), "LEMON", mode='decrypt') == text
+
+def test_encrypt_non_ascii_ascii_letters_match_reference_loop():
+    """Test that ASCII letters in non-ASCII text shift like the original loop."""
+    text = make_random_string(500)
+    assert vigenere_cipher(text + "é", "LEMON") == reference_vigenere_cipher(text, "LEMON") + "é"
+
+def test_cipher_chunks_carry_key_phase():
+    """Test that chunked ciphering equals ciphering the joined text."""
+    text = make_random_string(500)
+    chunks = [text[start:start + 37] for start in range(0, len(text), 37)]
+    assert ''.join(vigenere_cipher_chunks(chunks, "LEMON")) == vigenere_cipher(text, "LEMON")
+
+def test_encrypt_with_key_as_long_as_text_matches_reference_loop():
+    """Test that a key too long for column striding matches the original loop."""
+    text = make_random_string(500)
+    key = generate_random_any_string(400)
+    assert vigenere_cipher(text, key) == reference_vigenere_cipher(text, key)
+
+def test_cipher_chunks_with_long_key_carry_key_phase():
+    """Test that chunks ciphered byte by byte pick up the key where the last one stopped."""
+    text = make_random_string(500)
+    key = generate_random_any_string(1000)
+    chunks = [text[start:start + 37] for start in range(0, len(text), 37)]
+    assert ''.join(vigenere_cipher_chunks(chunks, key)) == vigenere_cipher(text, key)
+
+
+def test_vigenere_cipher_bytes_ascii_in_place():
+    """Test that an ASCII bytearray is ciphered in place."""
+    data = bytearray(b'HELLO')
+    vigenere_cipher_bytes(data, 'KEY')
+    assert data == bytearray(b'RIJVS')
+
+
+def test_vigenere_cipher_bytes_invalid_utf8_round_trip():
+    """Test that bytes which are not valid UTF-8 survive a round trip."""
+    data = b'ab\xffcd\xc3'
+    encrypted = vigenere_cipher_bytes(data, 'KEY')
+    assert vigenere_cipher_bytes(encrypted, 'KEY', 'decrypt') == data
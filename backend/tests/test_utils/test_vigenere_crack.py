@@ -0,0 +1,44 @@
+import pytest
+
+from backend.utils.vigenere_cipher import vigenere_cipher
+from backend.utils.vigenere_crack import crack_vigenere, estimate_key_lengths, kasiski_factors, recover_key
+from backend.tests.config.config_english_text import ENGLISH_TEXT
+
+
+def test_kasiski_factors_counts_spacing_divisors():
+    """Test that a repeated trigram votes for every divisor of its spacing."""
+    votes = kasiski_factors("abcxxxabc", max_key_length=6)
+    assert votes[2:7] == [1, 1, 0, 0, 1]
+
+def test_estimate_key_lengths_prefers_true_length():
+    """Test that the key length ranks above its multiples."""
+    sample = vigenere_cipher(ENGLISH_TEXT, "LEMON").lower()
+    assert estimate_key_lengths(sample)[0]['key_length'] == 5
+
+def test_recover_key():
+    """Test recovering the key letters for a known key length."""
+    sample = vigenere_cipher(ENGLISH_TEXT, "LEMON").lower()
+    assert recover_key(sample, 5) == "LEMON"
+
+def test_crack_vigenere_recovers_key():
+    """Test that the best candidate is the encryption key."""
+    for key in ("KEY", "LEMON", "CIPHER"):
+        assert crack_vigenere(vigenere_cipher(ENGLISH_TEXT, key))['candidates'][0]['key'] == key
+
+def test_crack_vigenere_decrypts_text():
+    """Test that the result is the text decrypted with the best key."""
+    assert crack_vigenere(vigenere_cipher(ENGLISH_TEXT, "LEMON"))['result'] == ENGLISH_TEXT
+
+def test_crack_vigenere_skips_repeated_keys():
+    """Test that repetitions of a listed key are not offered again."""
+    keys = [candidate['key'] for candidate in crack_vigenere(vigenere_cipher(ENGLISH_TEXT, "KEY"))['candidates']]
+    assert "KEYKEY" not in keys
+
+def test_crack_vigenere_without_letters():
+    """Test cracking a text without letters."""
+    assert crack_vigenere("1234 !?") == {'candidates': [], 'result': "1234 !?"}
+
+def test_crack_vigenere_invalid_max_key_length():
+    """Test cracking with a max key length below one."""
+    with pytest.raises(ValueError):
+        crack_vigenere("HELLO", max_key_length=0)
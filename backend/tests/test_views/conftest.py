@@ -6,3 +6,9 @@ from django.test import Client
 @pytest.fixture
 def client_django():
     return Client()
+
+
+@pytest.fixture
+def client_csrf():
+    """A client that enforces CSRF checks, as a live server does"""
+    return Client(enforce_csrf_checks=True)
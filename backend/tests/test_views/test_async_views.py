@@ -0,0 +1,164 @@
+import pytest
+
+from django.urls import reverse
+
+from rest_framework import status
+
+from backend import async_views
+from backend.utils.caesar_cipher import caesar_cipher
+from backend.utils.parallel_cipher import shutdown_pool
+from backend.utils.vigenere_cipher import vigenere_cipher
+
+
+def test_generator_async_view_post_key_length(client_django):
+    """Test that the async generator returns a Django secret key."""
+    response = client_django.post(reverse('eye-async-django-gen'))
+    assert len(response.json()['key']) == 50
+
+
+def test_generator_async_view_get_status_code(client_django):
+    """Test that the async generator only accepts POST."""
+    response = client_django.get(reverse('eye-async-django-gen'))
+    assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+
+def test_caesar_cipher_async_view_post_json_response_data(client_django):
+    """Test the async Caesar view with a JSON body."""
+    url = reverse('eye-async-caesar-text')
+    response = client_django.post(url, data={'text': 'HELLO', 'shift': 3}, content_type='application/json')
+    assert response.json() == {"result": "KHOOR"}
+
+
+def test_caesar_cipher_async_view_post_form_response_data(client_django):
+    """Test the async Caesar view with a form body."""
+    url = reverse('eye-async-caesar-text')
+    response = client_django.post(url, data={'text': 'KHOOR', 'shift': 3, 'mode': 'decrypt'})
+    assert response.json() == {"result": "HELLO"}
+
+
+def test_caesar_cipher_async_view_post_plain_text_status_code(client_django):
+    """Test that a body that is neither JSON nor form data is rejected with 415."""
+    url = reverse('eye-async-caesar-text')
+    response = client_django.post(url, data='HELLO', content_type='text/plain')
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
+def test_secure_random_numbers_async_view_post_octet_stream_status_code(client_django):
+    """Test that an octet-stream body is rejected with 415."""
+    url = reverse('eye-async-secure-numbers')
+    response = client_django.post(url, data=b'min_value=1', content_type='application/octet-stream')
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
+def test_caesar_cipher_async_view_post_invalid_shift_response_data(client_django):
+    """Test the response data for an invalid shift."""
+    url = reverse('eye-async-caesar-text')
+    response = client_django.post(url, data={'text': 'HELLO', 'shift': 'invalid'}, content_type='application/json')
+    assert response.json() == {"error": "Wrong shift type! invalid literal for int() with base 10: 'invalid'"}
+
+
+def test_caesar_cipher_async_view_post_invalid_json_status_code(client_django):
+    """Test the status code for a malformed JSON body."""
+    url = reverse('eye-async-caesar-text')
+    response = client_django.post(url, data='{"text": ', content_type='application/json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_caesar_cipher_async_view_post_declared_body_too_large_status_code(client_django):
+    """Test that the body guard also covers the async views."""
+    url = reverse('eye-async-caesar-text')
+    response = client_django.post(
+        url, data={'text': 'HELLO'}, content_type='application/json', CONTENT_LENGTH=str(100 * 1024 * 1024)
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+@pytest.mark.parametrize('inline_max_size, thread_max_size', [(10 ** 9, 10 ** 9), (0, 10 ** 9), (0, 0)])
+def test_caesar_cipher_async_view_every_executor(client_django, monkeypatch, inline_max_size, thread_max_size):
+    """Test that inline, thread and process dispatch give the same result."""
+    monkeypatch.setattr(async_views, 'INLINE_MAX_SIZE', inline_max_size)
+    monkeypatch.setattr(async_views, 'THREAD_MAX_SIZE', thread_max_size)
+    url = reverse('eye-async-caesar-text')
+    text = 'Hello, World! ' * 1000
+    try:
+        response = client_django.post(url, data={'text': text, 'shift': 7}, content_type='application/json')
+    finally:
+        shutdown_pool()
+    assert response.json() == {"result": caesar_cipher(text, 7)}
+
+
+@pytest.mark.parametrize('inline_max_size, thread_max_size', [(10 ** 9, 10 ** 9), (0, 10 ** 9), (0, 0)])
+def test_vigenere_cipher_async_view_every_executor(client_django, monkeypatch, inline_max_size, thread_max_size):
+    """Test that inline, thread and process dispatch give the same result."""
+    monkeypatch.setattr(async_views, 'INLINE_MAX_SIZE', inline_max_size)
+    monkeypatch.setattr(async_views, 'THREAD_MAX_SIZE', thread_max_size)
+    url = reverse('eye-async-vigenere-text')
+    text = 'Attack at dawn, wörld! ' * 1000
+    try:
+        response = client_django.post(url, data={'text': text, 'key': 'LEMON'}, content_type='application/json')
+    finally:
+        shutdown_pool()
+    assert response.json() == {"result": vigenere_cipher(text, 'LEMON')}
+
+
+def test_vigenere_cipher_async_view_post_missing_key_response_data(client_django):
+    """Test the response data for a missing key."""
+    url = reverse('eye-async-vigenere-text')
+    response = client_django.post(url, data={'text': 'HELLO'}, content_type='application/json')
+    assert response.json() == {"error": "Key is required."}
+
+
+def test_vigenere_cipher_async_view_post_non_string_key_status_code(client_django):
+    """Test the status code for a key that is not a string."""
+    url = reverse('eye-async-vigenere-text')
+    response = client_django.post(url, data={'text': 'HELLO', 'key': 5}, content_type='application/json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_secure_random_numbers_async_view_post_count(client_django):
+    """Test that the async view returns the requested number of values."""
+    url = reverse('eye-async-secure-numbers')
+    response = client_django.post(
+        url, data={'min_value': 1, 'max_value': 100, 'count': 10}, content_type='application/json'
+    )
+    assert len(response.json()['random_numbers']) == 10
+
+
+def test_secure_random_numbers_async_view_post_missing_values_status_code(client_django):
+    """Test the status code when min_value or max_value is missing."""
+    url = reverse('eye-async-secure-numbers')
+    response = client_django.post(url, data={'min_value': 1}, content_type='application/json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_secure_random_numbers_async_view_post_count_too_large_status_code(client_django):
+    """Test the status code for a count above the limit."""
+    url = reverse('eye-async-secure-numbers')
+    response = client_django.post(
+        url, data={'min_value': 1, 'max_value': 10 ** 6, 'count': 10 ** 4}, content_type='application/json'
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.parametrize('url_name, data', [
+    ('eye-async-django-gen', {}),
+    ('eye-async-caesar-text', {'text': 'HELLO', 'shift': 3}),
+    ('eye-async-vigenere-text', {'text': 'HELLO', 'key': 'KEY'}),
+    ('eye-async-secure-numbers', {'min_value': 1, 'max_value': 10, 'count': 3}),
+])
+def test_async_views_accept_calls_without_csrf_token(client_csrf, url_name, data):
+    """Test that the async views take API calls without a CSRF token, like the sync views."""
+    response = client_csrf.post(reverse(url_name), data=data, content_type='application/json')
+    assert response.status_code == status.HTTP_200_OK
+
+
+
+def test_caesar_cipher_async_view_only_cipher_uses_process_pool(client_django, monkeypatch):
+    """Test that parsing, hashing and encoding stay off the process pool, so only the cipher is shipped out."""
+    pooled = []
+    monkeypatch.setattr(async_views, 'INLINE_MAX_SIZE', 0)
+    monkeypatch.setattr(async_views, 'THREAD_MAX_SIZE', 0)
+    monkeypatch.setattr(async_views, 'get_pool', lambda: pooled.append(1) or async_views._thread_pool)
+    url = reverse('eye-async-caesar-text')
+    client_django.post(url, data={'text': 'HELLO', 'shift': 3}, content_type='application/json')
+    assert len(pooled) == 1
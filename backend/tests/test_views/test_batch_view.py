@@ -0,0 +1,103 @@
+import json
+
+from django.urls import reverse
+
+from rest_framework import status
+
+
+def read_lines(response):
+    """Returns the decoded NDJSON lines of a streamed batch response"""
+
+    return [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+
+
+def test_batch_view_post_valid_status_code(client_django):
+    """Test the status code for a valid batch request."""
+    url = reverse('eye-batch')
+    operations = [{'operation': 'caesar-cipher', 'text': 'HELLO', 'shift': 3}]
+    response = client_django.post(url, data=operations, content_type='application/json')
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_batch_view_post_valid_response_type(client_django):
+    """Test the response type for a valid batch request."""
+    url = reverse('eye-batch')
+    operations = [{'operation': 'caesar-cipher', 'text': 'HELLO', 'shift': 3}]
+    response = client_django.post(url, data=operations, content_type='application/json')
+    assert response['Content-Type'] == 'application/x-ndjson'
+
+
+def test_batch_view_post_mixed_operations_response_data(client_django):
+    """Test that heterogeneous operations come back in order."""
+    url = reverse('eye-batch')
+    operations = {'operations': [
+        {'operation': 'caesar-cipher', 'text': 'HELLO', 'shift': 3},
+        {'operation': 'vigenere-cipher', 'text': 'HELLO', 'key': 'KEY'},
+        {'operation': 'vigenere-cipher', 'text': 'RIJVS', 'key': 'KEY', 'mode': 'decrypt'},
+    ]}
+    response = client_django.post(url, data=operations, content_type='application/json')
+    assert read_lines(response) == [
+        {'index': 0, 'status': 200, 'result': 'KHOOR'},
+        {'index': 1, 'status': 200, 'result': 'RIJVS'},
+        {'index': 2, 'status': 200, 'result': 'HELLO'},
+    ]
+
+
+def test_batch_view_post_random_operations_response_data(client_django):
+    """Test that random operations return their endpoint's payload."""
+    url = reverse('eye-batch')
+    operations = [
+        {'operation': 'secure-random-numbers', 'min_value': 1, 'max_value': 10, 'count': 5},
+        {'operation': 'django-ker-generate'},
+    ]
+    response = client_django.post(url, data=operations, content_type='application/json')
+    numbers_line, key_line = read_lines(response)
+    assert len(numbers_line['random_numbers']) == 5 and len(key_line['key']) == 50
+
+
+def test_batch_view_post_identical_random_operations_not_merged(client_django):
+    """Test that identical random operations each get their own secret key."""
+    url = reverse('eye-batch')
+    operations = [{'operation': 'django-ker-generate'}] * 2
+    response = client_django.post(url, data=operations, content_type='application/json')
+    first, second = read_lines(response)
+    assert first['key'] != second['key']
+
+
+def test_batch_view_post_per_item_errors_response_data(client_django):
+    """Test that a failing operation does not stop the rest of the batch."""
+    url = reverse('eye-batch')
+    operations = [
+        {'operation': 'vigenere-cipher', 'text': 'HELLO'},
+        {'operation': 'unknown'},
+        {'operation': 'caesar-cipher', 'text': 'HELLO', 'shift': 'invalid'},
+        {'operation': 'caesar-cipher', 'text': 'HELLO'},
+    ]
+    response = client_django.post(url, data=operations, content_type='application/json')
+    assert read_lines(response) == [
+        {'index': 0, 'status': 400, 'error': 'Key is required.'},
+        {'index': 1, 'status': 400, 'error': "Unknown operation: 'unknown'."},
+        {'index': 2, 'status': 400, 'error': "Wrong shift type! invalid literal for int() with base 10: 'invalid'"},
+        {'index': 3, 'status': 200, 'result': 'KHOOR'},
+    ]
+
+
+def test_batch_view_post_ndjson_response_data(client_django):
+    """Test a batch sent as NDJSON, including a malformed line."""
+    url = reverse('eye-batch')
+    body = (
+        '{"operation": "caesar-cipher", "text": "HELLO", "shift": 3}\n'
+        '\n'
+        'not json\n'
+        '{"operation": "vigenere-cipher", "text": "HELLO", "key": "KEY"}\n'
+    )
+    response = client_django.post(url, data=body, content_type='application/x-ndjson')
+    lines = read_lines(response)
+    assert [line['status'] for line in lines] == [200, 400, 200]
+
+
+def test_batch_view_post_not_a_list_status_code(client_django):
+    """Test the status code for a batch whose operations are not a list."""
+    url = reverse('eye-batch')
+    response = client_django.post(url, data={'operations': 'HELLO'}, content_type='application/json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
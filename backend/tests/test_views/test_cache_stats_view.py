@@ -0,0 +1,27 @@
+from django.urls import reverse
+
+from rest_framework import status
+
+from backend.result_cache import result_cache
+
+
+def test_cache_stats_view_get_status_code(client_django):
+    """Test the status code of the cache stats endpoint."""
+    response = client_django.get(reverse('eye-cache-stats'))
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_cache_stats_view_get_counts_hit(client_django):
+    """Test that a repeated cipher request shows up as a hit."""
+    result_cache.cache.clear()
+    result_cache.reset_stats()
+    for _ in range(2):
+        client_django.post(reverse('eye-caesar-text'), data={'text': 'HELLO', 'shift': 3})
+    response = client_django.get(reverse('eye-cache-stats'))
+    assert (response.json()['hits'], response.json()['misses']) == (1, 1)
+
+
+def test_cache_stats_view_post_status_code(client_django):
+    """Test that the stats endpoint only answers GET."""
+    response = client_django.post(reverse('eye-cache-stats'))
+    assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
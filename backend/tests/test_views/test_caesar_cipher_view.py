@@ -2,6 +2,10 @@ from django.urls import reverse
 
 from rest_framework import status
 
+from backend import parsers
+from backend.limits import MAX_REQUEST_BODY_SIZE, MAX_TEXT_SIZE
+from backend.utils.caesar_cipher import caesar_cipher
+
 
 def test_caesar_cipher_view_post_valid_encrypt_status_code(client_django):
     """Test the status code for a valid POST request for encryption."""
@@ -147,3 +151,159 @@ def test_caesar_cipher_view_post_invalid_mode_response_data(client_django):
     url = reverse('eye-caesar-text')
     response = client_django.post(url, data={'text': 'HELLO', 'shift': 3, 'mode': 'invalid'})
     assert response.json() == {'result': 'KHOOR'}
+
+
+def test_caesar_cipher_view_post_stream_status_code(client_django):
+    """Test the status code for a POST request in streaming mode."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    response = client_django.post(url, data={'text': 'HELLO', 'shift': 3, 'mode': 'encrypt'})
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_caesar_cipher_view_post_stream_response_type(client_django):
+    """Test the response type for a POST request in streaming mode."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    response = client_django.post(url, data={'text': 'HELLO', 'shift': 3, 'mode': 'encrypt'})
+    assert response['Content-Type'] == 'text/plain; charset=utf-8'
+
+
+def test_caesar_cipher_view_post_stream_response_data(client_django):
+    """Test that a streamed multi-chunk response matches the whole text cipher."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    text = 'Hello, World! ' * 10000
+    response = client_django.post(url, data={'text': text, 'shift': 3}, content_type='application/json')
+    assert b''.join(response.streaming_content).decode('utf-8') == caesar_cipher(text, 3)
+
+
+def test_caesar_cipher_view_post_stream_invalid_shift_status_code(client_django):
+    """Test the status code for an invalid shift in streaming mode."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    response = client_django.post(url, data={'text': 'HELLO', 'shift': 'invalid', 'mode': 'encrypt'})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_caesar_cipher_view_post_declared_body_too_large_status_code(client_django):
+    """Test that a Content-Length over the limit is rejected with 413."""
+    url = reverse('eye-caesar-text')
+    response = client_django.post(
+        url, data={'text': 'HELLO'}, content_type='application/json', CONTENT_LENGTH=str(MAX_REQUEST_BODY_SIZE + 1)
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+def test_caesar_cipher_view_post_declared_body_too_large_response_data(client_django):
+    """Test the response data for a body rejected by its Content-Length."""
+    url = reverse('eye-caesar-text')
+    response = client_django.post(
+        url, data={'text': 'HELLO'}, content_type='application/json', CONTENT_LENGTH=str(MAX_REQUEST_BODY_SIZE + 1)
+    )
+    assert response.json() == {"error": "Request body exceeds the allowed limit."}
+
+
+def test_caesar_cipher_view_post_text_too_large_non_ascii(client_django):
+    """Test that non-ASCII text is measured by its UTF-8 size."""
+    url = reverse('eye-caesar-text')
+    text = 'é' * (MAX_TEXT_SIZE // 2 + 1)
+    response = client_django.post(url, data={'text': text}, content_type='application/json')
+    assert response.json() == {"error": "Text size exceeds the allowed limit."}
+
+
+def test_caesar_cipher_view_post_raw_text_response_data(client_django):
+    """Test that a text/plain body is ciphered into a raw body."""
+    url = reverse('eye-caesar-text') + '?shift=3'
+    response = client_django.post(url, data='HELLO, wörld', content_type='text/plain; charset=utf-8')
+    assert response.content.decode('utf-8') == 'KHOOR, zöuog'
+
+
+def test_caesar_cipher_view_post_raw_content_type(client_django):
+    """Test that a raw response keeps the media type of the request."""
+    url = reverse('eye-caesar-text')
+    response = client_django.post(url, data=b'HELLO', content_type='application/octet-stream')
+    assert response['Content-Type'] == 'application/octet-stream'
+
+
+def test_caesar_cipher_view_post_raw_header_parameters(client_django):
+    """Test that raw mode reads its parameters from X-Cipher-* headers."""
+    url = reverse('eye-caesar-text')
+    response = client_django.post(
+        url, data=b'KHOOR', content_type='application/octet-stream',
+        headers={'X-Cipher-Shift': '3', 'X-Cipher-Mode': 'decrypt'},
+    )
+    assert response.content == b'HELLO'
+
+
+def test_caesar_cipher_view_post_raw_invalid_shift_status_code(client_django):
+    """Test the status code for an invalid shift in raw mode."""
+    url = reverse('eye-caesar-text') + '?shift=invalid'
+    response = client_django.post(url, data='HELLO', content_type='text/plain')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_caesar_cipher_view_post_stream_json_response_data(client_django):
+    """Test that a streamed JSON text field is ciphered as it is read."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    text = 'Hello, "World" ß\n' * 10000
+    response = client_django.post(
+        url, data={'shift': 5, 'mode': 'encrypt', 'text': text}, content_type='application/json'
+    )
+    assert b''.join(response.streaming_content).decode('utf-8') == caesar_cipher(text, 5)
+
+
+def test_caesar_cipher_view_post_stream_json_invalid_shift_status_code(client_django):
+    """Test that an invalid shift is rejected before streaming starts."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    response = client_django.post(url, data={'shift': 'invalid', 'text': 'HELLO'}, content_type='application/json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_caesar_cipher_view_post_stream_json_text_first_response_data(client_django):
+    """Test that shift and mode sent after a streamed text still apply."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    response = client_django.post(
+        url, data={'text': 'KHOOR', 'shift': 3, 'mode': 'decrypt'}, content_type='application/json'
+    )
+    assert b''.join(response.streaming_content).decode('utf-8') == 'HELLO'
+
+
+def test_caesar_cipher_view_post_stream_json_text_last_response_data(client_django):
+    """Test that shift and mode sent before a streamed text apply."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    response = client_django.post(
+        url, data={'shift': 3, 'mode': 'decrypt', 'text': 'KHOOR'}, content_type='application/json'
+    )
+    assert b''.join(response.streaming_content).decode('utf-8') == 'HELLO'
+
+
+def test_caesar_cipher_view_post_stream_json_invalid_shift_after_text_status_code(client_django):
+    """Test that an invalid shift after the text is rejected before streaming starts."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    response = client_django.post(url, data={'text': 'HELLO', 'shift': 'invalid'}, content_type='application/json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_caesar_cipher_view_post_raw_declared_text_too_large_status_code(client_django):
+    """Test that a raw body declaring more than the text limit is rejected before it is read."""
+    url = reverse('eye-caesar-text')
+    response = client_django.post(
+        url, data=b'HELLO', content_type='application/octet-stream', CONTENT_LENGTH=str(MAX_TEXT_SIZE + 1)
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_caesar_cipher_view_post_stream_json_text_too_large_status_code(client_django):
+    """Test that a streamed text over the limit is rejected before the response starts."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    data = {'shift': 3, 'mode': 'encrypt', 'text': 'a' * (MAX_TEXT_SIZE + 1)}
+    response = client_django.post(url, data=data, content_type='application/json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_caesar_cipher_view_post_stream_json_text_within_limit_is_streamed(client_django, monkeypatch):
+    """Test that a body that cannot hold an oversized text is parsed as a stream."""
+    streamed = []
+    init = parsers.StreamedObject.__init__
+    monkeypatch.setattr(parsers.StreamedObject, '__init__', lambda self, *args: streamed.append(init(self, *args)))
+    url = reverse('eye-caesar-text') + '?stream=1'
+    response = client_django.post(url, data={'shift': 3, 'text': 'HELLO'}, content_type='application/json')
+    assert b''.join(response.streaming_content) == b'KHOOR' and streamed
+
@@ -0,0 +1,39 @@
+from django.urls import reverse
+
+from rest_framework import status
+
+from backend.utils.caesar_cipher import caesar_cipher
+
+
+CIPHERTEXT = caesar_cipher(
+    "It was the best of times, it was the worst of times, it was the age of wisdom.", 5
+)
+
+
+def test_caesar_crack_view_post_valid_status_code(client_django):
+    """Test the status code for a valid crack request."""
+    url = reverse('eye-caesar-crack')
+    response = client_django.post(url, data={'text': CIPHERTEXT})
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_caesar_crack_view_post_valid_response_data(client_django):
+    """Test that the best ranked candidate is the encryption shift."""
+    url = reverse('eye-caesar-crack')
+    response = client_django.post(url, data={'text': CIPHERTEXT, 'top': 3})
+    candidates = response.json()['candidates']
+    assert len(candidates) == 3 and candidates[0]['shift'] == 5
+
+
+def test_caesar_crack_view_post_invalid_top_status_code(client_django):
+    """Test the status code for a non-integer top value."""
+    url = reverse('eye-caesar-crack')
+    response = client_django.post(url, data={'text': CIPHERTEXT, 'top': 'invalid'})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_caesar_crack_view_post_non_string_text_status_code(client_django):
+    """Test the status code for a text that is not a string."""
+    url = reverse('eye-caesar-crack')
+    response = client_django.post(url, data={'text': 123}, content_type='application/json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
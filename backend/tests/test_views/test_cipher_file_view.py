@@ -0,0 +1,79 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+from rest_framework import status
+
+from backend.utils.caesar_cipher import caesar_cipher
+from backend.utils.vigenere_cipher import vigenere_cipher
+
+
+def upload(name, text):
+    """Returns an uploadable UTF-8 text file"""
+
+    return SimpleUploadedFile(name, text.encode('utf-8'), content_type='text/plain')
+
+
+def test_cipher_file_view_post_caesar_status_code(client_django):
+    """Test the status code for a valid Caesar file upload."""
+    url = reverse('eye-cipher-file')
+    response = client_django.post(url, data={'file': upload('a.txt', 'HELLO'), 'shift': 3})
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_cipher_file_view_post_caesar_response_data(client_django):
+    """Test that the download holds the Caesar ciphertext."""
+    url = reverse('eye-cipher-file')
+    response = client_django.post(url, data={'file': upload('a.txt', 'HELLO'), 'shift': 3})
+    assert b''.join(response.streaming_content) == b'KHOOR'
+
+
+def test_cipher_file_view_post_attachment_header(client_django):
+    """Test that the result is sent as a download named after the upload."""
+    url = reverse('eye-cipher-file')
+    response = client_django.post(url, data={'file': upload('secret.txt', 'HELLO')})
+    assert response['Content-Disposition'] == 'attachment; filename="secret.txt"'
+
+
+def test_cipher_file_view_post_vigenere_response_data(client_django):
+    """Test that the download holds the Vigenère ciphertext."""
+    url = reverse('eye-cipher-file')
+    text = 'Attack at dawn, wörld!'
+    response = client_django.post(url, data={'file': upload('a.txt', text), 'cipher': 'vigenere', 'key': 'LEMON'})
+    assert b''.join(response.streaming_content).decode('utf-8') == vigenere_cipher(text, 'LEMON')
+
+
+def test_cipher_file_view_post_spooled_upload_response_data(client_django, settings):
+    """Test that an upload spooled to a temporary file is ciphered from disk."""
+    settings.FILE_UPLOAD_MAX_MEMORY_SIZE = 1024
+    url = reverse('eye-cipher-file')
+    text = 'Hello, World! ' * 200000
+    response = client_django.post(url, data={'file': upload('a.txt', text), 'shift': 5, 'mode': 'decrypt'})
+    assert b''.join(response.streaming_content).decode('utf-8') == caesar_cipher(text, 5, 'decrypt')
+
+
+def test_cipher_file_view_post_missing_file_status_code(client_django):
+    """Test the status code for a request without a file."""
+    url = reverse('eye-cipher-file')
+    response = client_django.post(url, data={'shift': 3})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_cipher_file_view_post_unknown_cipher_response_data(client_django):
+    """Test the response data for an unknown cipher."""
+    url = reverse('eye-cipher-file')
+    response = client_django.post(url, data={'file': upload('a.txt', 'HELLO'), 'cipher': 'enigma'})
+    assert response.json() == {"error": "Unknown cipher: 'enigma'."}
+
+
+def test_cipher_file_view_post_missing_key_status_code(client_django):
+    """Test the status code for a Vigenère upload without a key."""
+    url = reverse('eye-cipher-file')
+    response = client_django.post(url, data={'file': upload('a.txt', 'HELLO'), 'cipher': 'vigenere'})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_cipher_file_view_post_invalid_shift_status_code(client_django):
+    """Test the status code for an invalid shift."""
+    url = reverse('eye-cipher-file')
+    response = client_django.post(url, data={'file': upload('a.txt', 'HELLO'), 'shift': 'invalid'})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,122 @@
+import gzip
+import json
+import zlib
+
+from django.urls import reverse
+
+from rest_framework import status
+
+from backend.limits import MAX_REQUEST_BODY_SIZE
+from backend.utils.caesar_cipher import caesar_cipher
+
+
+def post_gzip(client, url, body, content_type='application/json', **extra):
+    """Posts a gzip compressed body"""
+
+    return client.post(url, data=gzip.compress(body), content_type=content_type, HTTP_CONTENT_ENCODING='gzip', **extra)
+
+
+def test_gzip_request_response_data(client_django):
+    """Test that a gzip compressed JSON request is inflated before parsing."""
+    url = reverse('eye-caesar-text')
+    response = post_gzip(client_django, url, json.dumps({'text': 'HELLO', 'shift': 3}).encode())
+    assert response.json() == {"result": "KHOOR"}
+
+
+def test_deflate_request_response_data(client_django):
+    """Test that a deflate compressed JSON request is inflated before parsing."""
+    url = reverse('eye-vigenere-text')
+    body = zlib.compress(json.dumps({'text': 'HELLO', 'key': 'KEY'}).encode())
+    response = client_django.post(url, data=body, content_type='application/json', HTTP_CONTENT_ENCODING='deflate')
+    assert response.json() == {"result": "RIJVS"}
+
+
+def test_gzip_raw_request_inflates_past_content_length(client_django):
+    """Test that a raw body longer than its compressed Content-Length is read whole."""
+    url = reverse('eye-caesar-text') + '?shift=3'
+    text = b'HELLO WORLD ' * 100000
+    response = post_gzip(client_django, url, text, content_type='application/octet-stream')
+    assert response.content == caesar_cipher(text.decode(), 3).encode()
+
+
+def test_gzip_ndjson_request_response_data(client_django):
+    """Test that a gzip compressed NDJSON batch is inflated line by line."""
+    url = reverse('eye-batch')
+    body = b'{"operation": "caesar-cipher", "text": "HELLO"}\n' * 3
+    response = post_gzip(client_django, url, body, content_type='application/x-ndjson')
+    lines = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+    assert [line['result'] for line in lines] == ['KHOOR'] * 3
+
+
+def test_gzip_stream_request_response_data(client_django):
+    """Test that a compressed JSON body can be streamed into the cipher."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    text = 'Hello, World! ' * 20000
+    response = post_gzip(client_django, url, json.dumps({'shift': 3, 'text': text}).encode())
+    assert b''.join(response.streaming_content).decode() == caesar_cipher(text, 3)
+
+
+def test_gzip_bomb_status_code(client_django):
+    """Test that a body inflating past the limit is rejected with 413."""
+    url = reverse('eye-caesar-text')
+    body = b'{"text": "' + b'a' * (MAX_REQUEST_BODY_SIZE + 1) + b'"}'
+    response = post_gzip(client_django, url, body)
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+def test_malformed_gzip_status_code(client_django):
+    """Test that a body that is not valid gzip is rejected with 400."""
+    url = reverse('eye-caesar-text')
+    response = client_django.post(url, data=b'not gzip', content_type='application/octet-stream', HTTP_CONTENT_ENCODING='gzip')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_unsupported_content_encoding_status_code(client_django):
+    """Test that an unknown Content-Encoding is rejected with 415."""
+    url = reverse('eye-caesar-text')
+    response = client_django.post(url, data=b'HELLO', content_type='text/plain', HTTP_CONTENT_ENCODING='br')
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
+def test_compressed_multipart_status_code(client_django):
+    """Test that a compressed multipart body is rejected with 415."""
+    url = reverse('eye-caesar-text')
+    response = client_django.post(
+        url, data=gzip.compress(b'--x--'), content_type='multipart/form-data; boundary=x', HTTP_CONTENT_ENCODING='gzip'
+    )
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
+def test_large_response_is_gzipped(client_django):
+    """Test that a large response is gzipped when the client accepts it."""
+    url = reverse('eye-caesar-text')
+    response = client_django.post(
+        url, data={'text': 'HELLO ' * 1000}, content_type='application/json', HTTP_ACCEPT_ENCODING='gzip'
+    )
+    assert response['Content-Encoding'] == 'gzip'
+
+
+def test_large_response_gzip_round_trip(client_django):
+    """Test that a gzipped response inflates to the plain response."""
+    url = reverse('eye-caesar-text')
+    response = client_django.post(
+        url, data={'text': 'HELLO ' * 1000}, content_type='application/json', HTTP_ACCEPT_ENCODING='gzip'
+    )
+    assert json.loads(gzip.decompress(response.content)) == {"result": "KHOOR " * 1000}
+
+
+def test_small_response_is_not_gzipped(client_django):
+    """Test that a response under the threshold is sent uncompressed."""
+    url = reverse('eye-caesar-text')
+    response = client_django.post(url, data={'text': 'HELLO'}, content_type='application/json', HTTP_ACCEPT_ENCODING='gzip')
+    assert not response.has_header('Content-Encoding')
+
+
+def test_streamed_response_gzip_round_trip(client_django):
+    """Test that a streamed response is gzipped chunk by chunk."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    text = 'Hello, World! ' * 20000
+    response = client_django.post(
+        url, data={'shift': 3, 'text': text}, content_type='application/json', HTTP_ACCEPT_ENCODING='gzip'
+    )
+    assert gzip.decompress(b''.join(response.streaming_content)).decode() == caesar_cipher(text, 3)
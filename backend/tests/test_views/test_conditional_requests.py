@@ -0,0 +1,173 @@
+from django.urls import reverse
+
+from rest_framework import status
+
+
+def post_json(client, url_name, data, **headers):
+    return client.post(reverse(url_name), data=data, content_type='application/json', headers=headers)
+
+
+def test_caesar_cipher_view_sets_etag(client_django):
+    """Test that a Caesar result carries a strong ETag."""
+    response = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3})
+    assert response['ETag'].startswith('"caesar-')
+
+
+def test_caesar_cipher_view_etag_is_stable(client_django):
+    """Test that the same input gets the same ETag."""
+    etags = {post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3})['ETag'] for _ in range(2)}
+    assert len(etags) == 1
+
+
+def test_caesar_cipher_view_etag_normalises_shift(client_django):
+    """Test that equivalent shifts share an ETag."""
+    first = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3, 'mode': 'decrypt'})
+    second = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 23})
+    assert first['ETag'] == second['ETag']
+
+
+def test_caesar_cipher_view_etag_depends_on_text(client_django):
+    """Test that different texts get different ETags."""
+    first = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3})
+    second = post_json(client_django, 'eye-caesar-text', {'text': 'WORLD', 'shift': 3})
+    assert first['ETag'] != second['ETag']
+
+
+def test_caesar_cipher_view_if_none_match_status_code(client_django):
+    """Test that a matching If-None-Match gets 304."""
+    etag = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3})['ETag']
+    response = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3}, **{'If-None-Match': etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_caesar_cipher_view_if_none_match_empty_body(client_django):
+    """Test that a 304 carries no body."""
+    etag = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3})['ETag']
+    response = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3}, **{'If-None-Match': etag})
+    assert response.content == b''
+
+
+def test_caesar_cipher_view_if_none_match_keeps_etag(client_django):
+    """Test that a 304 repeats the ETag."""
+    etag = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3})['ETag']
+    response = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3}, **{'If-None-Match': etag})
+    assert response['ETag'] == etag
+
+
+def test_caesar_cipher_view_if_none_match_skips_cipher(client_django, monkeypatch):
+    """Test that a 304 is answered without running the cipher."""
+    etag = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3})['ETag']
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cipher ran")
+
+    monkeypatch.setattr('backend.views.cached_caesar_cipher', fail)
+    response = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3}, **{'If-None-Match': etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_caesar_cipher_view_if_none_match_weak_tag(client_django):
+    """Test that the weak form of the ETag, as left by gzip, still matches."""
+    etag = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3})['ETag']
+    response = post_json(
+        client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3}, **{'If-None-Match': f'"other", W/{etag}'},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_caesar_cipher_view_if_none_match_star(client_django):
+    """Test that If-None-Match: * gets 304."""
+    response = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3}, **{'If-None-Match': '*'})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_caesar_cipher_view_if_none_match_stale(client_django):
+    """Test that a stale ETag gets the full result."""
+    etag = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3})['ETag']
+    response = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 4}, **{'If-None-Match': etag})
+    assert response.json() == {"result": "LIPPS"}
+
+
+def test_caesar_cipher_view_stream_has_no_etag(client_django):
+    """Test that streamed results are not tagged."""
+    url = reverse('eye-caesar-text') + '?stream=1'
+    response = client_django.post(url, data={'shift': 3, 'text': 'HELLO'}, content_type='application/json')
+    assert not response.has_header('ETag')
+
+
+def test_caesar_cipher_view_raw_if_none_match(client_django):
+    """Test that raw mode answers If-None-Match too."""
+    url = reverse('eye-caesar-text') + '?shift=3'
+    etag = client_django.post(url, data=b'HELLO', content_type='application/octet-stream')['ETag']
+    response = client_django.post(
+        url, data=b'HELLO', content_type='application/octet-stream', headers={'If-None-Match': etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_caesar_cipher_view_raw_etag_differs_from_json(client_django):
+    """Test that the raw and JSON representations get different ETags."""
+    raw = client_django.post(reverse('eye-caesar-text') + '?shift=3', data=b'HELLO', content_type='text/plain')
+    json = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3})
+    assert raw['ETag'] != json['ETag']
+
+
+def test_vigenere_cipher_view_if_none_match(client_django):
+    """Test that the Vigenère view answers If-None-Match with 304."""
+    data = {'text': 'ATTACKATDAWN', 'key': 'LEMON'}
+    etag = post_json(client_django, 'eye-vigenere-text', data)['ETag']
+    response = post_json(client_django, 'eye-vigenere-text', data, **{'If-None-Match': etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_vigenere_cipher_view_etag_depends_on_mode(client_django):
+    """Test that encrypting and decrypting get different ETags."""
+    first = post_json(client_django, 'eye-vigenere-text', {'text': 'ATTACK', 'key': 'LEMON'})
+    second = post_json(client_django, 'eye-vigenere-text', {'text': 'ATTACK', 'key': 'LEMON', 'mode': 'decrypt'})
+    assert first['ETag'] != second['ETag']
+
+
+def test_vigenere_cipher_view_raw_if_none_match(client_django):
+    """Test that Vigenère raw mode answers If-None-Match with 304."""
+    url = reverse('eye-vigenere-text') + '?key=LEMON'
+    etag = client_django.post(url, data='ATTACK', content_type='text/plain')['ETag']
+    response = client_django.post(url, data='ATTACK', content_type='text/plain', headers={'If-None-Match': etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_caesar_cipher_async_view_if_none_match(client_django):
+    """Test that the async Caesar view answers If-None-Match with 304."""
+    etag = post_json(client_django, 'eye-async-caesar-text', {'text': 'HELLO', 'shift': 3})['ETag']
+    response = post_json(client_django, 'eye-async-caesar-text', {'text': 'HELLO', 'shift': 3}, **{'If-None-Match': etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_vigenere_cipher_async_view_if_none_match(client_django):
+    """Test that the async Vigenère view answers If-None-Match with 304."""
+    data = {'text': 'ATTACKATDAWN', 'key': 'LEMON'}
+    etag = post_json(client_django, 'eye-async-vigenere-text', data)['ETag']
+    response = post_json(client_django, 'eye-async-vigenere-text', data, **{'If-None-Match': etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_caesar_cipher_view_etag_depends_on_renderer(client_django):
+    """Test that the JSON and browsable API bodies of one input get different ETags."""
+    first = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3}, Accept='application/json')
+    second = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3}, Accept='text/html')
+    assert first['ETag'] != second['ETag']
+
+
+def test_caesar_cipher_view_json_etag_does_not_match_html(client_django):
+    """Test that the ETag of the JSON body gets no 304 for an HTML request."""
+    etag = post_json(client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3}, Accept='application/json')['ETag']
+    response = post_json(
+        client_django, 'eye-caesar-text', {'text': 'HELLO', 'shift': 3}, Accept='text/html', **{'If-None-Match': etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_vigenere_cipher_view_varies_on_accept(client_django):
+    """Test that a Vigenère result varies on Accept."""
+    response = post_json(client_django, 'eye-vigenere-text', {'text': 'HELLO', 'key': 'KEY'})
+    assert 'Accept' in response['Vary']
+
@@ -212,3 +212,10 @@ def test_generator_view_options_request_response_data(client_django):
     url = reverse('eye-django-gen')
     response = client_django.options(url)
     assert 'name' in response.data  # Assuming the response contains metadata about the endpoint
+
+
+def test_generator_view_post_keys_differ(client_django):
+    """Test that consecutive requests get different keys."""
+    url = reverse('eye-django-gen')
+    keys = {client_django.post(url).json()['key'] for _ in range(5)}
+    assert len(keys) == 5
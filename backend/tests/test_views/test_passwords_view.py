@@ -0,0 +1,64 @@
+from django.urls import reverse
+
+from rest_framework import status
+
+from backend.limits import MAX_PASSWORD_COUNT
+from backend.utils.passwords import AMBIGUOUS_CHARS, DIGIT_CHARS
+
+
+def post_passwords(client, data):
+    return client.post(reverse('eye-passwords'), data=data, content_type='application/json')
+
+
+def test_passwords_view_post_default(client_django):
+    """Test that the default is one password of 16 characters."""
+    response = post_passwords(client_django, {})
+    assert [len(password) for password in response.json()['passwords']] == [16]
+
+
+def test_passwords_view_post_count_and_length(client_django):
+    """Test that count passwords of the given length are returned."""
+    response = post_passwords(client_django, {'count': 50, 'length': 24})
+    assert {len(password) for password in response.json()['passwords']} == {24}
+
+
+def test_passwords_view_post_min_digits(client_django):
+    """Test that the passwords meet the minimum number of digits."""
+    response = post_passwords(client_django, {'count': 100, 'length': 8, 'min_digits': 5})
+    assert all(sum(char in DIGIT_CHARS for char in password) >= 5 for password in response.json()['passwords'])
+
+
+def test_passwords_view_post_exclude_ambiguous(client_django):
+    """Test that exclude_ambiguous leaves out the ambiguous characters."""
+    response = post_passwords(client_django, {'count': 100, 'length': 32, 'exclude_ambiguous': 'true'})
+    assert not set(''.join(response.json()['passwords'])) & set(AMBIGUOUS_CHARS)
+
+
+def test_passwords_view_post_count_exceeds_limit(client_django):
+    """Test that a count past the limit is rejected."""
+    response = post_passwords(client_django, {'count': MAX_PASSWORD_COUNT + 1})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_passwords_view_post_count_zero(client_django):
+    """Test that a count of zero is rejected."""
+    response = post_passwords(client_django, {'count': 0})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_passwords_view_post_impossible_policy(client_django):
+    """Test that minimums adding up past the length are rejected."""
+    response = post_passwords(client_django, {'length': 4, 'min_digits': 4, 'min_upper': 1})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_passwords_view_post_wrong_exclude_type(client_django):
+    """Test that a non-string exclude is rejected."""
+    response = post_passwords(client_django, {'exclude': 5})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_passwords_view_get(client_django):
+    """Test that GET is not allowed."""
+    response = client_django.get(reverse('eye-passwords'))
+    assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
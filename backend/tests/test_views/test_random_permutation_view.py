@@ -0,0 +1,113 @@
+from django.urls import reverse
+
+from rest_framework import status
+
+from backend.limits import MAX_NUM_COUNT
+
+
+def post_json(client, data, query=''):
+    return client.post(reverse('eye-random-permutation') + query, data=data, content_type='application/json')
+
+
+def test_random_permutation_view_post_values_are_permutation(client_django):
+    """Test that a small range comes back as a permutation of itself."""
+    response = post_json(client_django, {'min_value': 1, 'max_value': 100})
+    assert sorted(response.json()['values']) == list(range(1, 101))
+
+
+def test_random_permutation_view_post_returns_key(client_django):
+    """Test that a generated key is returned as hex."""
+    response = post_json(client_django, {'min_value': 1, 'max_value': 100})
+    assert len(bytes.fromhex(response.json()['key'])) == 32
+
+
+def test_random_permutation_view_post_key_reproduces_order(client_django):
+    """Test that passing the key back gives the same permutation."""
+    first = post_json(client_django, {'min_value': 1, 'max_value': 100}).json()
+    second = post_json(client_django, {'min_value': 1, 'max_value': 100, 'key': first['key']}).json()
+    assert second['values'] == first['values']
+
+
+def test_random_permutation_view_post_index(client_django):
+    """Test that random access returns the element at that position."""
+    first = post_json(client_django, {'min_value': 1, 'max_value': 100, 'key': 'ab' * 16}).json()
+    response = post_json(client_django, {'min_value': 1, 'max_value': 100, 'key': 'ab' * 16, 'index': 42})
+    assert response.json()['value'] == first['values'][42]
+
+
+def test_random_permutation_view_post_index_out_of_range(client_django):
+    """Test the status code for an index past the end of the range."""
+    response = post_json(client_django, {'min_value': 1, 'max_value': 100, 'index': 100})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_random_permutation_view_post_slice(client_django):
+    """Test that start and stop select positions of the permutation."""
+    first = post_json(client_django, {'min_value': 1, 'max_value': 100, 'key': 'ab' * 16}).json()
+    response = post_json(client_django, {'min_value': 1, 'max_value': 100, 'key': 'ab' * 16, 'start': 10, 'stop': 20})
+    assert response.json()['values'] == first['values'][10:20]
+
+
+def test_random_permutation_view_post_workers_disjoint(client_django):
+    """Test that worker shards are disjoint and cover the range."""
+    values = []
+    for worker in range(3):
+        data = {'min_value': 1, 'max_value': 100, 'key': 'ab' * 16, 'worker': worker, 'workers': 3}
+        values += post_json(client_django, data).json()['values']
+    assert sorted(values) == list(range(1, 101))
+
+
+def test_random_permutation_view_post_huge_range(client_django):
+    """Test that a range of 2 ** 64 values is served in constant memory."""
+    response = post_json(client_django, {'min_value': 0, 'max_value': 2 ** 64 - 1, 'stop': 1000})
+    assert len(set(response.json()['values'])) == 1000
+
+
+def test_random_permutation_view_post_default_stop_limited(client_django):
+    """Test that a huge range without stop returns at most MAX_NUM_COUNT values."""
+    response = post_json(client_django, {'min_value': 0, 'max_value': 2 ** 40, 'start': 5})
+    assert response.json()['stop'] == 5 + MAX_NUM_COUNT
+
+
+def test_random_permutation_view_post_too_many_values(client_django):
+    """Test the response data for a slice longer than MAX_NUM_COUNT."""
+    response = post_json(client_django, {'min_value': 0, 'max_value': 2 ** 40, 'stop': MAX_NUM_COUNT + 1})
+    assert response.json() == {"error": f"count cannot be more than {MAX_NUM_COUNT}"}
+
+
+def test_random_permutation_view_post_bad_slice(client_django):
+    """Test the status code for a stop before start."""
+    response = post_json(client_django, {'min_value': 1, 'max_value': 100, 'start': 20, 'stop': 10})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_random_permutation_view_post_bad_key(client_django):
+    """Test the status code for a key that is not hex."""
+    response = post_json(client_django, {'min_value': 1, 'max_value': 100, 'key': 'not hex'})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_random_permutation_view_post_missing_range(client_django):
+    """Test the response data when min_value is missing."""
+    response = post_json(client_django, {'max_value': 100})
+    assert response.json() == {"error": "min_value and max_value are required."}
+
+
+def test_random_permutation_view_post_stream_ndjson(client_django):
+    """Test that ?stream=1 streams the permutation as NDJSON."""
+    response = post_json(client_django, {'min_value': 1, 'max_value': 1000, 'key': 'ab' * 16}, '?stream=1')
+    streamed = [int(line) for line in b''.join(response.streaming_content).splitlines()]
+    first = post_json(client_django, {'min_value': 1, 'max_value': 1000, 'key': 'ab' * 16}).json()
+    assert streamed == first['values']
+
+
+def test_random_permutation_view_post_stream_key_header(client_django):
+    """Test that a streamed permutation names its key in a header."""
+    response = post_json(client_django, {'min_value': 1, 'max_value': 1000, 'key': 'ab' * 16}, '?stream=binary')
+    assert response['X-Permutation-Key'] == 'ab' * 16
+
+
+def test_random_permutation_view_get_status_code(client_django):
+    """Test that only POST is accepted."""
+    response = client_django.get(reverse('eye-random-permutation'))
+    assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
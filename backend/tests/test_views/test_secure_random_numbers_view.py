@@ -1,7 +1,11 @@
+import gzip
+
 from django.urls import reverse
 
 from rest_framework import status
 
+from backend.limits import MAX_SMALL_REQUEST_BODY_SIZE
+
 
 def test_secure_random_numbers_view_post_valid_status_code(client_django):
     """Test the status code for a valid POST request."""
@@ -356,3 +360,70 @@ def test_secure_random_numbers_view_post_invalid_data_response_data(client_djang
     response = client_django.post(url, data={'min_value': 'invalid', 'max_value': 'invalid', 'count': 'invalid', 'unique': 'invalid'})
     response_data = response.json()
     assert "error" in response_data
+
+
+def test_secure_random_numbers_view_post_stream_ndjson_content_type(client_django):
+    """Test that ?stream=1 streams NDJSON."""
+    url = reverse('eye-secure-numbers') + '?stream=1'
+    response = client_django.post(url, data={'min_value': 1, 'max_value': 10, 'count': 5, 'unique': False})
+    assert response['Content-Type'] == 'application/x-ndjson'
+
+
+def test_secure_random_numbers_view_post_stream_ndjson_lines(client_django):
+    """Test that the NDJSON stream has one number per line, within the range."""
+    url = reverse('eye-secure-numbers') + '?stream=ndjson'
+    response = client_django.post(url, data={'min_value': 1, 'max_value': 10, 'count': 20000, 'unique': False}, content_type='application/json')
+    numbers = [int(line) for line in b''.join(response.streaming_content).splitlines()]
+    assert len(numbers) == 20000 and all(1 <= number <= 10 for number in numbers)
+
+
+def test_secure_random_numbers_view_post_stream_count_above_list_limit(client_django):
+    """Test that streams may carry more numbers than a JSON list."""
+    url = reverse('eye-secure-numbers') + '?stream=binary'
+    response = client_django.post(url, data={'min_value': 1, 'max_value': 10, 'count': 200000, 'unique': False}, content_type='application/json')
+    assert len(b''.join(response.streaming_content)) == 200000 * 8
+
+
+def test_secure_random_numbers_view_post_stream_binary_values(client_django):
+    """Test that the binary stream holds little-endian int64 numbers."""
+    url = reverse('eye-secure-numbers') + '?stream=binary'
+    response = client_django.post(url, data={'min_value': -2 ** 40, 'max_value': -2 ** 40 + 99, 'count': 100})
+    body = b''.join(response.streaming_content)
+    numbers = [int.from_bytes(body[start:start + 8], 'little', signed=True) for start in range(0, len(body), 8)]
+    assert sorted(numbers) == list(range(-2 ** 40, -2 ** 40 + 100))
+
+
+def test_secure_random_numbers_view_post_stream_binary_out_of_int64(client_django):
+    """Test that binary streams refuse ranges past int64."""
+    url = reverse('eye-secure-numbers') + '?stream=binary'
+    response = client_django.post(url, data={'min_value': 1, 'max_value': 2 ** 70, 'count': 5})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_secure_random_numbers_view_post_stream_count_exceeds_limit(client_django):
+    """Test the response data for a streamed count above the stream limit."""
+    url = reverse('eye-secure-numbers') + '?stream=1'
+    response = client_django.post(url, data={'min_value': 1, 'max_value': 10, 'count': 10 ** 7 + 1, 'unique': False})
+    assert response.json() == {"error": "count cannot be more than 10000000"}
+
+
+def test_secure_random_numbers_view_post_stream_unique_range_too_small(client_django):
+    """Test that a unique stream over too small a range is refused up front."""
+    url = reverse('eye-secure-numbers') + '?stream=1'
+    response = client_django.post(url, data={'min_value': 1, 'max_value': 10, 'count': 20, 'unique': True})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_secure_random_numbers_view_post_inflated_body_too_large_status_code(client_django):
+    """Test that a gzip body inflating past the limit is rejected with 413."""
+    url = reverse('eye-secure-numbers')
+    body = b'{"min_value": 1, "max_value": 10, "pad": "' + b'a' * MAX_SMALL_REQUEST_BODY_SIZE + b'"}'
+    response = client_django.post(url, data=gzip.compress(body), content_type='application/json', HTTP_CONTENT_ENCODING='gzip')
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+def test_secure_random_numbers_view_post_malformed_json_status_code(client_django):
+    """Test that a body that is not valid JSON is rejected with 400."""
+    url = reverse('eye-secure-numbers')
+    response = client_django.post(url, data=b'{"min_value": 1,', content_type='application/json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,25 @@
+from django.urls import reverse
+
+from rest_framework import status
+
+
+def test_text_statistics_view_post_valid_status_code(client_django):
+    """Test the status code for a valid statistics request."""
+    url = reverse('eye-text-statistics')
+    response = client_django.post(url, data={'text': 'Hello, World!'})
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_text_statistics_view_post_valid_response_data(client_django):
+    """Test the counts returned for a short text."""
+    url = reverse('eye-text-statistics')
+    response = client_django.post(url, data={'text': 'Hello'})
+    response_data = response.json()
+    assert response_data['letters'] == 5 and response_data['bigrams'] == {'he': 1, 'el': 1, 'll': 1, 'lo': 1}
+
+
+def test_text_statistics_view_post_non_string_text_status_code(client_django):
+    """Test the status code for a text that is not a string."""
+    url = reverse('eye-text-statistics')
+    response = client_django.post(url, data={'text': 123}, content_type='application/json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,74 @@
+import json
+import uuid
+
+from django.urls import reverse
+
+from rest_framework import status
+
+
+def post_tokens(client, data):
+    return client.post(reverse('eye-tokens'), data=data, content_type='application/json')
+
+
+def read_tokens(response):
+    return [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+
+
+def test_tokens_view_post_default_django_key(client_django):
+    """Test that the default is one Django secret key."""
+    tokens = read_tokens(post_tokens(client_django, {}))
+    assert len(tokens) == 1 and len(tokens[0]) == 50
+
+
+def test_tokens_view_post_content_type(client_django):
+    """Test that tokens are streamed as NDJSON."""
+    response = post_tokens(client_django, {'format': 'hex', 'count': 5})
+    assert response['Content-Type'] == 'application/x-ndjson'
+
+
+def test_tokens_view_post_count(client_django):
+    """Test that count tokens are streamed."""
+    tokens = read_tokens(post_tokens(client_django, {'format': 'urlsafe', 'count': 20000}))
+    assert len(set(tokens)) == 20000
+
+
+def test_tokens_view_post_length(client_django):
+    """Test that length sets the size of the tokens."""
+    tokens = read_tokens(post_tokens(client_django, {'format': 'hex', 'count': 3, 'length': 8}))
+    assert {len(token) for token in tokens} == {16}
+
+
+def test_tokens_view_post_uuid7(client_django):
+    """Test that UUIDv7 tokens parse as version 7 UUIDs."""
+    tokens = read_tokens(post_tokens(client_django, {'format': 'uuid7', 'count': 3}))
+    assert {uuid.UUID(token).version for token in tokens} == {7}
+
+
+def test_tokens_view_post_unknown_format(client_django):
+    """Test the status code for an unknown format."""
+    response = post_tokens(client_django, {'format': 'base58'})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_tokens_view_post_count_too_large(client_django):
+    """Test the response data for a count above the limit."""
+    response = post_tokens(client_django, {'count': 10 ** 6 + 1})
+    assert response.json() == {"error": "count cannot be more than 1000000"}
+
+
+def test_tokens_view_post_count_zero(client_django):
+    """Test the response data for a count of 0."""
+    response = post_tokens(client_django, {'count': 0})
+    assert response.json() == {"error": "count cannot be less or equal 0"}
+
+
+def test_tokens_view_post_invalid_length(client_django):
+    """Test the status code for a length that is not a number."""
+    response = post_tokens(client_django, {'format': 'hex', 'length': 'long'})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_tokens_view_get_status_code(client_django):
+    """Test that only POST is accepted."""
+    response = client_django.get(reverse('eye-tokens'))
+    assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
@@ -2,6 +2,9 @@ from django.urls import reverse
 
 from rest_framework import status
 
+from backend.limits import MAX_REQUEST_BODY_SIZE, MAX_TEXT_SIZE
+from backend.utils.vigenere_cipher import vigenere_cipher
+
 
 def test_vigenere_cipher_view_post_valid_encrypt_status_code(client_django):
     """Test the status code for a valid POST request for encryption."""
@@ -205,3 +208,100 @@ def test_vigenere_cipher_view_with_allowany_permission_response_data(client_djan
     response = client_django.post(url, data={'text': 'HELLO', 'key': 'KEY', 'mode': 'encrypt'})
     response_data = response.json()
     assert response_data == {"result": "RIJVS"}
+
+
+def test_vigenere_cipher_view_post_stream_status_code(client_django):
+    """Test the status code for a POST request in streaming mode."""
+    url = reverse('eye-vigenere-text') + '?stream=1'
+    response = client_django.post(url, data={'text': 'HELLO', 'key': 'KEY', 'mode': 'encrypt'})
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_vigenere_cipher_view_post_stream_response_data(client_django):
+    """Test that the key phase is carried across streamed chunk boundaries."""
+    url = reverse('eye-vigenere-text') + '?stream=1'
+    text = 'Hello, World! ' * 10000
+    response = client_django.post(url, data={'text': text, 'key': 'LEMON'}, content_type='application/json')
+    assert b''.join(response.streaming_content).decode('utf-8') == vigenere_cipher(text, 'LEMON')
+
+
+def test_vigenere_cipher_view_post_stream_missing_key_status_code(client_django):
+    """Test the status code for a missing key in streaming mode."""
+    url = reverse('eye-vigenere-text') + '?stream=1'
+    response = client_django.post(url, data={'text': 'HELLO', 'mode': 'encrypt'})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_vigenere_cipher_view_post_stream_wrong_key_type_status_code(client_django):
+    """Test that a non-string key is rejected with 400 in streaming mode too."""
+    url = reverse('eye-vigenere-text') + '?stream=1'
+    response = client_django.post(url, data={'key': 5, 'text': 'HELLO'}, content_type='application/json')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_vigenere_cipher_view_post_declared_body_too_large_status_code(client_django):
+    """Test that a Content-Length over the limit is rejected with 413."""
+    url = reverse('eye-vigenere-text')
+    response = client_django.post(
+        url, data={'text': 'HELLO', 'key': 'KEY'}, content_type='application/json',
+        CONTENT_LENGTH=str(MAX_REQUEST_BODY_SIZE + 1),
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+def test_vigenere_cipher_view_post_raw_text_response_data(client_django):
+    """Test that a text/plain body is ciphered into a raw body."""
+    url = reverse('eye-vigenere-text') + '?key=KEY'
+    response = client_django.post(url, data='HELLO', content_type='text/plain')
+    assert response.content == b'RIJVS'
+
+
+def test_vigenere_cipher_view_post_raw_non_ascii_response_data(client_django):
+    """Test that non-ASCII characters advance the key once each in raw mode."""
+    url = reverse('eye-vigenere-text') + '?key=KEY'
+    text = 'héllo wörld'
+    response = client_django.post(url, data=text, content_type='text/plain; charset=utf-8')
+    assert response.content.decode('utf-8') == vigenere_cipher(text, 'KEY')
+
+
+def test_vigenere_cipher_view_post_raw_missing_key_status_code(client_django):
+    """Test that raw mode still requires a key."""
+    url = reverse('eye-vigenere-text')
+    response = client_django.post(url, data=b'HELLO', content_type='application/octet-stream')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_vigenere_cipher_view_post_stream_json_response_data(client_django):
+    """Test that a streamed JSON text field keeps the key phase across reads."""
+    url = reverse('eye-vigenere-text') + '?stream=1'
+    text = 'Attack at dawn, wörld! ' * 10000
+    response = client_django.post(url, data={'key': 'LEMON', 'text': text}, content_type='application/json')
+    assert b''.join(response.streaming_content).decode('utf-8') == vigenere_cipher(text, 'LEMON')
+
+
+def test_vigenere_cipher_view_post_stream_json_text_first_response_data(client_django):
+    """Test that key and mode sent after a streamed text still apply."""
+    url = reverse('eye-vigenere-text') + '?stream=1'
+    response = client_django.post(
+        url, data={'text': 'RIJVS', 'key': 'KEY', 'mode': 'decrypt'}, content_type='application/json'
+    )
+    assert b''.join(response.streaming_content).decode('utf-8') == 'HELLO'
+
+
+def test_vigenere_cipher_view_post_stream_json_text_last_response_data(client_django):
+    """Test that key and mode sent before a streamed text apply."""
+    url = reverse('eye-vigenere-text') + '?stream=1'
+    response = client_django.post(
+        url, data={'key': 'KEY', 'mode': 'decrypt', 'text': 'RIJVS'}, content_type='application/json'
+    )
+    assert b''.join(response.streaming_content).decode('utf-8') == 'HELLO'
+
+
+def test_vigenere_cipher_view_post_raw_declared_text_too_large_status_code(client_django):
+    """Test that a raw body declaring more than the text limit is rejected before it is read."""
+    url = reverse('eye-vigenere-text') + '?key=KEY'
+    response = client_django.post(
+        url, data=b'HELLO', content_type='application/octet-stream', CONTENT_LENGTH=str(MAX_TEXT_SIZE + 1)
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
@@ -0,0 +1,43 @@
+from django.urls import reverse
+
+from rest_framework import status
+
+from backend.utils.vigenere_cipher import vigenere_cipher
+from backend.utils.vigenere_crack import MAX_KEY_LENGTH
+from backend.tests.config.config_english_text import ENGLISH_TEXT
+
+
+def test_vigenere_crack_view_post_valid_status_code(client_django):
+    """Test the status code for a valid crack request."""
+    url = reverse('eye-vigenere-crack')
+    response = client_django.post(url, data={'text': vigenere_cipher(ENGLISH_TEXT, 'LEMON')})
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_vigenere_crack_view_post_valid_response_data(client_django):
+    """Test that the response holds the key and the decrypted text."""
+    url = reverse('eye-vigenere-crack')
+    response = client_django.post(url, data={'text': vigenere_cipher(ENGLISH_TEXT, 'LEMON')})
+    response_data = response.json()
+    assert response_data['candidates'][0]['key'] == 'LEMON' and response_data['result'] == ENGLISH_TEXT
+
+
+def test_vigenere_crack_view_post_invalid_max_key_length_status_code(client_django):
+    """Test the status code for an invalid max key length."""
+    url = reverse('eye-vigenere-crack')
+    response = client_django.post(url, data={'text': 'HELLO', 'max_key_length': 'invalid'})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_vigenere_crack_view_post_max_key_length_exceeds_limit_status_code(client_django):
+    """Test that a max key length over the limit is rejected."""
+    url = reverse('eye-vigenere-crack')
+    response = client_django.post(url, data={'text': 'HELLO', 'max_key_length': MAX_KEY_LENGTH + 1})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_vigenere_crack_view_post_max_key_length_zero_status_code(client_django):
+    """Test that a max key length of zero is rejected."""
+    url = reverse('eye-vigenere-crack')
+    response = client_django.post(url, data={'text': 'HELLO', 'max_key_length': 0})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
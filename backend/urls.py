@@ -1,10 +1,27 @@
 from django.urls import path
 
-from backend import views
+from backend import async_views, views
 
 urlpatterns = [
     path('eye_diskage/django-ker-generate/', views.generator_view, name='eye-django-gen'),
     path('eye_diskage/caesar-cipher/', views.caesar_cipher_view, name='eye-caesar-text'),
+    path('eye_diskage/caesar-crack/', views.caesar_crack_view, name='eye-caesar-crack'),
     path('eye_diskage/vigenere-cipher/', views.vigenere_cipher_view, name='eye-vigenere-text'),
+    path('eye_diskage/vigenere-crack/', views.vigenere_crack_view, name='eye-vigenere-crack'),
+    path('eye_diskage/text-statistics/', views.text_statistics_view, name='eye-text-statistics'),
     path('eye_diskage/secure-random-numbers/', views.secure_random_numbers_view, name='eye-secure-numbers'),
+    path('eye_diskage/passwords/', views.passwords_view, name='eye-passwords'),
+    path('eye_diskage/tokens/', views.tokens_view, name='eye-tokens'),
+    path('eye_diskage/random-permutation/', views.random_permutation_view, name='eye-random-permutation'),
+    path('eye_diskage/cipher-file/', views.cipher_file_view, name='eye-cipher-file'),
+    path('eye_diskage/batch/', views.batch_view, name='eye-batch'),
+    path('eye_diskage/cache-stats/', views.cache_stats_view, name='eye-cache-stats'),
+    path('eye_diskage/async/django-ker-generate/', async_views.generator_async_view, name='eye-async-django-gen'),
+    path('eye_diskage/async/caesar-cipher/', async_views.caesar_cipher_async_view, name='eye-async-caesar-text'),
+    path('eye_diskage/async/vigenere-cipher/', async_views.vigenere_cipher_async_view, name='eye-async-vigenere-text'),
+    path(
+        'eye_diskage/async/secure-random-numbers/',
+        async_views.secure_random_numbers_async_view,
+        name='eye-async-secure-numbers',
+    ),
 ]
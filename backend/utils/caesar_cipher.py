@@ -1,31 +1,87 @@
+from backend.utils.shift_tables import ALPHABET_SIZE, BYTE_SHIFT_TABLES, SHIFT_TABLES
+
+
+# Bytes of a bytearray translated per step when ciphering it in place
+IN_PLACE_CHUNK_SIZE = 64 * 1024
+
+
 def caesar_cipher(text, shift, mode='encrypt'):
     """
     Encrypts or decrypts a text using the Caesar cipher.
 
+    Only the Latin letters A-Z and a-z are shifted; all other characters,
+    including non-ASCII letters, are left unchanged.
+
     :param text: The input text to be encrypted or decrypted.
     :param shift: The number of positions to shift each character.
     :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
     :return: The encrypted or decrypted text.
     """
-    result = ""
     shift = int(shift)
 
+    if not isinstance(text, str):
+        raise TypeError(f"text must be a string, not {type(text).__name__}")
+
     # Determine the shift direction based on the mode
     if mode == 'decrypt':
         shift = -shift
 
-    # Iterate over each character in the text
-    for char in text:
-        # Check if the character is an uppercase letter
-        if char.isupper():
-            # Shift the character and wrap around using modulo 26
-            result += chr((ord(char) + shift - 65) % 26 + 65)
-        # Check if the character is a lowercase letter
-        elif char.islower():
-            # Shift the character and wrap around using modulo 26
-            result += chr((ord(char) + shift - 97) % 26 + 97)
-        else:
-            # If it's not a letter, leave it unchanged
-            result += char
-
-    return result
+    shift %= ALPHABET_SIZE
+
+    # Pure ASCII takes CPython's fast str.translate path
+    if text.isascii():
+        return text.translate(SHIFT_TABLES[shift])
+
+    # Otherwise translate the UTF-8 bytes: multi-byte sequences never use
+    # bytes below 0x80, so only ASCII letters move and every other letter
+    # (É, ß, Ω, ...) is left as it is
+    data = text.encode('utf-8', 'surrogatepass')
+    return data.translate(BYTE_SHIFT_TABLES[shift]).decode('utf-8', 'surrogatepass')
+
+
+def caesar_cipher_bytes(data, shift, mode='encrypt'):
+    """
+    Encrypts or decrypts UTF-8 or ASCII bytes using the Caesar cipher.
+
+    Bytes above 0x7f are never touched, so any ASCII compatible encoding,
+    or arbitrary binary data, keeps every byte that is not a Latin letter.
+    A bytearray is ciphered in place, one slice at a time, and returned as
+    it is, so no second buffer of its size is made.
+
+    :param data: The bytes or bytearray holding the text.
+    :param shift: The number of positions to shift each letter.
+    :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
+    :return: The encrypted or decrypted bytes, of the same type as data.
+    """
+    shift = int(shift)
+
+    if not isinstance(data, (bytes, bytearray)):
+        raise TypeError(f"data must be bytes, not {type(data).__name__}")
+
+    if mode == 'decrypt':
+        shift = -shift
+
+    table = BYTE_SHIFT_TABLES[shift % ALPHABET_SIZE]
+    if isinstance(data, bytes):
+        return data.translate(table)
+
+    for start in range(0, len(data), IN_PLACE_CHUNK_SIZE):
+        stop = start + IN_PLACE_CHUNK_SIZE
+        data[start:stop] = data[start:stop].translate(table)
+    return data
+
+
+def caesar_cipher_chunks(chunks, shift, mode='encrypt'):
+    """
+    Encrypts or decrypts an iterable of text chunks using the Caesar cipher.
+
+    The shift is validated before the first chunk is read, so errors surface
+    before any output is produced.
+
+    :param chunks: An iterable of text chunks.
+    :param shift: The number of positions to shift each character.
+    :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
+    :return: A generator of encrypted or decrypted chunks.
+    """
+    shift = int(shift)
+    return (caesar_cipher(chunk, shift, mode) for chunk in chunks)
@@ -0,0 +1,69 @@
+import math
+
+from backend.utils.caesar_cipher import caesar_cipher
+from backend.utils.letter_frequency import ENGLISH_LETTER_FREQUENCIES, letter_histogram, rotate_histogram
+from backend.utils.shift_tables import ALPHABET_SIZE
+
+
+PREVIEW_LENGTH = 80
+
+_LOG_FREQUENCIES = tuple(math.log(frequency) for frequency in ENGLISH_LETTER_FREQUENCIES)
+
+
+def score_histogram(histogram):
+    """
+    Score a plaintext letter histogram against English.
+
+    :param histogram: A list of 26 letter counts.
+    :return: A (chi_squared, log_likelihood) tuple; lower chi-squared and
+        higher log-likelihood mean more English-like.
+    """
+    total = sum(histogram)
+    if total == 0:
+        return 0.0, 0.0
+
+    chi_squared = 0.0
+    log_likelihood = 0.0
+    for count, frequency, log_frequency in zip(histogram, ENGLISH_LETTER_FREQUENCIES, _LOG_FREQUENCIES):
+        expected = total * frequency
+        chi_squared += (count - expected) ** 2 / expected
+        log_likelihood += count * log_frequency
+
+    return chi_squared, log_likelihood
+
+
+def crack_caesar(text, top=ALPHABET_SIZE, preview_length=PREVIEW_LENGTH):
+    """
+    Rank every Caesar shift by how English the decrypted text would be.
+
+    The letter histogram is computed once; each candidate shift only rotates
+    it, so the text itself is read once plus one short preview per candidate.
+
+    :param text: The ciphertext to crack.
+    :param top: How many of the best candidates to return (default is all 26).
+    :param preview_length: How many characters of each decryption to include.
+    :return: A list of dicts with 'shift', 'chi_squared', 'log_likelihood'
+        and 'preview', best candidate first.
+    """
+    if not isinstance(text, str):
+        raise TypeError(f"text must be a string, not {type(text).__name__}")
+
+    histogram = letter_histogram(text)
+
+    candidates = []
+    for shift in range(ALPHABET_SIZE):
+        chi_squared, log_likelihood = score_histogram(rotate_histogram(histogram, shift))
+        candidates.append({
+            'shift': shift,
+            'chi_squared': round(chi_squared, 4),
+            'log_likelihood': round(log_likelihood, 4),
+        })
+
+    candidates.sort(key=lambda candidate: (candidate['chi_squared'], -candidate['log_likelihood']))
+    candidates = candidates[:max(int(top), 0)]
+
+    sample = text[:preview_length]
+    for candidate in candidates:
+        candidate['preview'] = caesar_cipher(sample, candidate['shift'], mode='decrypt')
+
+    return candidates
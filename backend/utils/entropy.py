@@ -0,0 +1,302 @@
+import os
+import threading
+import weakref
+from array import array
+from collections import deque
+
+
+# Bytes fetched from the OS RNG per refill
+ENTROPY_BLOCK_SIZE = 64 * 1024  # 64 KB
+
+# Array typecodes of unsigned machine words, by width in bytes
+_WORD_TYPECODES = {array(code).itemsize: code for code in 'QLIHB'}
+
+_WORD64_RANGE = 1 << 64
+_WORD64_MASK = _WORD64_RANGE - 1
+
+
+# Secret keys are drawn like Django's get_random_secret_key
+SECRET_KEY_CHARS = 'abcdefghijklmnopqrstuvwxyz0123456789!@#$%^&*(-_=+)'
+SECRET_KEY_LENGTH = 50
+# Ready-made secret keys kept per process
+SECRET_KEY_QUEUE_SIZE = 256
+
+# Every live buffer and key queue, so a forked child can empty them all
+_holders = weakref.WeakSet()
+
+
+def _discard_all():
+    for holder in list(_holders):
+        holder._discard()
+
+
+os.register_at_fork(after_in_child=_discard_all)
+
+
+def _wipe(block):
+    """Overwrites a bytearray with zeros in place"""
+
+    block[:] = bytes(len(block))
+
+
+class _Refiller:
+    """
+    Runs fill on a daemon thread whenever request() is called.
+
+    The thread is started on the first request, and again on the first
+    request after a fork, since threads do not survive one.
+    """
+
+    def __init__(self, fill, name):
+        self._fill = fill
+        self._name = name
+        self.reset()
+
+    def reset(self):
+        self._wanted = threading.Event()
+        self._start_lock = threading.Lock()
+        self._thread = None
+
+    def request(self):
+        self._wanted.set()
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wanted.wait()
+            self._wanted.clear()
+            try:
+                self._fill()
+            except Exception:
+                # The foreground falls back to filling synchronously
+                pass
+
+
+def _word_size(bound):
+    """Returns the smallest array word width, in bytes, holding values below bound; None past 64 bits"""
+
+    needed = max(1, ((bound - 1).bit_length() + 7) // 8)
+    return next((size for size in sorted(_WORD_TYPECODES) if size >= needed), None)
+
+
+class EntropyBuffer:
+    """
+    Random bytes and integers served from large blocks of OS entropy.
+
+    secrets.randbelow makes a trip to the OS RNG for every number; this
+    buffer fetches ENTROPY_BLOCK_SIZE bytes at a time and hands them out,
+    so tens of thousands of numbers cost a handful of syscalls. Integers are
+    mapped to their range by rejection sampling, so they stay unbiased.
+
+    With background set, a daemon thread fetches the next block while the
+    current one is being used, so requests rarely wait on the OS. Bytes are
+    zeroed in the buffer as they are handed out, and the buffer is emptied
+    in a forked child, so processes never share entropy. It is safe to use
+    from several threads.
+    """
+
+    def __init__(self, block_size=ENTROPY_BLOCK_SIZE, source=os.urandom, background=False):
+        self.block_size = block_size
+        self.source = source
+        self._lock = threading.Lock()
+        self._block = bytearray()
+        self._position = 0
+        self._spare = None
+        self._refiller = _Refiller(self._refill_spare, 'entropy-refill') if background else None
+        _holders.add(self)
+
+    def _discard(self):
+        self._lock = threading.Lock()
+        _wipe(self._block)
+        if self._spare is not None:
+            _wipe(self._spare)
+        self._block = bytearray()
+        self._position = 0
+        self._spare = None
+        if self._refiller is not None:
+            self._refiller.reset()
+
+    def _refill_spare(self):
+        block = bytearray(self.source(self.block_size))
+        with self._lock:
+            if self._spare is None:
+                self._spare, block = block, None
+        if block is not None:
+            _wipe(block)
+
+    def _next_block(self):
+        """Returns the spare block, or a freshly read one; called with the lock held"""
+
+        block, self._spare = self._spare, None
+        if block is None:
+            block = bytearray(self.source(self.block_size))
+        if self._refiller is not None:
+            self._refiller.request()
+        return block
+
+    def token_bytes(self, size):
+        """Returns size random bytes"""
+
+        if size >= self.block_size:
+            return self.source(size)
+
+        with self._lock:
+            if self._position + size > len(self._block):
+                _wipe(self._block)
+                self._block = self._next_block()
+                self._position = 0
+            start = self._position
+            self._position += size
+            data = bytes(self._block[start:self._position])
+            self._block[start:self._position] = bytes(size)
+            return data
+
+    def randbelow(self, bound):
+        """
+        Return a random integer in [0, bound), like secrets.randbelow.
+
+        :param bound: The exclusive upper bound, a positive integer.
+        :return: A uniform random integer.
+        """
+        if bound <= 0:
+            raise ValueError("Upper bound must be positive.")
+
+        size = ((bound - 1).bit_length() + 7) // 8
+        # The largest multiple of bound that size bytes can hold; words at
+        # or past it would favour the low residues
+        limit = (1 << (8 * size)) // bound * bound
+        while True:
+            word = int.from_bytes(self.token_bytes(size), 'little')
+            if word < limit:
+                return word % bound
+
+    def randbelow_many(self, bound, count):
+        """
+        Return count independent random integers in [0, bound).
+
+        Entropy is read as an array of machine words in one block; rejected
+        words are topped up with a smaller block until count are accepted.
+
+        :param bound: The exclusive upper bound, a positive integer.
+        :param count: The number of integers.
+        :return: A list of uniform random integers.
+        """
+        if bound <= 0:
+            raise ValueError("Upper bound must be positive.")
+
+        size = _word_size(bound)
+        if size is None:
+            return [self.randbelow(bound) for _ in range(count)]
+
+        limit = (1 << (8 * size)) // bound * bound
+        acceptance = limit / (1 << (8 * size))
+
+        numbers = []
+        while len(numbers) < count:
+            missing = count - len(numbers)
+            # Ask for enough words that one round usually suffices
+            words = array(_WORD_TYPECODES[size], self.token_bytes(size * (int(missing / acceptance) + 16)))
+            numbers.extend(word % bound for word in words if word < limit)
+
+        del numbers[count:]
+        return numbers
+
+    def prefetched_randbelow(self, draws):
+        """
+        Return a randbelow function that serves about draws calls from one block.
+
+        Meant for callers like the shuffles, whose bound changes on every
+        call. Each call maps one prefetched 64-bit word with Lemire's
+        multiply-and-shift, rejecting the few words that would bias it; once
+        the block runs out, calls fall back to randbelow.
+
+        :param draws: The number of calls expected.
+        :return: A function of bound returning a uniform integer in [0, bound).
+        """
+        words = iter(array(_WORD_TYPECODES[8], self.token_bytes(8 * draws)))
+
+        def randbelow(bound):
+            if 0 < bound <= _WORD64_RANGE:
+                for word in words:
+                    product = word * bound
+                    low = product & _WORD64_MASK
+                    # low < bound is rare; only then work out the exact threshold
+                    if low >= bound or low >= (_WORD64_RANGE - bound) % bound:
+                        return product >> 64
+            return self.randbelow(bound)
+
+        return randbelow
+
+
+class SecretKeyQueue:
+    """
+    Bounded queue of ready-made secret keys, drawn like get_random_secret_key.
+
+    A key costs 50 draws; the queue makes them in bulk from an entropy
+    buffer and hands them out on request. With background set, a daemon
+    thread tops the queue up once it is half empty, so a burst of requests
+    is served from the queue instead of the RNG. An empty queue makes a key
+    on the spot. The queue is emptied in a forked child, so no key is ever
+    handed out by two processes.
+    """
+
+    def __init__(self, entropy_buffer, size=SECRET_KEY_QUEUE_SIZE, background=False):
+        self.entropy = entropy_buffer
+        self.size = size
+        self._keys = deque()
+        self._refiller = _Refiller(self._fill, 'secret-key-refill') if background else None
+        _holders.add(self)
+
+    def _discard(self):
+        self._keys = deque()
+        if self._refiller is not None:
+            self._refiller.reset()
+
+    def make_keys(self, count):
+        """Returns count new secret keys"""
+
+        indexes = self.entropy.randbelow_many(len(SECRET_KEY_CHARS), count * SECRET_KEY_LENGTH)
+        text = ''.join([SECRET_KEY_CHARS[index] for index in indexes])
+        return [text[start:start + SECRET_KEY_LENGTH] for start in range(0, len(text), SECRET_KEY_LENGTH)]
+
+    def _fill(self):
+        keys = self._keys
+        missing = self.size - len(keys)
+        if missing > 0:
+            keys.extend(self.make_keys(missing))
+
+    def resize(self, size):
+        """Change the number of keys kept ready, dropping any beyond it"""
+
+        if size < 0:
+            raise ValueError("size cannot be negative")
+
+        self.size = size
+        while len(self._keys) > size:
+            try:
+                self._keys.pop()
+            except IndexError:
+                break
+
+    def get(self):
+        """Returns a secret key that no other caller has been given"""
+
+        try:
+            key = self._keys.popleft()
+        except IndexError:
+            key = self.make_keys(1)[0]
+
+        if self._refiller is not None and len(self._keys) <= self.size // 2:
+            self._refiller.request()
+        return key
+
+    def __len__(self):
+        return len(self._keys)
+
+
+entropy = EntropyBuffer(background=True)
+secret_keys = SecretKeyQueue(entropy, background=True)
@@ -0,0 +1,94 @@
+import codecs
+import io
+import mmap
+import os
+
+from backend.utils.caesar_cipher import caesar_cipher_bytes
+from backend.utils.vigenere_cipher import vigenere_cipher_chunks
+
+
+# Bytes of a file mapped into the ciphering loop at a time
+FILE_WINDOW_SIZE = 1024 * 1024  # 1 MB
+
+
+def _fileno(file):
+    try:
+        return file.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def iter_file_windows(file, window_size=FILE_WINDOW_SIZE):
+    """
+    Yield the contents of a file in windows of at most window_size bytes.
+
+    Files on disk are memory-mapped and read one window at a time; each
+    window is dropped from the mapping once it has been copied out, so only
+    one window is ever resident. Files without a descriptor, like uploads
+    Django kept in memory, are read in windows of the same size.
+
+    :param file: A binary file object, positioned anywhere.
+    :param window_size: The window size in bytes; a multiple of the page size.
+    :return: A generator of bytes windows.
+    """
+    fileno = _fileno(file)
+    size = os.fstat(fileno).st_size if fileno is not None else 0
+
+    if fileno is None or size == 0:
+        file.seek(0)
+        while window := file.read(window_size):
+            yield window
+        return
+
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+        if hasattr(mapped, 'madvise'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+        for start in range(0, size, window_size):
+            length = min(window_size, size - start)
+            yield mapped[start:start + length]
+            if hasattr(mapped, 'madvise'):
+                mapped.madvise(mmap.MADV_DONTNEED, start, length)
+
+
+def caesar_cipher_file(file, shift, mode='encrypt', window_size=FILE_WINDOW_SIZE):
+    """
+    Encrypts or decrypts a file using the Caesar cipher, window by window.
+
+    The bytes are translated as they are, so the file can be in any ASCII
+    compatible encoding. The shift is validated before the file is read.
+
+    :param file: A binary file object.
+    :param shift: The number of positions to shift each letter.
+    :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
+    :param window_size: The window size in bytes.
+    :return: A generator of encrypted or decrypted bytes.
+    """
+    shift = int(shift)
+    return (caesar_cipher_bytes(window, shift, mode) for window in iter_file_windows(file, window_size))
+
+
+def vigenere_cipher_file(file, key, mode='encrypt', window_size=FILE_WINDOW_SIZE):
+    """
+    Encrypts or decrypts a UTF-8 file using the Vigenère cipher, window by window.
+
+    Windows are decoded incrementally so a character split across two
+    windows still advances the key once; bytes that are not valid UTF-8 each
+    count as one character and are written back unchanged. The key is
+    validated before the file is read.
+
+    :param file: A binary file object.
+    :param key: The key used for encryption or decryption.
+    :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
+    :param window_size: The window size in bytes.
+    :return: A generator of encrypted or decrypted bytes.
+    """
+    chunks = vigenere_cipher_chunks(_decode_windows(iter_file_windows(file, window_size)), key, mode)
+    return (chunk.encode('utf-8', 'surrogateescape') for chunk in chunks)
+
+
+def _decode_windows(windows):
+    decoder = codecs.getincrementaldecoder('utf-8')('surrogateescape')
+    for window in windows:
+        yield decoder.decode(window)
+    yield decoder.decode(b'', final=True)
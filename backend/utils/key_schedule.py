@@ -0,0 +1,143 @@
+import itertools
+import threading
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+
+from backend.utils.shift_tables import ALPHABET_SIZE, byte_translation_table
+
+
+DEFAULT_KEY_SCHEDULE_CACHE_SIZE = 128
+# A schedule holds a few pointers per key position, so only keys up to this
+# long are cached; that bounds a full cache to a few megabytes. Longer keys
+# are rebuilt on every call, which costs little next to ciphering a text
+# long enough to need them
+MAX_CACHED_KEY_LENGTH = 4096
+
+KeySchedule = namedtuple('KeySchedule', ['shifts', 'byte_tables', 'uniform'])
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def vigenere_key_shifts(key, mode='encrypt'):
+    """
+    Derive the per-position shifts of a Vigenère key.
+
+    Uppercase text letters use the uppercased key character and lowercase
+    text letters use the lowercased one, so a key position has one shift for
+    each case. They only differ for key characters that are not letters.
+
+    :param key: The key used for encryption or decryption.
+    :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
+    :return: A list of (upper_shift, lower_shift) pairs, one per key character.
+    """
+    if not isinstance(key, str):
+        raise TypeError(f"key must be a string, not {type(key).__name__}")
+    if not key:
+        raise ValueError("Key must not be empty")
+
+    # Determine the shift direction based on the mode
+    key_shift = -1 if mode == 'decrypt' else 1
+
+    return list(map(_key_char_shifts, key, itertools.repeat(key_shift)))
+
+
+@lru_cache(maxsize=4096)
+def _key_char_shifts(char, key_shift):
+    return (
+        (ord(char.upper()) - 65) * key_shift % ALPHABET_SIZE,
+        (ord(char.lower()) - 97) * key_shift % ALPHABET_SIZE,
+    )
+
+
+def build_key_schedule(key, mode='encrypt'):
+    """
+    Precompute everything a Vigenère key needs before any text is ciphered.
+
+    :param key: The key used for encryption or decryption.
+    :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
+    :return: A KeySchedule with the shift pairs and bytes.translate tables per
+        key position, and whether every position shifts alike.
+    """
+    shifts = tuple(vigenere_key_shifts(key, mode))
+
+    return KeySchedule(
+        shifts=shifts,
+        byte_tables=tuple(itertools.starmap(byte_translation_table, shifts)),
+        uniform=len(set(shifts)) == 1,
+    )
+
+
+class KeyScheduleCache:
+    """
+    Process-wide LRU cache of Vigenère key schedules keyed by (key, mode).
+
+    Modes other than 'decrypt' encrypt, so they share one entry. Keys longer
+    than max_key_length are never stored. The cache is safe to use from
+    several threads.
+    """
+
+    def __init__(self, maxsize=DEFAULT_KEY_SCHEDULE_CACHE_SIZE, max_key_length=MAX_CACHED_KEY_LENGTH):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self.max_key_length = max_key_length
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, mode='encrypt'):
+        """
+        Return the schedule of a key, building and caching it on a miss.
+
+        :param key: The key used for encryption or decryption.
+        :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
+        :return: The KeySchedule of the key.
+        """
+        cache_key = (key, mode == 'decrypt')
+
+        with self._lock:
+            schedule = self._entries.get(cache_key)
+            if schedule is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return schedule
+            self.misses += 1
+
+        # Build outside the lock; invalid keys raise here and are not cached
+        schedule = build_key_schedule(key, mode)
+
+        with self._lock:
+            if self._maxsize > 0 and len(schedule.shifts) <= self.max_key_length:
+                self._entries[cache_key] = schedule
+                self._evict()
+
+        return schedule
+
+    def resize(self, maxsize):
+        """Change the size limit, evicting least recently used entries"""
+
+        if maxsize < 0:
+            raise ValueError("maxsize cannot be negative")
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        """Drop all entries and reset the hit/miss counters"""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Returns a CacheInfo snapshot of the counters and size"""
+
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize, len(self._entries))
+
+    def _evict(self):
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+key_schedule_cache = KeyScheduleCache()
@@ -0,0 +1,61 @@
+import string
+
+from backend.utils.shift_tables import ALPHABET_SIZE
+
+
+# Relative frequencies of a-z in English text
+ENGLISH_LETTER_FREQUENCIES = (
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015,
+    0.06094, 0.06966, 0.00153, 0.00772, 0.04025, 0.02406, 0.06749,
+    0.07507, 0.01929, 0.00095, 0.05987, 0.06327, 0.09056, 0.02758,
+    0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+)
+
+_LOWERCASE = string.ascii_lowercase.encode('ascii')
+
+
+def letter_histogram(text):
+    """
+    Count the Latin letters of a text, folding case.
+
+    Non-ASCII characters are ignored, just as the cipher engines leave them
+    unchanged. Each count is one C-level pass over the encoded bytes.
+
+    :param text: The text to count.
+    :return: A list of 26 counts, index 0 for 'a'.
+    """
+    data = text.encode('ascii', 'ignore').lower()
+    return [data.count(letter) for letter in _LOWERCASE]
+
+
+def rotate_histogram(histogram, shift):
+    """
+    Rotate a histogram left by shift positions.
+
+    Rotating the histogram of a Caesar ciphertext by its shift yields the
+    histogram of the plaintext, without re-ciphering the text.
+
+    :param histogram: A list of 26 counts.
+    :param shift: The number of positions to rotate by.
+    :return: The rotated list of counts.
+    """
+    shift %= ALPHABET_SIZE
+    return histogram[shift:] + histogram[:shift]
+
+
+# Index of coincidence of English text and of uniformly random letters
+ENGLISH_INDEX_OF_COINCIDENCE = 0.0667
+RANDOM_INDEX_OF_COINCIDENCE = 1 / ALPHABET_SIZE
+
+
+def index_of_coincidence(histogram):
+    """
+    Probability that two letters drawn without replacement are equal.
+
+    :param histogram: A list of letter counts.
+    :return: The index of coincidence, or 0.0 below two letters.
+    """
+    total = sum(histogram)
+    if total < 2:
+        return 0.0
+    return sum(count * (count - 1) for count in histogram) / (total * (total - 1))
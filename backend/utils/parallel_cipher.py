@@ -0,0 +1,184 @@
+import codecs
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+from backend.utils.caesar_cipher import caesar_cipher
+from backend.utils.key_schedule import key_schedule_cache
+from backend.utils.shift_tables import ALPHABET_SIZE, byte_translation_table
+from backend.utils.vigenere_cipher import translate_columns, vigenere_cipher
+
+
+# Below this many characters the pool round trip costs more than it saves
+PARALLEL_THRESHOLD = 8 * 1024 * 1024  # 8 MB
+# Chunks are never split finer than this, whatever the worker count
+MIN_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """
+    Return the persistent process pool, creating it on first use.
+
+    A pool inherited through fork belongs to the parent process, so each
+    process lazily builds its own. The resource tracker is started first so
+    workers share it instead of each starting one that would unlink the
+    parent's shared memory when the worker exits.
+
+    Workers come from a fork server, not from forking the caller: a server
+    process runs threads, and a plain fork would copy any lock another
+    thread holds, such as the key schedule cache's, locked for good.
+
+    :return: A ProcessPoolExecutor with one worker per CPU.
+    """
+    global _pool, _pool_pid
+
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            resource_tracker.ensure_running()
+            _pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=_pool_context())
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def _pool_context():
+    """Returns the forkserver context, or spawn where fork servers are not available"""
+
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)
+
+
+def shutdown_pool():
+    """Stops the process pool; the next parallel call starts a new one"""
+
+    global _pool, _pool_pid
+
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.shutdown()
+        _pool = None
+        _pool_pid = None
+
+
+def chunk_bounds(length, parts, alignment=1):
+    """
+    Split range(length) into at most parts contiguous (start, stop) bounds.
+
+    Every start is a multiple of alignment, so a Vigenère chunk always begins
+    at key position 0.
+
+    :param length: The total number of bytes.
+    :param parts: The desired number of chunks.
+    :param alignment: The multiple every chunk start must fall on.
+    :return: A list of (start, stop) tuples covering the whole range.
+    """
+    chunk_size = max(MIN_CHUNK_SIZE, -(-length // parts))
+    chunk_size += -chunk_size % alignment
+
+    return [(start, min(start + chunk_size, length)) for start in range(0, length, chunk_size)]
+
+
+def _caesar_worker(name, start, stop, shift):
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        view = memory.buf[start:stop]
+        view[:] = bytes(view).translate(byte_translation_table(shift, shift))
+        view.release()
+    finally:
+        memory.close()
+
+
+def _vigenere_worker(name, start, stop, key, mode):
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        view = memory.buf[start:stop]
+        data = bytearray(view)
+        translate_columns(data, key_schedule_cache.get(key, mode))
+        view[:] = data
+        view.release()
+    finally:
+        memory.close()
+
+
+def _run_on_pool(text, worker, args, alignment, workers):
+    length = len(text)
+    memory = shared_memory.SharedMemory(create=True, size=length)
+    try:
+        memory.buf[:length] = text.encode('ascii')
+
+        pool = get_pool()
+        futures = [
+            pool.submit(worker, memory.name, start, stop, *args)
+            for start, stop in chunk_bounds(length, workers, alignment)
+        ]
+        for future in futures:
+            future.result()
+
+        view = memory.buf[:length]
+        try:
+            return codecs.ascii_decode(view)[0]
+        finally:
+            view.release()
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def _use_pool(text, workers):
+    return workers > 1 and len(text) >= PARALLEL_THRESHOLD and text.isascii()
+
+
+def parallel_caesar_cipher(text, shift, mode='encrypt', workers=None):
+    """
+    Encrypts or decrypts a text using the Caesar cipher on several cores.
+
+    Large ASCII texts are copied once into shared memory and translated in
+    place by the process pool. Smaller or non-ASCII texts are ciphered inline.
+
+    :param text: The input text to be encrypted or decrypted.
+    :param shift: The number of positions to shift each character.
+    :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
+    :param workers: The number of chunks to split the text into (default is
+        the number of CPUs).
+    :return: The encrypted or decrypted text.
+    """
+    shift = int(shift)
+    workers = workers or os.cpu_count()
+
+    if not isinstance(text, str) or not _use_pool(text, workers):
+        return caesar_cipher(text, shift, mode)
+
+    if mode == 'decrypt':
+        shift = -shift
+
+    return _run_on_pool(text, _caesar_worker, (shift % ALPHABET_SIZE,), 1, workers)
+
+
+def parallel_vigenere_cipher(text, key, mode='encrypt', workers=None):
+    """
+    Encrypts or decrypts a text using the Vigenère cipher on several cores.
+
+    Large ASCII texts are copied once into shared memory and split into
+    chunks aligned to the key period, which the process pool translates in
+    place. Smaller or non-ASCII texts are ciphered inline.
+
+    :param text: The input text to be encrypted or decrypted.
+    :param key: The key used for encryption or decryption.
+    :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
+    :param workers: The number of chunks to split the text into (default is
+        the number of CPUs).
+    :return: The encrypted or decrypted text.
+    """
+    # Validate the key in this process before any work is shipped out
+    schedule = key_schedule_cache.get(key, mode)
+    workers = workers or os.cpu_count()
+
+    if not isinstance(text, str) or not _use_pool(text, workers):
+        return vigenere_cipher(text, key, mode)
+
+    return _run_on_pool(text, _vigenere_worker, (key, mode), len(schedule.shifts), workers)
@@ -0,0 +1,116 @@
+import math
+import string
+from typing import List
+
+from backend.utils.entropy import entropy
+from backend.utils.tokens import random_string
+
+
+UPPER_CHARS = string.ascii_uppercase
+LOWER_CHARS = string.ascii_lowercase
+DIGIT_CHARS = string.digits
+# Punctuation without quotes, backslash and backtick, which trip up shells and config files
+SPECIAL_CHARS = '!#$%&()*+,-./:;<=>?@[]^_{|}~'
+# Characters easily mistaken for one another
+AMBIGUOUS_CHARS = 'Il1|O0o'
+MAX_PASSWORD_LENGTH = 128
+
+
+def password_classes(exclude_ambiguous=False, exclude=''):
+    """
+    Return the character classes left after exclusions.
+
+    :param exclude_ambiguous: Whether to drop AMBIGUOUS_CHARS.
+    :param exclude: Further characters to drop.
+    :return: A dict of 'upper', 'lower', 'digits' and 'special' to their characters.
+    """
+    excluded = set(exclude) | (set(AMBIGUOUS_CHARS) if exclude_ambiguous else set())
+    classes = {'upper': UPPER_CHARS, 'lower': LOWER_CHARS, 'digits': DIGIT_CHARS, 'special': SPECIAL_CHARS}
+    return {name: ''.join(char for char in chars if char not in excluded) for name, chars in classes.items()}
+
+
+def _shuffle(chars, draw):
+    """Fisher-Yates shuffle of chars in place, taking every swap from one draw below len(chars)!"""
+
+    for position in range(len(chars) - 1, 0, -1):
+        draw, other = divmod(draw, position + 1)
+        chars[position], chars[other] = chars[other], chars[position]
+
+
+def generate_passwords(
+    count: int = 1,
+    length: int = 16,
+    min_upper: int = 1,
+    min_lower: int = 1,
+    min_digits: int = 1,
+    min_special: int = 1,
+    exclude_ambiguous: bool = False,
+    exclude: str = '',
+    entropy_buffer=entropy,
+) -> List[str]:
+    """
+    Generate passwords that satisfy a policy, without rejection loops.
+
+    Each password is built to comply: the required characters of each class
+    are drawn first, the rest of the length is filled from all classes
+    together, and the result goes through a Fisher-Yates shuffle. Every
+    compliant password can come out; the required characters make passwords
+    with more of a class slightly more likely than under plain rejection.
+
+    All characters of a batch come from a few bulk entropy reads, one per
+    class and one for the fill. A shuffle of n characters takes its n - 1
+    swaps from a single uniform draw below n!, read as mixed-radix digits.
+
+    :param count: The number of passwords.
+    :param length: The length of each password.
+    :param min_upper: The minimum number of uppercase letters.
+    :param min_lower: The minimum number of lowercase letters.
+    :param min_digits: The minimum number of digits.
+    :param min_special: The minimum number of special characters.
+    :param exclude_ambiguous: Whether to leave out characters like I, l, 1, O and 0.
+    :param exclude: Further characters to leave out.
+    :param entropy_buffer: The EntropyBuffer to draw from.
+    :return: A list of count passwords.
+    """
+    minimums = {'upper': min_upper, 'lower': min_lower, 'digits': min_digits, 'special': min_special}
+    classes = password_classes(exclude_ambiguous, exclude)
+
+    if not 1 <= length <= MAX_PASSWORD_LENGTH:
+        raise ValueError(f"length must be between 1 and {MAX_PASSWORD_LENGTH}")
+    if any(minimum < 0 for minimum in minimums.values()):
+        raise ValueError("Minimum counts cannot be negative.")
+    if sum(minimums.values()) > length:
+        raise ValueError("The minimum counts add up to more than the length.")
+    for name, minimum in minimums.items():
+        if minimum and not classes[name]:
+            raise ValueError(f"Every {name} character is excluded, but {minimum} are required.")
+
+    fill_chars = ''.join(classes.values())
+    fill_length = length - sum(minimums.values())
+    if fill_length and not fill_chars:
+        raise ValueError("Every character is excluded.")
+    if count <= 0:
+        return []
+
+    # One bulk draw per class, then one for the fill, cut into per-password runs
+    runs = [
+        (random_string(classes[name], minimum * count, entropy_buffer), minimum)
+        for name, minimum in minimums.items() if minimum
+    ]
+    if fill_length:
+        runs.append((random_string(fill_chars, fill_length * count, entropy_buffer), fill_length))
+
+    permutations = math.factorial(length)
+    if permutations <= 1 << 64:
+        draws = entropy_buffer.randbelow_many(permutations, count)
+    else:
+        draws = [entropy_buffer.randbelow(permutations) for _ in range(count)]
+
+    passwords = []
+    for index, draw in enumerate(draws):
+        chars = []
+        for text, width in runs:
+            chars.extend(text[index * width:(index + 1) * width])
+        _shuffle(chars, draw)
+        passwords.append(''.join(chars))
+    return passwords
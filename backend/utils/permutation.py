@@ -0,0 +1,115 @@
+import hashlib
+
+from backend.utils.entropy import entropy
+
+
+# Rounds of the Feistel network; the halves are narrow for small ranges,
+# so this stays above the four Luby-Rackoff asks for
+FEISTEL_ROUNDS = 6
+# blake2b digests top out at 64 bytes, which bounds the width of a half
+MAX_PERMUTATION_BITS = 2 * 8 * 64
+PERMUTATION_KEY_SIZE = 32
+# Values produced per chunk when streaming
+PERMUTATION_CHUNK_SIZE = 8192
+
+
+class FeistelPermutation:
+    """
+    Keyed pseudorandom permutation of range(size) in constant memory.
+
+    Indexes are split into two halves of bit_length(size - 1) bits, which
+    go through an unbalanced Feistel network whose round function is keyed
+    BLAKE2b; results that land past size are walked through the network
+    again until they fall inside the range. The network covers fewer than
+    twice size values, so that takes under two passes on average.
+
+    Any index maps to its value in O(1) time and memory, and the same key
+    always gives the same permutation, so workers sharing a key can each
+    produce a disjoint shard of it.
+
+    :param size: The size of the range, at most 2 ** 1024.
+    :param key: Up to 64 bytes of key; random if not given.
+    :param rounds: The number of Feistel rounds.
+    """
+
+    def __init__(self, size, key=None, rounds=FEISTEL_ROUNDS):
+        if size <= 0:
+            raise ValueError("size must be positive")
+        bits = max(2, (size - 1).bit_length())
+        if bits > MAX_PERMUTATION_BITS:
+            raise ValueError(f"size cannot be more than 2 ** {MAX_PERMUTATION_BITS}")
+
+        self.size = size
+        self.key = entropy.token_bytes(PERMUTATION_KEY_SIZE) if key is None else bytes(key)
+        self._left_bits = bits // 2
+        self._right_bits = bits - bits // 2
+        self._input_size = (self._right_bits + 7) // 8
+        digest_size = max(8, (self._right_bits + 7) // 8)
+        # One pre-keyed hash per round, copied for every call
+        self._round_hashes = [
+            hashlib.blake2b(digest_size=digest_size, key=self.key, salt=round_number.to_bytes(16, 'little'))
+            for round_number in range(rounds)
+        ]
+
+    def _encrypt(self, value):
+        a_bits, b_bits = self._left_bits, self._right_bits
+        a, b = value >> b_bits, value & ((1 << b_bits) - 1)
+        for round_hash in self._round_hashes:
+            round_function = round_hash.copy()
+            round_function.update(b.to_bytes(self._input_size, 'little'))
+            c = (a + int.from_bytes(round_function.digest(), 'little')) & ((1 << a_bits) - 1)
+            a, b = b, c
+            a_bits, b_bits = b_bits, a_bits
+        return (a << b_bits) | b
+
+    def permute(self, index):
+        """Returns the value at index, an integer in [0, size)"""
+
+        value = self._encrypt(index)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.permute(position) for position in range(self.size)[index]]
+
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("permutation index out of range")
+        return self.permute(index)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return map(self.permute, range(self.size))
+
+    def iter_chunks(self, start=0, stop=None, chunk_size=PERMUTATION_CHUNK_SIZE):
+        """
+        Yield the values at positions start to stop, exclusive, chunk by chunk.
+
+        :param start: The first position.
+        :param stop: The position to stop before; the end of the range if None.
+        :param chunk_size: The most values per chunk.
+        :return: A generator of lists of values.
+        """
+        stop = self.size if stop is None else stop
+        for chunk_start in range(start, stop, chunk_size):
+            yield [self.permute(index) for index in range(chunk_start, min(stop, chunk_start + chunk_size))]
+
+    def shard(self, worker, workers):
+        """
+        Return the positions one of several workers should produce.
+
+        The shards of workers 0 to workers - 1 are disjoint, differ in length
+        by at most one, and together cover the whole range.
+
+        :param worker: The 0-based number of this worker.
+        :param workers: The number of workers.
+        :return: A range of positions.
+        """
+        if not 0 <= worker < workers:
+            raise ValueError("worker must be between 0 and workers - 1")
+        return range(self.size * worker // workers, self.size * (worker + 1) // workers)
@@ -1,5 +1,105 @@
 import secrets
-from typing import List
+from typing import Callable, Iterator, List
+
+from backend.utils.entropy import entropy
+from backend.utils.permutation import FeistelPermutation
+
+
+# Numbers produced per chunk when streaming
+RANDOM_NUMBER_CHUNK_SIZE = 8192
+# Streams of up to this many unique numbers are sampled up front; longer
+# ones walk a permutation of the range, in constant memory
+STREAM_SAMPLE_MAX_COUNT = 100000
+
+# Ranges at most this many times count are shuffled whole
+DENSE_RANGE_FACTOR = 2
+# Ranges at least this many times count use Floyd's algorithm; in between,
+# the sparse Fisher-Yates shuffle
+FLOYD_RANGE_FACTOR = 64
+
+
+def floyd_sample(size: int, count: int, randbelow: Callable[[int], int] = secrets.randbelow) -> List[int]:
+    """
+    Sample count distinct offsets from range(size) with Floyd's algorithm.
+
+    Every count-subset is equally likely, but the order of the list is not
+    random. Only a set of count offsets is kept, which makes it the cheapest
+    choice when count is a small fraction of size.
+
+    :param size: The size of the range.
+    :param count: The number of offsets, at most size.
+    :param randbelow: Returns a uniform integer in [0, n); called count times.
+    :return: A list of count distinct integers in [0, size).
+    """
+    chosen = set()
+    sample = []
+    for upper in range(size - count, size):
+        offset = randbelow(upper + 1)
+        if offset in chosen:
+            offset = upper
+        chosen.add(offset)
+        sample.append(offset)
+    return sample
+
+
+def sparse_shuffle_sample(size: int, count: int, randbelow: Callable[[int], int] = secrets.randbelow) -> List[int]:
+    """
+    Sample count distinct offsets from range(size) with a partial Fisher-Yates shuffle.
+
+    The shuffled range is virtual: a dict holds only the positions a swap
+    has moved, so memory stays proportional to count. Every ordered sample
+    is equally likely.
+
+    :param size: The size of the range.
+    :param count: The number of offsets, at most size.
+    :param randbelow: Returns a uniform integer in [0, n); called count times.
+    :return: A list of count distinct integers in [0, size).
+    """
+    moved = {}
+    sample = []
+    for position in range(count):
+        other = position + randbelow(size - position)
+        sample.append(moved.get(other, other))
+        # Position is never looked at again, so only other needs the swap
+        moved[other] = moved.pop(position, position)
+    return sample
+
+
+def dense_shuffle_sample(size: int, count: int, randbelow: Callable[[int], int] = secrets.randbelow) -> List[int]:
+    """
+    Sample count distinct offsets from range(size) by shuffling the whole range.
+
+    Meant for ranges not much larger than count, where a list of the range
+    costs less than hashing. Every ordered sample is equally likely.
+
+    :param size: The size of the range.
+    :param count: The number of offsets, at most size.
+    :param randbelow: Returns a uniform integer in [0, n); called count times.
+    :return: A list of count distinct integers in [0, size).
+    """
+    offsets = list(range(size))
+    for position in range(count):
+        other = position + randbelow(size - position)
+        offsets[position], offsets[other] = offsets[other], offsets[position]
+    return offsets[:count]
+
+
+def sample_unique(size: int, count: int, randbelow: Callable[[int], int] = secrets.randbelow) -> List[int]:
+    """
+    Sample count distinct offsets from range(size), picking the algorithm by density.
+
+    :param size: The size of the range.
+    :param count: The number of offsets, at most size.
+    :param randbelow: Returns a uniform integer in [0, n); called count times.
+    :return: A list of count distinct integers in [0, size).
+    """
+    if count <= 0:
+        return []
+    if size <= DENSE_RANGE_FACTOR * count:
+        return dense_shuffle_sample(size, count, randbelow)
+    if size >= FLOYD_RANGE_FACTOR * count:
+        return floyd_sample(size, count, randbelow)
+    return sparse_shuffle_sample(size, count, randbelow)
 
 
 def generate_random_numbers(
@@ -11,6 +111,9 @@ def generate_random_numbers(
     """
     Generate secure random numbers between min_value and max_value (inclusive).
 
+    Exactly count numbers are drawn, unique or not, from OS entropy fetched
+    in bulk. Unique numbers come in no particular order.
+
     :param min_value: The minimum value of the range (inclusive).
     :param max_value: The maximum value of the range (inclusive).
     :param count: The number of random numbers to generate (default is 1).
@@ -19,15 +122,58 @@ def generate_random_numbers(
     """
     if min_value >= max_value:
         raise ValueError("min_value must be less than max_value")
-    if unique and (max_value - min_value + 1) < count:
+
+    size = max_value - min_value + 1
+    if unique and size < count:
+        raise ValueError("Range is too small to generate unique numbers")
+
+    if unique:
+        return [min_value + offset for offset in sample_unique(size, count, entropy.prefetched_randbelow(count))]
+
+    return [min_value + offset for offset in entropy.randbelow_many(size, count)]
+
+
+def iter_random_numbers(
+    min_value: int,
+    max_value: int,
+    count: int = 1,
+    unique: bool = True,
+    chunk_size: int = RANDOM_NUMBER_CHUNK_SIZE,
+) -> Iterator[List[int]]:
+    """
+    Generate secure random numbers between min_value and max_value (inclusive), chunk by chunk.
+
+    Takes the arguments of generate_random_numbers and validates them before
+    the first chunk is asked for. Memory does not grow with count: unique
+    numbers beyond STREAM_SAMPLE_MAX_COUNT are read off a FeistelPermutation
+    of the range under a fresh random key, a keyed pseudorandom stand-in for
+    an exact uniform sample.
+
+    :param chunk_size: The most numbers per chunk.
+    :return: An iterator of lists of random integers, count in total.
+    """
+    if min_value >= max_value:
+        raise ValueError("min_value must be less than max_value")
+
+    size = max_value - min_value + 1
+    if unique and size < count:
         raise ValueError("Range is too small to generate unique numbers")
 
-    numbers = set() if unique else []
-    while len(numbers) < count:
-        random_number = secrets.randbelow(max_value - min_value + 1) + min_value
-        if unique:
-            numbers.add(random_number)
-        else:
-            numbers.append(random_number)
+    return _iter_random_numbers(min_value, size, count, unique, chunk_size)
+
+
+def _iter_random_numbers(min_value, size, count, unique, chunk_size):
+    if unique and count <= STREAM_SAMPLE_MAX_COUNT:
+        numbers = generate_random_numbers(min_value, min_value + size - 1, count, unique=True)
+        for start in range(0, count, chunk_size):
+            yield numbers[start:start + chunk_size]
+        return
+
+    if unique:
+        for offsets in FeistelPermutation(size).iter_chunks(0, count, chunk_size):
+            yield [min_value + offset for offset in offsets]
+        return
 
-    return list(numbers)
+    for start in range(0, count, chunk_size):
+        offsets = entropy.randbelow_many(size, min(chunk_size, count - start))
+        yield [min_value + offset for offset in offsets]
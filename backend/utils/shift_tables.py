@@ -0,0 +1,49 @@
+from functools import lru_cache
+
+
+ALPHABET_SIZE = 26
+
+
+@lru_cache(maxsize=None)
+def translation_table(upper_shift, lower_shift):
+    """
+    Build a str.translate table that shifts ASCII letters.
+
+    Uppercase letters are rotated by upper_shift and lowercase letters by
+    lower_shift; every other ASCII character maps to itself. Characters
+    outside ASCII are not covered by the table, so str.translate leaves them
+    unchanged. Only ASCII text takes CPython's fast translate path.
+
+    :param upper_shift: The number of positions to shift uppercase letters.
+    :param lower_shift: The number of positions to shift lowercase letters.
+    :return: A 128 character table indexed by code point.
+    """
+    table = [chr(code) for code in range(128)]
+
+    for index in range(ALPHABET_SIZE):
+        table[65 + index] = chr((index + upper_shift) % ALPHABET_SIZE + 65)
+        table[97 + index] = chr((index + lower_shift) % ALPHABET_SIZE + 97)
+
+    return ''.join(table)
+
+
+@lru_cache(maxsize=None)
+def byte_translation_table(upper_shift, lower_shift):
+    """
+    Build a bytes.translate table that shifts ASCII letters.
+
+    The byte counterpart of translation_table; bytes 128-255 map to
+    themselves, so UTF-8 multi-byte sequences pass through untouched.
+
+    :param upper_shift: The number of positions to shift uppercase letters.
+    :param lower_shift: The number of positions to shift lowercase letters.
+    :return: A 256 byte table indexed by byte value.
+    """
+    return translation_table(upper_shift, lower_shift).encode('ascii') + bytes(range(128, 256))
+
+
+# All 26 Caesar tables, built once per process. Decryption by a shift uses
+# the table of its additive inverse, so these cover both directions.
+SHIFT_TABLES = tuple(translation_table(shift, shift) for shift in range(ALPHABET_SIZE))
+BYTE_SHIFT_TABLES = tuple(byte_translation_table(shift, shift) for shift in range(ALPHABET_SIZE))
+
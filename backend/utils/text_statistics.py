@@ -0,0 +1,146 @@
+import math
+import string
+import sys
+from array import array
+from collections import Counter
+from itertools import product
+
+from backend.utils.letter_frequency import index_of_coincidence
+from backend.utils.shift_tables import ALPHABET_SIZE
+
+
+STATISTICS_CHUNK_SIZE = 1024 * 1024
+
+# Maps a-z and A-Z to letter codes 0-25; every other byte is deleted
+_LETTER_CODES = bytes((code - 65) % 32 if chr(code) in string.ascii_letters else 0 for code in range(256))
+_NON_LETTERS = bytes(code for code in range(256) if chr(code) not in string.ascii_letters)
+
+
+def letter_codes(text):
+    """
+    Reduce a text to its Latin letters as codes 0-25, folding case.
+
+    :param text: The text to reduce.
+    :return: A bytes object holding one code per letter.
+    """
+    return text.encode('ascii', 'ignore').translate(_LETTER_CODES, _NON_LETTERS)
+
+
+def _ngram_names(size):
+    return [''.join(letters) for letters in product(string.ascii_lowercase, repeat=size)]
+
+
+# Packed trigram word -> flat trigram index, for every possible trigram
+_TRIGRAM_INDEX = {
+    int.from_bytes(bytes((first, second, third, 0)), sys.byteorder): (first * ALPHABET_SIZE + second) * ALPHABET_SIZE + third
+    for first, second, third in product(range(ALPHABET_SIZE), repeat=3)
+}
+
+
+class TextStatistics:
+    """
+    Single-pass letter statistics of a text.
+
+    Feed the text in chunks of any size with update(); trigrams spanning a
+    chunk boundary are counted once. N-grams run over the letters only, so
+    spaces and punctuation between two letters do not break a bigram.
+
+    Only trigrams are counted while streaming, in a flat array indexed by
+    letter codes ('the' at (19 * 26 + 7) * 26 + 4). Every bigram but the
+    last starts a trigram and every letter but the last starts a bigram, so
+    the bigram and unigram arrays are derived from it plus the final two
+    letters.
+    """
+
+    def __init__(self):
+        self.trigrams = array('Q', bytes(8 * ALPHABET_SIZE ** 3))
+        self._tail = b''
+
+    def update(self, text):
+        """Adds one chunk of text to the counts"""
+
+        codes = self._tail + letter_codes(text)
+        total = len(codes) - 2
+        self._tail = codes[-2:]
+        if total <= 0:
+            return
+
+        # Lay every trigram out in its own 32-bit word, so that counting the
+        # words counts the trigrams in one C-level pass
+        packed = bytearray(4 * total)
+        for offset in range(3):
+            packed[offset::4] = codes[offset:offset + total]
+
+        with memoryview(packed) as view, view.cast('I') as words:
+            word_counts = Counter(words)
+
+        for word, occurrences in word_counts.items():
+            self.trigrams[_TRIGRAM_INDEX[word]] += occurrences
+
+    @property
+    def bigrams(self):
+        """Bigram counts in a flat array, 'th' at 19 * 26 + 7"""
+
+        bigrams = array('Q', bytes(8 * ALPHABET_SIZE ** 2))
+        for index in range(ALPHABET_SIZE ** 2):
+            bigrams[index] = sum(self.trigrams[index * ALPHABET_SIZE:(index + 1) * ALPHABET_SIZE])
+        if len(self._tail) == 2:
+            bigrams[self._tail[0] * ALPHABET_SIZE + self._tail[1]] += 1
+        return bigrams
+
+    @property
+    def unigrams(self):
+        """Letter counts in a flat array, 'a' at 0"""
+
+        return self._unigrams(self.bigrams)
+
+    def _unigrams(self, bigrams):
+        unigrams = array('Q', bytes(8 * ALPHABET_SIZE))
+        for index in range(ALPHABET_SIZE):
+            unigrams[index] = sum(bigrams[index * ALPHABET_SIZE:(index + 1) * ALPHABET_SIZE])
+        if self._tail:
+            unigrams[self._tail[-1]] += 1
+        return unigrams
+
+    def summary(self):
+        """
+        Collect the statistics into plain data.
+
+        :return: A dict with 'letters', 'unigrams', 'bigrams', 'trigrams'
+            (dicts of the n-grams that occur, by name),
+            'index_of_coincidence' and 'entropy'.
+        """
+        bigrams = self.bigrams
+        unigrams = self._unigrams(bigrams)
+        letters = sum(unigrams)
+        entropy = -sum(count / letters * math.log2(count / letters) for count in unigrams if count)
+
+        return {
+            'letters': letters,
+            'unigrams': dict(zip(string.ascii_lowercase, unigrams)),
+            'bigrams': _nonzero(bigrams, 2),
+            'trigrams': _nonzero(self.trigrams, 3),
+            'index_of_coincidence': round(index_of_coincidence(unigrams), 6),
+            'entropy': round(entropy, 6),
+        }
+
+
+def _nonzero(counts, size):
+    return {name: count for name, count in zip(_ngram_names(size), counts) if count}
+
+
+def text_statistics(text, chunk_size=STATISTICS_CHUNK_SIZE):
+    """
+    Compute letter, bigram and trigram statistics of a text in one pass.
+
+    :param text: The text to analyse.
+    :param chunk_size: How many characters to feed per step.
+    :return: The summary dict of TextStatistics.
+    """
+    if not isinstance(text, str):
+        raise TypeError(f"text must be a string, not {type(text).__name__}")
+
+    statistics = TextStatistics()
+    for start in range(0, len(text), chunk_size):
+        statistics.update(text[start:start + chunk_size])
+    return statistics.summary()
@@ -0,0 +1,240 @@
+import base64
+import binascii
+import functools
+import time
+import zlib
+from typing import Iterator, List
+
+from backend.utils.entropy import SECRET_KEY_CHARS, entropy
+
+
+BASE62_CHARS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+CROCKFORD_BASE32_CHARS = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+API_KEY_PREFIX = 'eyd_'
+API_KEY_CHECKSUM_LENGTH = 6
+
+# Default length per format: characters for the alphabet formats, random
+# bytes for hex and urlsafe; the UUID and ULID formats have a fixed length
+DEFAULT_TOKEN_LENGTHS = {
+    'django': 50,
+    'hex': 32,
+    'urlsafe': 32,
+    'api-key': 32,
+    'uuid4': None,
+    'uuid7': None,
+    'ulid': None,
+}
+TOKEN_FORMATS = tuple(DEFAULT_TOKEN_LENGTHS)
+MAX_TOKEN_LENGTH = 256
+# Tokens generated per bulk entropy read when streaming
+TOKEN_CHUNK_SIZE = 8192
+
+_URLSAFE = bytes.maketrans(b'+/', b'-_')
+_BASE32_TO_CROCKFORD = bytes.maketrans(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ234567', CROCKFORD_BASE32_CHARS.encode('ascii'))
+# Keep the low nibble or low six bits and set the UUID version or variant
+_UUID4_VERSION = bytes((byte & 0x0F) | 0x40 for byte in range(256))
+_UUID7_VERSION = bytes((byte & 0x0F) | 0x70 for byte in range(256))
+_UUID_VARIANT = bytes((byte & 0x3F) | 0x80 for byte in range(256))
+
+
+@functools.lru_cache(maxsize=64)
+def _alphabet_table(alphabet):
+    """
+    Returns a bytes.translate table and the bytes to delete for mapping random bytes onto alphabet.
+
+    Bytes at or past the largest multiple of len(alphabet) below 256 are
+    deleted rather than mapped, so every character stays equally likely.
+    """
+    limit = 256 // len(alphabet) * len(alphabet)
+    table = bytes(ord(alphabet[byte % len(alphabet)]) if byte < limit else 0 for byte in range(256))
+    return table, bytes(range(limit, 256))
+
+
+def random_string(alphabet, size, entropy_buffer=entropy):
+    """
+    Draw size characters uniformly from alphabet, from bulk entropy.
+
+    Random bytes are mapped onto the alphabet with bytes.translate, which
+    also drops the bytes that would bias it, so the work is done in C.
+
+    :param alphabet: A string of 1 to 256 distinct ASCII characters.
+    :param size: The number of characters.
+    :param entropy_buffer: The EntropyBuffer to draw from.
+    :return: A string of size characters.
+    """
+    table, rejected = _alphabet_table(alphabet)
+    acceptance = (256 - len(rejected)) / 256
+    parts = []
+    missing = size
+    while missing > 0:
+        part = entropy_buffer.token_bytes(int(missing / acceptance) + 64).translate(table, rejected)[:missing]
+        parts.append(part)
+        missing -= len(part)
+    return b''.join(parts).decode('ascii')
+
+
+def _split(text, width, count):
+    return [text[start:start + width] for start in range(0, width * count, width)]
+
+
+def _timestamp_ms(previous):
+    """Returns the Unix time in milliseconds, kept above previous so chunks stay ordered"""
+
+    now = time.time_ns() // 1_000_000
+    return now if previous is None or now > previous else previous + 1
+
+
+def _base62(value, width):
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, 62)
+        digits.append(BASE62_CHARS[digit])
+    return ''.join(reversed(digits))
+
+
+def _uuid_strings(block, count):
+    text = block.hex()
+    return [
+        f"{text[start:start + 8]}-{text[start + 8:start + 12]}-{text[start + 12:start + 16]}-"
+        f"{text[start + 16:start + 20]}-{text[start + 20:start + 32]}"
+        for start in range(0, 32 * count, 32)
+    ]
+
+
+def _uuid4(count, entropy_buffer):
+    block = bytearray(entropy_buffer.token_bytes(16 * count))
+    block[6::16] = block[6::16].translate(_UUID4_VERSION)
+    block[8::16] = block[8::16].translate(_UUID_VARIANT)
+    return _uuid_strings(block, count)
+
+
+def _time_ordered_block(count, width, timestamp, entropy_buffer, lead=0):
+    """Returns count groups of width bytes: lead zero bytes, a 48-bit timestamp, then random bytes"""
+
+    block = bytearray(width * count)
+    for offset, byte in enumerate(timestamp.to_bytes(6, 'big'), start=lead):
+        block[offset::width] = bytes((byte,)) * count
+
+    random_start = lead + 6
+    random_width = width - random_start
+    random_bytes = entropy_buffer.token_bytes(random_width * count)
+    for offset in range(random_width):
+        block[random_start + offset::width] = random_bytes[offset::random_width]
+    return block
+
+
+def _uuid7(count, entropy_buffer, timestamp):
+    block = _time_ordered_block(count, 16, timestamp, entropy_buffer)
+    block[6::16] = block[6::16].translate(_UUID7_VERSION)
+    block[8::16] = block[8::16].translate(_UUID_VARIANT)
+    # Sorting orders the tokens that share this millisecond
+    return sorted(_uuid_strings(block, count))
+
+
+def _ulid(count, entropy_buffer, timestamp):
+    # 4 leading zero bytes make each 128-bit ULID a 160-bit group, which
+    # base32 encodes to exactly 32 characters; the last 26 are the ULID
+    block = _time_ordered_block(count, 20, timestamp, entropy_buffer, lead=4)
+    text = base64.b32encode(block).translate(_BASE32_TO_CROCKFORD).decode('ascii')
+    return sorted(text[start + 6:start + 32] for start in range(0, 32 * count, 32))
+
+
+def _api_keys(count, length, entropy_buffer):
+    keys = []
+    for secret in _split(random_string(BASE62_CHARS, length * count, entropy_buffer), length, count):
+        checksum = _base62(zlib.crc32(secret.encode('ascii')), API_KEY_CHECKSUM_LENGTH)
+        keys.append(f"{API_KEY_PREFIX}{secret}{checksum}")
+    return keys
+
+
+def api_key_is_valid(key):
+    """Returns True if key has the API key layout and its checksum matches"""
+
+    if not key.startswith(API_KEY_PREFIX) or len(key) <= len(API_KEY_PREFIX) + API_KEY_CHECKSUM_LENGTH:
+        return False
+
+    secret, checksum = key[len(API_KEY_PREFIX):-API_KEY_CHECKSUM_LENGTH], key[-API_KEY_CHECKSUM_LENGTH:]
+    return secret.isascii() and _base62(zlib.crc32(secret.encode('ascii')), API_KEY_CHECKSUM_LENGTH) == checksum
+
+
+def token_length(token_format, length=None):
+    """
+    Validate a token format and length.
+
+    :param token_format: One of TOKEN_FORMATS.
+    :param length: The requested length, or None for the default.
+    :return: The length to use; None for the fixed-length formats.
+    """
+    if token_format not in DEFAULT_TOKEN_LENGTHS:
+        raise ValueError(f"format must be one of {', '.join(TOKEN_FORMATS)}")
+
+    if DEFAULT_TOKEN_LENGTHS[token_format] is None or length is None:
+        return DEFAULT_TOKEN_LENGTHS[token_format]
+
+    length = int(length)
+    if not 1 <= length <= MAX_TOKEN_LENGTH:
+        raise ValueError(f"length must be between 1 and {MAX_TOKEN_LENGTH}")
+    return length
+
+
+def generate_tokens(token_format, count, length=None, entropy_buffer=entropy, timestamp=None) -> List[str]:
+    """
+    Generate count secret tokens of one format from a bulk entropy read.
+
+    The entropy for all count tokens is read at once and cut up by index:
+    'django' keys use the characters of get_random_secret_key, 'hex' and
+    'urlsafe' encode length random bytes, 'api-key' is a base62 secret
+    behind a prefix and followed by a CRC32 checksum. 'uuid4', 'uuid7' and
+    'ulid' follow RFC 9562 and the ULID spec; UUIDv7s and ULIDs come sorted.
+
+    :param token_format: One of TOKEN_FORMATS.
+    :param count: The number of tokens.
+    :param length: The token length, see DEFAULT_TOKEN_LENGTHS.
+    :param entropy_buffer: The EntropyBuffer to draw from.
+    :param timestamp: The Unix time in milliseconds for 'uuid7' and 'ulid'; now if None.
+    :return: A list of tokens.
+    """
+    length = token_length(token_format, length)
+    if count <= 0:
+        return []
+
+    if token_format == 'django':
+        return _split(random_string(SECRET_KEY_CHARS, length * count, entropy_buffer), length, count)
+    if token_format == 'api-key':
+        return _api_keys(count, length, entropy_buffer)
+    if token_format == 'hex':
+        return _split(entropy_buffer.token_bytes(length * count).hex(), 2 * length, count)
+    if token_format == 'urlsafe':
+        data = entropy_buffer.token_bytes(length * count)
+        return [
+            binascii.b2a_base64(data[start:start + length], newline=False).rstrip(b'=').translate(_URLSAFE).decode('ascii')
+            for start in range(0, length * count, length)
+        ]
+    if token_format == 'uuid4':
+        return _uuid4(count, entropy_buffer)
+
+    timestamp = _timestamp_ms(None) if timestamp is None else timestamp
+    if token_format == 'uuid7':
+        return _uuid7(count, entropy_buffer, timestamp)
+    return _ulid(count, entropy_buffer, timestamp)
+
+
+def iter_tokens(token_format, count, length=None, chunk_size=TOKEN_CHUNK_SIZE) -> Iterator[List[str]]:
+    """
+    Generate secret tokens chunk by chunk, one bulk entropy read per chunk.
+
+    Takes the arguments of generate_tokens and validates them before the
+    first chunk is asked for. UUIDv7s and ULIDs stay in order across chunks.
+
+    :param chunk_size: The most tokens per chunk.
+    :return: An iterator of lists of tokens, count in total.
+    """
+    length = token_length(token_format, length)
+    return _iter_tokens(token_format, count, length, chunk_size)
+
+
+def _iter_tokens(token_format, count, length, chunk_size):
+    timestamp = None
+    for start in range(0, count, chunk_size):
+        timestamp = _timestamp_ms(timestamp)
+        yield generate_tokens(token_format, min(chunk_size, count - start), length, timestamp=timestamp)
@@ -1,39 +1,145 @@
+import itertools
+import re
+
+from backend.utils.key_schedule import key_schedule_cache
+
+
+# Runs of characters the ASCII translation tables do not cover
+NON_ASCII_RUN_PATTERN = re.compile(r'[^\x00-\x7f]+')
+# Below this many bytes per column on average, the per-column slicing costs
+# more than looking up every byte in its own table
+MIN_COLUMN_LENGTH = 4
+
+
 def vigenere_cipher(text, key, mode='encrypt'):
     """
     Encrypts or decrypts a text using the Vigenère cipher.
 
+    Every character advances the key position, letters or not. Only the
+    Latin letters A-Z and a-z are shifted; all other characters, including
+    non-ASCII letters, are left unchanged.
+
     :param text: The input text to be encrypted or decrypted.
     :param key: The key used for encryption or decryption.
     :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
     :return: The encrypted or decrypted text.
     """
-    result = ""
-
-    # Determine the shift direction based on the mode
-    if mode == 'decrypt':
-        key_shift = -1
-    else:
-        key_shift = 1
-
-    # Repeat the key to match the length of the text
-    key_repeated = (key * (len(text) // len(key) + 1))[:len(text)]
-
-    # Iterate over each character in the text
-    for i, char in enumerate(text):
-        # Check if the character is an uppercase letter
-        if char.isupper():
-            # Calculate the shift based on the corresponding key character
-            shift = (ord(key_repeated[i].upper()) - 65) * key_shift
-            # Shift the character and wrap around using modulo 26
-            result += chr((ord(char) + shift - 65) % 26 + 65)
-        # Check if the character is a lowercase letter
-        elif char.islower():
-            # Calculate the shift based on the corresponding key character
-            shift = (ord(key_repeated[i].lower()) - 97) * key_shift
-            # Shift the character and wrap around using modulo 26
-            result += chr((ord(char) + shift - 97) % 26 + 97)
-        else:
-            # If it's not a letter, leave it unchanged
-            result += char
-
-    return result
+    if not isinstance(text, str):
+        raise TypeError(f"text must be a string, not {type(text).__name__}")
+
+    return apply_key_schedule(text, key_schedule_cache.get(key, mode))
+
+
+def vigenere_cipher_bytes(data, key, mode='encrypt'):
+    """
+    Encrypts or decrypts UTF-8 bytes using the Vigenère cipher.
+
+    An ASCII bytearray is ciphered in place and returned as it is. The key
+    advances once per character, so other input is decoded, with bytes that
+    are not valid UTF-8 each standing for one character, and encoded back.
+
+    :param data: The bytes or bytearray holding the text.
+    :param key: The key used for encryption or decryption.
+    :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
+    :return: The encrypted or decrypted bytes.
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        raise TypeError(f"data must be bytes, not {type(data).__name__}")
+
+    schedule = key_schedule_cache.get(key, mode)
+
+    if data.isascii():
+        data = data if isinstance(data, bytearray) else bytearray(data)
+        translate_columns(data, schedule)
+        return data
+
+    text = data.decode('utf-8', 'surrogateescape')
+    return apply_key_schedule(text, schedule).encode('utf-8', 'surrogateescape')
+
+
+def apply_key_schedule(text, schedule, phase=0):
+    """
+    Apply a precomputed Vigenère key schedule to a text.
+
+    The text is split into one column per key position, each column is
+    translated with the table of its key position and the columns are
+    interleaved back together with strided slice assignment, all on bytes.
+
+    :param text: The input text to be encrypted or decrypted.
+    :param schedule: The KeySchedule of the key.
+    :param phase: The key position of the first character (default is 0).
+    :return: The encrypted or decrypted text.
+    """
+    if not isinstance(text, str):
+        raise TypeError(f"text must be a string, not {type(text).__name__}")
+    if not text:
+        return ""
+
+    if text.isascii():
+        data = bytearray(text, 'ascii')
+        translate_columns(data, schedule, phase)
+        return data.decode('ascii')
+
+    # Every non-ASCII character becomes one '?' so positions still line up
+    # with the key, then the untouched non-ASCII runs are put back in place
+    data = bytearray(text, 'ascii', 'replace')
+    translate_columns(data, schedule, phase)
+    ciphered = data.decode('ascii')
+
+    parts = []
+    last = 0
+    for match in NON_ASCII_RUN_PATTERN.finditer(text):
+        parts.append(ciphered[last:match.start()])
+        parts.append(match.group())
+        last = match.end()
+    parts.append(ciphered[last:])
+
+    return ''.join(parts)
+
+
+def translate_columns(data, schedule, phase=0):
+    """
+    Apply a precomputed Vigenère key schedule in place to ASCII bytes.
+
+    :param data: A bytearray (or writable buffer slice) of ASCII text.
+    :param schedule: The KeySchedule of the key.
+    :param phase: The key position of the first byte (default is 0).
+    """
+    size = len(schedule.shifts)
+    period = 1 if schedule.uniform else min(size, len(data))
+
+    # A key about as long as the text leaves columns of a byte or two
+    if period * MIN_COLUMN_LENGTH > len(data):
+        start = phase % size
+        tables = itertools.chain(schedule.byte_tables[start:start + len(data)], itertools.cycle(schedule.byte_tables))
+        data[:] = bytes(map(bytes.__getitem__, tables, data))
+        return
+
+    # Interleave the translated columns in place inside one byte buffer
+    for column in range(period):
+        table = schedule.byte_tables[(phase + column) % size]
+        data[column::period] = data[column::period].translate(table)
+
+
+def vigenere_cipher_chunks(chunks, key, mode='encrypt'):
+    """
+    Encrypts or decrypts an iterable of text chunks using the Vigenère cipher.
+
+    The key phase is carried across chunk boundaries, so the joined output
+    equals vigenere_cipher over the joined input. The key is validated before
+    the first chunk is read.
+
+    :param chunks: An iterable of text chunks.
+    :param key: The key used for encryption or decryption.
+    :param mode: 'encrypt' or 'decrypt' (default is 'encrypt').
+    :return: A generator of encrypted or decrypted chunks.
+    """
+    schedule = key_schedule_cache.get(key, mode)
+    return _cipher_chunks(chunks, schedule)
+
+
+def _cipher_chunks(chunks, schedule):
+    phase = 0
+    for chunk in chunks:
+        yield apply_key_schedule(chunk, schedule, phase)
+        phase = (phase + len(chunk)) % len(schedule.shifts)
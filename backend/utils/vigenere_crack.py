@@ -0,0 +1,164 @@
+import re
+from collections import Counter
+
+from backend.utils.caesar_crack import PREVIEW_LENGTH, score_histogram
+from backend.utils.letter_frequency import (
+    ENGLISH_INDEX_OF_COINCIDENCE,
+    RANDOM_INDEX_OF_COINCIDENCE,
+    index_of_coincidence,
+    letter_histogram,
+    rotate_histogram,
+)
+from backend.utils.shift_tables import ALPHABET_SIZE
+from backend.utils.vigenere_cipher import vigenere_cipher
+
+
+MAX_KEY_LENGTH = 20
+# Statistics are taken from a prefix; beyond this they no longer change
+ANALYSIS_SAMPLE_SIZE = 128 * 1024
+KASISKI_SAMPLE_SIZE = 64 * 1024
+
+_TRIGRAM_PATTERN = re.compile(r'(?=([a-z]{3}))')
+
+
+def kasiski_factors(text, max_key_length=MAX_KEY_LENGTH):
+    """
+    Count how often each key length divides the spacing of repeated trigrams.
+
+    Trigrams are indexed in a single pass with a dict of last positions, and
+    every distinct spacing is factored once however often it repeats.
+    Positions are character positions, because non-letters advance the key.
+
+    :param text: The ciphertext, ideally lowercased ASCII.
+    :param max_key_length: The longest key length to consider.
+    :return: A list where index L holds the votes for key length L.
+    """
+    last_seen = {}
+    spacings = Counter()
+    for match in _TRIGRAM_PATTERN.finditer(text):
+        trigram = match.group(1)
+        position = match.start()
+        previous = last_seen.get(trigram)
+        if previous is not None:
+            spacings[position - previous] += 1
+        last_seen[trigram] = position
+
+    votes = [0] * (max_key_length + 1)
+    for spacing, occurrences in spacings.items():
+        for key_length in range(2, max_key_length + 1):
+            if spacing % key_length == 0:
+                votes[key_length] += occurrences
+    return votes
+
+
+def column_histograms(text, key_length):
+    """Returns the letter histogram of each key-period column of text"""
+
+    return [letter_histogram(text[column::key_length]) for column in range(key_length)]
+
+
+def estimate_key_lengths(text, max_key_length=MAX_KEY_LENGTH):
+    """
+    Score every key length from 1 to max_key_length.
+
+    The confidence of a length is the average column index of coincidence
+    scaled so that random letters score 0 and English scores 1, blended with
+    its share of the Kasiski votes.
+
+    :param text: The ciphertext sample, lowercased ASCII.
+    :param max_key_length: The longest key length to consider.
+    :return: A list of dicts with 'key_length', 'index_of_coincidence',
+        'kasiski_votes' and 'confidence', best first.
+    """
+    votes = kasiski_factors(text[:KASISKI_SAMPLE_SIZE], max_key_length)
+    total_votes = sum(votes) or 1
+    ioc_span = ENGLISH_INDEX_OF_COINCIDENCE - RANDOM_INDEX_OF_COINCIDENCE
+
+    lengths = []
+    for key_length in range(1, max_key_length + 1):
+        histograms = column_histograms(text, key_length)
+        ioc = sum(index_of_coincidence(histogram) for histogram in histograms) / key_length
+        ioc_confidence = min(max((ioc - RANDOM_INDEX_OF_COINCIDENCE) / ioc_span, 0.0), 1.0)
+        confidence = 0.8 * ioc_confidence + 0.2 * votes[key_length] / total_votes
+        lengths.append({
+            'key_length': key_length,
+            'index_of_coincidence': round(ioc, 5),
+            'kasiski_votes': votes[key_length],
+            'confidence': round(confidence, 4),
+        })
+
+    # Multiples of the true length score as well as the length itself, so
+    # among lengths close to the best the shortest one wins
+    best = max(length['confidence'] for length in lengths)
+    shortest = next(length for length in lengths if length['confidence'] >= 0.9 * best)
+    lengths.sort(key=lambda length: -length['confidence'])
+    lengths.remove(shortest)
+    lengths.insert(0, shortest)
+    return lengths
+
+
+def recover_key(text, key_length):
+    """
+    Recover the key letter of every column by Caesar frequency scoring.
+
+    :param text: The ciphertext sample, lowercased ASCII.
+    :param key_length: The key length to assume.
+    :return: The uppercase key.
+    """
+    key = []
+    for histogram in column_histograms(text, key_length):
+        shift = min(range(ALPHABET_SIZE), key=lambda candidate: score_histogram(rotate_histogram(histogram, candidate)))
+        key.append(chr(shift + 65))
+    return ''.join(key)
+
+
+def crack_vigenere(text, max_key_length=MAX_KEY_LENGTH, top=3, preview_length=PREVIEW_LENGTH):
+    """
+    Estimate the key of a Vigenère ciphertext and decrypt it.
+
+    Statistics come from the first ANALYSIS_SAMPLE_SIZE characters, encoded
+    so that every character keeps its position; only the final decryption
+    reads the whole text.
+
+    :param text: The ciphertext to crack.
+    :param max_key_length: The longest key length to consider.
+    :param top: How many candidate keys to return.
+    :param preview_length: How many characters of each decryption to include.
+    :return: A dict with 'candidates' (dicts with 'key', 'key_length',
+        'confidence', 'index_of_coincidence', 'kasiski_votes' and 'preview',
+        best first) and 'result', the text decrypted with the best key.
+    """
+    if not isinstance(text, str):
+        raise TypeError(f"text must be a string, not {type(text).__name__}")
+
+    max_key_length = int(max_key_length)
+    if max_key_length < 1:
+        raise ValueError("max_key_length must be at least 1")
+
+    sample = text[:ANALYSIS_SAMPLE_SIZE].encode('ascii', 'replace').decode('ascii').lower()
+    if not any(letter_histogram(sample)):
+        return {'candidates': [], 'result': text}
+
+    max_key_length = min(max_key_length, len(sample))
+
+    top = max(int(top), 1)
+    candidates = []
+    for length in estimate_key_lengths(sample, max_key_length):
+        if len(candidates) == top:
+            break
+
+        # A multiple of the key length recovers the same key repeated
+        key = recover_key(sample, length['key_length'])
+        if any(key == candidate['key'] * (len(key) // len(candidate['key'])) for candidate in candidates):
+            continue
+
+        candidates.append({
+            'key': key,
+            **length,
+            'preview': vigenere_cipher(text[:preview_length], key, mode='decrypt'),
+        })
+
+    return {
+        'candidates': candidates,
+        'result': vigenere_cipher(text, candidates[0]['key'], mode='decrypt'),
+    }
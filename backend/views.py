@@ -1,25 +1,71 @@
+import sys
+from array import array
+from collections.abc import Iterator
 from http import HTTPStatus
 
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import content_disposition_header
 from django.views.decorators.csrf import csrf_protect
-from django.core.management.utils import get_random_secret_key
 
 from rest_framework import status
-from rest_framework.decorators import permission_classes, api_view
+from rest_framework.decorators import parser_classes, permission_classes, api_view
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
-from backend.utils.caesar_cipher import caesar_cipher
-from backend.utils.vigenere_cipher import vigenere_cipher
-from backend.utils.random_numbers import generate_random_numbers
-
-
+from backend.batch import iter_batch_lines
+from backend.conditional import etag_matches, input_etag, not_modified
+from backend.guards import exceeds_text_limit, limit_request_body
+from backend.limits import (
+    MAX_BATCH_SIZE,
+    MAX_NUM_COUNT,
+    MAX_PASSWORD_COUNT,
+    MAX_REQUEST_BODY_SIZE,
+    MAX_SMALL_REQUEST_BODY_SIZE,
+    MAX_STREAM_NUM_COUNT,
+    MAX_TEXT_SIZE,
+    MAX_TOKEN_COUNT,
+    MAX_UPLOAD_BODY_SIZE,
+    MAX_UPLOAD_SIZE,
+    STREAM_CHUNK_SIZE,
+)
+from backend.parsers import NDJSONParser, OctetStreamParser, PlainTextParser, StreamingJSONParser
+from backend.result_cache import (
+    cached_caesar_cipher,
+    cached_vigenere_cipher,
+    caesar_parameters,
+    input_digest,
+    result_cache,
+    vigenere_parameters,
+)
+from backend.utils.caesar_cipher import caesar_cipher_bytes, caesar_cipher_chunks
+from backend.utils.caesar_crack import crack_caesar
+from backend.utils.entropy import secret_keys
+from backend.utils.file_cipher import caesar_cipher_file, vigenere_cipher_file
+from backend.utils.passwords import generate_passwords
+from backend.utils.permutation import FeistelPermutation
+from backend.utils.vigenere_cipher import vigenere_cipher_bytes, vigenere_cipher_chunks
+from backend.utils.vigenere_crack import MAX_KEY_LENGTH, crack_vigenere
+from backend.utils.random_numbers import generate_random_numbers, iter_random_numbers
+from backend.utils.text_statistics import text_statistics
+from backend.utils.tokens import iter_tokens
+
+
+# The cipher endpoints also take the text as a raw text/plain or
+# application/octet-stream body, which the raw parsers hand over as bytes,
+# and stream the JSON text field when the client asks for a streamed reply
+CIPHER_PARSERS = [StreamingJSONParser, FormParser, MultiPartParser, PlainTextParser, OctetStreamParser]
+RAW_MEDIA_TYPES = (PlainTextParser.media_type, OctetStreamParser.media_type)
+
+
+@limit_request_body(MAX_SMALL_REQUEST_BODY_SIZE)
 @csrf_protect
 @api_view(['POST'])
 @permission_classes([AllowAny,])
 def generator_view(request):
     if request.method == 'POST':
-        _secret_key = get_random_secret_key()
+        _secret_key = secret_keys.get()
 
         response = {
             'key': _secret_key
@@ -30,24 +76,198 @@ def generator_view(request):
     return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
 
 
-MAX_TEXT_SIZE = 10 * 1024 * 1024  # 10 MB
-MAX_NUM_COUNT = 1000  # 1000 numbers can be generated
+def wants_stream(request):
+    """Returns True when the client opted into a streamed plain text response"""
+
+    return request.query_params.get('stream', '').lower() in ('1', 'true', 'yes')
+
+
+def iter_text_chunks(text, chunk_size=STREAM_CHUNK_SIZE):
+    """Yields consecutive slices of text of at most chunk_size characters"""
+
+    for start in range(0, len(text), chunk_size):
+        yield text[start:start + chunk_size]
+
+
+def stream_text_field(request):
+    """
+    Ask StreamingJSONParser to hand the text field over as it is read.
+
+    A streamed text is only measured as the response goes out, too late
+    for an error status, so only bodies whose Content-Length shows they
+    cannot hold more than MAX_TEXT_SIZE of text are streamed. Longer,
+    compressed or unsized bodies are parsed whole and checked up front.
+
+    :param request: The request.
+    """
+    if getattr(request, 'content_encoding', None):
+        return
+    try:
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        return
+
+    # Escapes only make the JSON longer than the UTF-8 text it decodes to
+    if 0 < length <= MAX_TEXT_SIZE:
+        request.parser_context['stream_field'] = 'text'
+
+
+def text_chunks(text):
+    """Returns the chunks of a text, or the text itself if the parser already streams it"""
+
+    return text if isinstance(text, Iterator) else iter_text_chunks(text)
+
+
+def stream_text_response(chunks):
+    """Returns a plain text response that encodes chunks as they are produced"""
+
+    return StreamingHttpResponse(
+        (chunk.encode('utf-8') for chunk in chunks),
+        content_type='text/plain; charset=utf-8',
+        status=status.HTTP_200_OK,
+    )
+
+
+def raw_param(request, name, default=None):
+    """Returns a raw mode parameter from the query string or its X-Cipher-* header"""
+
+    value = request.query_params.get(name)
+    if value is None:
+        value = request.headers.get(f'X-Cipher-{name.capitalize()}', default)
+    return value
+
+
+def raw_response(request, data):
+    """Returns ciphered bytes as the body, in the media type they came in"""
+
+    # The ciphers work in place on the parsed bytearray; HttpResponse only
+    # takes bytes, so this is the one copy the body goes through
+    return HttpResponse(bytes(data), content_type=request.content_type, status=status.HTTP_200_OK)
+
+
+def raw_body_too_large(request):
+    """Returns True when a raw body declares more than MAX_TEXT_SIZE bytes, so it is refused unread"""
+
+    if request.content_type not in RAW_MEDIA_TYPES:
+        return False
+    try:
+        return int(request.META.get('CONTENT_LENGTH') or 0) > MAX_TEXT_SIZE
+    except ValueError:
+        return False
+
+
+def conditional_response(request, digest, compute, render, representation=None):
+    """
+    Answer a cipher request whose result is a pure function of its inputs.
 
+    The ETag is the input digest, so a client that already holds the result
+    gets an empty 304 and compute never runs. That is a 304 on POST, where
+    RFC 9110 would send 412; see not_modified. When the body depends on the
+    negotiated renderer, its media type goes into the ETag and the response
+    varies on Accept, so a JSON and an HTML copy never share a tag.
 
+    :param request: The request.
+    :param digest: The input_digest of the call.
+    :param compute: A callable returning the result.
+    :param render: A callable turning the result into a response.
+    :param representation: The media type of the rendered body, if it depends on Accept.
+    :return: A 304 response, or the rendered result tagged with its ETag.
+    """
+    etag = input_etag(digest, representation)
+    if etag_matches(request, etag):
+        response = not_modified(etag)
+    else:
+        response = render(compute())
+        response['ETag'] = etag
+
+    if representation is not None:
+        patch_vary_headers(response, ('Accept',))
+    return response
+
+
+def json_result(result):
+    return Response({"result": result}, status=status.HTTP_200_OK)
+
+
+def json_result_response(request, digest, compute):
+    """Returns conditional_response for a {"result": ...} body in the negotiated renderer"""
+
+    return conditional_response(request, digest, compute, json_result, request.accepted_renderer.media_type)
+
+
+def caesar_cipher_raw(request):
+    data = request.data
+
+    if len(data) > MAX_TEXT_SIZE:
+        return Response({"error": "Text size exceeds the allowed limit."}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        parameters = caesar_parameters(raw_param(request, 'shift', 3), raw_param(request, 'mode', 'encrypt'))
+    except ValueError as val_error:
+        return Response({"error": f"Wrong shift type! {val_error}"}, status=status.HTTP_400_BAD_REQUEST)
+
+    return conditional_response(
+        request,
+        input_digest(f'caesar-raw:{request.content_type}', parameters, data),
+        lambda: caesar_cipher_bytes(data, shift=int(parameters)),
+        lambda result: raw_response(request, result),
+    )
+
+
+def vigenere_cipher_raw(request):
+    data = request.data
+    key = raw_param(request, 'key', '')
+
+    if len(data) > MAX_TEXT_SIZE:
+        return Response({"error": "Text size exceeds the allowed limit."}, status=status.HTTP_400_BAD_REQUEST)
+
+    if not key:
+        return Response({"error": "Key is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+    mode = raw_param(request, 'mode', 'encrypt')
+    try:
+        parameters = vigenere_parameters(key, mode)
+    except ValueError as e:
+        return Response({"error": f"Wrong data type! {e}"}, status=status.HTTP_400_BAD_REQUEST)
+
+    return conditional_response(
+        request,
+        input_digest(f'vigenere-raw:{request.content_type}', parameters, data),
+        lambda: vigenere_cipher_bytes(data, key=key, mode=mode),
+        lambda result: raw_response(request, result),
+    )
+
+
+@limit_request_body(MAX_REQUEST_BODY_SIZE)
 @csrf_protect
 @api_view(['POST'])
+@parser_classes(CIPHER_PARSERS)
 @permission_classes([AllowAny,])
 def caesar_cipher_view(request):
     if request.method == 'POST':
+        if raw_body_too_large(request):
+            return Response({"error": "Text size exceeds the allowed limit."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if wants_stream(request):
+            stream_text_field(request)
+
+        if isinstance(request.data, bytearray):
+            return caesar_cipher_raw(request)
+
         text = request.data.get('text', '')
         shift = request.data.get('shift', 3)
         mode = request.data.get('mode', 'encrypt')
 
-        if len(text.encode('utf-8')) > MAX_TEXT_SIZE:
+        if not isinstance(text, Iterator) and exceeds_text_limit(text):
             return Response({"error": "Text size exceeds the allowed limit."}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            result = caesar_cipher(text, shift=shift, mode=mode)
+            if wants_stream(request):
+                chunks = caesar_cipher_chunks(text_chunks(text), shift=shift, mode=mode)
+                return stream_text_response(chunks)
+
+            digest = input_digest('caesar', caesar_parameters(shift, mode), text)
+            return json_result_response(request, digest, lambda: cached_caesar_cipher(text, shift, mode, digest))
         except TypeError as type_error:
             return Response({"error": f"Wrong data type! {type_error}"}, status=status.HTTP_400_BAD_REQUEST)
         except ValueError as val_error:
@@ -55,47 +275,161 @@ def caesar_cipher_view(request):
         except Exception as e:
             return Response({"error": f"An unexpected error occurred. {e}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        return Response({"result": result}, status=status.HTTP_200_OK)
-
     return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
 
 
+@limit_request_body(MAX_REQUEST_BODY_SIZE)
 @csrf_protect
 @api_view(['POST'])
+@parser_classes(CIPHER_PARSERS)
 @permission_classes([AllowAny,])
 def vigenere_cipher_view(request):
     if request.method == 'POST':
+        if raw_body_too_large(request):
+            return Response({"error": "Text size exceeds the allowed limit."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if wants_stream(request):
+            stream_text_field(request)
+
+        if isinstance(request.data, bytearray):
+            return vigenere_cipher_raw(request)
+
         text = request.data.get('text', '')
         key = request.data.get('key', '')
         mode = request.data.get('mode', 'encrypt')
 
-        # Validate text size
-        if len(text.encode('utf-8')) > MAX_TEXT_SIZE:
+        # Validate text size; a streamed text is checked as it is read
+        if not isinstance(text, Iterator) and exceeds_text_limit(text):
             return Response({"error": "Text size exceeds the allowed limit."}, status=status.HTTP_400_BAD_REQUEST)
 
         # Validate key (must not be empty)
         if not key:
             return Response({"error": "Key is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Perform Vigenère cipher operation
-        result = vigenere_cipher(text, key=key, mode=mode)
+        try:
+            # The key is validated before the streamed response is started
+            if wants_stream(request):
+                chunks = vigenere_cipher_chunks(text_chunks(text), key=key, mode=mode)
+                return stream_text_response(chunks)
+
+            digest = input_digest('vigenere', vigenere_parameters(key, mode), text)
+        except (TypeError, ValueError) as e:
+            return Response({"error": f"Wrong data type! {e}"}, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response({"result": result}, status=status.HTTP_200_OK)
+        # Perform Vigenère cipher operation, unless the client already has the result
+        return json_result_response(request, digest, lambda: cached_vigenere_cipher(text, key, mode, digest))
 
     return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
 
 
+@limit_request_body(MAX_UPLOAD_BODY_SIZE)
+@csrf_protect
+@api_view(['POST'])
+@parser_classes([MultiPartParser])
+@permission_classes([AllowAny,])
+def cipher_file_view(request):
+    if request.method == 'POST':
+        upload = request.FILES.get('file')
+        cipher = request.data.get('cipher', 'caesar')
+        mode = request.data.get('mode', 'encrypt')
+
+        if upload is None:
+            return Response({"error": "A file is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if upload.size > MAX_UPLOAD_SIZE:
+            return Response({"error": "File size exceeds the allowed limit."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Large uploads were spooled to a temporary file, which is memory-mapped
+        # and ciphered one window at a time while the response streams out
+        try:
+            if cipher == 'caesar':
+                chunks = caesar_cipher_file(upload, shift=request.data.get('shift', 3), mode=mode)
+            elif cipher == 'vigenere':
+                key = request.data.get('key', '')
+                if not key:
+                    return Response({"error": "Key is required."}, status=status.HTTP_400_BAD_REQUEST)
+                chunks = vigenere_cipher_file(upload, key=key, mode=mode)
+            else:
+                return Response({"error": f"Unknown cipher: {cipher!r}."}, status=status.HTTP_400_BAD_REQUEST)
+        except (TypeError, ValueError) as e:
+            return Response({"error": f"Wrong parameter! {e}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = StreamingHttpResponse(chunks, content_type='application/octet-stream', status=status.HTTP_200_OK)
+        response['Content-Disposition'] = content_disposition_header(True, upload.name)
+        return response
+
+    return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
+
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+# Media types of the streamed random number formats
+NUMBER_STREAM_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'binary': 'application/octet-stream',
+}
+
+
+def number_stream_format(request):
+    """Returns 'ndjson' or 'binary' when the client asked for streamed numbers, else None"""
+
+    value = request.query_params.get('stream', '').lower()
+    if value in ('1', 'true', 'yes'):
+        return 'ndjson'
+    return value if value in NUMBER_STREAM_TYPES else None
+
+
+def encode_number_chunks(chunks, stream_format):
+    """Yields each chunk of numbers as NDJSON lines or packed little-endian int64 frames"""
+
+    for chunk in chunks:
+        if stream_format == 'ndjson':
+            yield ''.join([f"{number}\n" for number in chunk]).encode('ascii')
+            continue
+
+        frame = array('q', chunk)
+        if sys.byteorder == 'big':
+            frame.byteswap()
+        yield frame.tobytes()
+
+
+def number_stream_response(chunks, stream_format, min_value, max_value):
+    """Returns the streamed numbers, or a 400 when a binary stream cannot hold the range"""
+
+    if stream_format == 'binary' and not INT64_MIN <= min_value <= max_value <= INT64_MAX:
+        return Response({"error": "Binary streams carry int64 numbers; min_value and max_value must fit in 64 bits."}, status=status.HTTP_400_BAD_REQUEST)
+
+    return StreamingHttpResponse(
+        encode_number_chunks(chunks, stream_format),
+        content_type=NUMBER_STREAM_TYPES[stream_format],
+        status=status.HTTP_200_OK,
+    )
+
+
+def stream_random_numbers(min_value, max_value, count, unique, stream_format):
+    if count > MAX_STREAM_NUM_COUNT:
+        return Response({"error": f"count cannot be more than {MAX_STREAM_NUM_COUNT}"}, status=status.HTTP_400_BAD_REQUEST)
+
+    chunks = iter_random_numbers(min_value, max_value, count, unique)
+
+    return number_stream_response(chunks, stream_format, min_value, max_value)
+
+
+@limit_request_body(MAX_SMALL_REQUEST_BODY_SIZE)
 @csrf_protect
 @api_view(['POST'])
 @permission_classes([AllowAny,])
 def secure_random_numbers_view(request):
     if request.method == 'POST':
+        # Parse outside the try, so parse errors and oversized bodies keep their 400 and 413
+        data = request.data
+
         try:
             # Extract data from the request
-            min_value = request.data.get('min_value')
-            max_value = request.data.get('max_value')
-            count = request.data.get('count', 1)
-            unique = request.data.get('unique', True)
+            min_value = data.get('min_value')
+            max_value = data.get('max_value')
+            count = data.get('count', 1)
+            unique = data.get('unique', True)
 
             # Validate required fields
             if min_value is None or max_value is None:
@@ -107,8 +441,12 @@ def secure_random_numbers_view(request):
             count = int(count)
             unique = bool(unique)
 
+            stream_format = number_stream_format(request)
+            if stream_format and count > 0:
+                return stream_random_numbers(min_value, max_value, count, unique, stream_format)
+
             if count > MAX_NUM_COUNT:
-                return Response({"error": "count cannot be more than 1000"}, status=status.HTTP_400_BAD_REQUEST)
+                return Response({"error": f"count cannot be more than {MAX_NUM_COUNT}"}, status=status.HTTP_400_BAD_REQUEST)
             elif count <= 0:
                 return Response({"error": "count cannot be less or equal 0"}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -124,3 +462,281 @@ def secure_random_numbers_view(request):
             return Response({"error": f"An unexpected error occurred. {e}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
+
+
+def encode_token_chunks(chunks):
+    """Yields each chunk of tokens as NDJSON lines of JSON strings"""
+
+    # Token alphabets hold no quotes, backslashes or control characters,
+    # so the tokens need no escaping
+    for chunk in chunks:
+        yield ''.join([f'"{token}"\n' for token in chunk]).encode('ascii')
+
+
+@limit_request_body(MAX_SMALL_REQUEST_BODY_SIZE)
+@csrf_protect
+@api_view(['POST'])
+@permission_classes([AllowAny,])
+def tokens_view(request):
+    if request.method == 'POST':
+        token_format = request.data.get('format', 'django')
+        length = request.data.get('length')
+
+        try:
+            count = int(request.data.get('count', 1))
+
+            if count > MAX_TOKEN_COUNT:
+                return Response({"error": f"count cannot be more than {MAX_TOKEN_COUNT}"}, status=status.HTTP_400_BAD_REQUEST)
+            elif count <= 0:
+                return Response({"error": "count cannot be less or equal 0"}, status=status.HTTP_400_BAD_REQUEST)
+
+            chunks = iter_tokens(token_format, count, length)
+        except (TypeError, ValueError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return StreamingHttpResponse(
+            encode_token_chunks(chunks),
+            content_type='application/x-ndjson',
+            status=status.HTTP_200_OK,
+        )
+
+    return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
+
+
+def flag(value):
+    """Reads a boolean request field, which form bodies send as a string"""
+
+    return str(value).lower() in ('1', 'true', 'yes', 'on')
+
+
+@limit_request_body(MAX_SMALL_REQUEST_BODY_SIZE)
+@csrf_protect
+@api_view(['POST'])
+@permission_classes([AllowAny,])
+def passwords_view(request):
+    if request.method == 'POST':
+        data = request.data
+        exclude = data.get('exclude', '')
+
+        if not isinstance(exclude, str):
+            return Response({"error": f"Wrong data type! exclude must be a string, not {type(exclude).__name__}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            count = int(data.get('count', 1))
+
+            if count > MAX_PASSWORD_COUNT:
+                return Response({"error": f"count cannot be more than {MAX_PASSWORD_COUNT}"}, status=status.HTTP_400_BAD_REQUEST)
+            elif count <= 0:
+                return Response({"error": "count cannot be less or equal 0"}, status=status.HTTP_400_BAD_REQUEST)
+
+            passwords = generate_passwords(
+                count=count,
+                length=int(data.get('length', 16)),
+                min_upper=int(data.get('min_upper', 1)),
+                min_lower=int(data.get('min_lower', 1)),
+                min_digits=int(data.get('min_digits', 1)),
+                min_special=int(data.get('min_special', 1)),
+                exclude_ambiguous=flag(data.get('exclude_ambiguous', False)),
+                exclude=exclude,
+            )
+        except (TypeError, ValueError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({"passwords": passwords}, status=status.HTTP_200_OK)
+
+    return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
+
+
+def permutation_positions(data, permutation, limit):
+    """Returns the start and stop positions a permutation request asks for; raises ValueError"""
+
+    if data.get('workers') is not None:
+        positions = permutation.shard(int(data.get('worker', 0)), int(data['workers']))
+        start, stop = positions.start, positions.stop
+    else:
+        start = int(data.get('start', 0))
+        stop = int(data.get('stop', min(permutation.size, start + limit)))
+
+    if not 0 <= start <= stop <= permutation.size:
+        raise ValueError("start and stop must satisfy 0 <= start <= stop <= the size of the range")
+    if stop - start > limit:
+        raise ValueError(f"count cannot be more than {limit}")
+    return start, stop
+
+
+@limit_request_body(MAX_SMALL_REQUEST_BODY_SIZE)
+@csrf_protect
+@api_view(['POST'])
+@permission_classes([AllowAny,])
+def random_permutation_view(request):
+    if request.method == 'POST':
+        min_value = request.data.get('min_value')
+        max_value = request.data.get('max_value')
+        key = request.data.get('key')
+
+        if min_value is None or max_value is None:
+            return Response({"error": "min_value and max_value are required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            min_value = int(min_value)
+            max_value = int(max_value)
+            if min_value >= max_value:
+                raise ValueError("min_value must be less than max_value")
+
+            # Passing back the key of an earlier response revisits its permutation
+            permutation = FeistelPermutation(max_value - min_value + 1, key=bytes.fromhex(key) if key else None)
+        except (TypeError, ValueError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        stream_format = number_stream_format(request)
+
+        try:
+            if request.data.get('index') is not None:
+                index = int(request.data['index'])
+                value = min_value + permutation[index]
+                return Response({"key": permutation.key.hex(), "index": index, "value": value}, status=status.HTTP_200_OK)
+
+            start, stop = permutation_positions(
+                request.data, permutation, MAX_STREAM_NUM_COUNT if stream_format else MAX_NUM_COUNT,
+            )
+        except (IndexError, TypeError, ValueError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        chunks = ([min_value + offset for offset in chunk] for chunk in permutation.iter_chunks(start, stop))
+
+        if stream_format:
+            response = number_stream_response(chunks, stream_format, min_value, max_value)
+            response['X-Permutation-Key'] = permutation.key.hex()
+            return response
+
+        return Response(
+            {"key": permutation.key.hex(), "start": start, "stop": stop, "values": [value for chunk in chunks for value in chunk]},
+            status=status.HTTP_200_OK,
+        )
+
+    return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
+
+
+@limit_request_body(MAX_REQUEST_BODY_SIZE)
+@csrf_protect
+@api_view(['POST'])
+@parser_classes([JSONParser, NDJSONParser])
+@permission_classes([AllowAny,])
+def batch_view(request):
+    if request.method == 'POST':
+        operations = request.data
+        if isinstance(operations, dict):
+            operations = operations.get('operations')
+
+        # NDJSON bodies arrive as a lazy iterator and are checked line by line
+        if isinstance(operations, list):
+            if len(operations) > MAX_BATCH_SIZE:
+                return Response(
+                    {"error": f"A batch cannot hold more than {MAX_BATCH_SIZE} operations."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        elif not isinstance(operations, Iterator):
+            return Response({"error": "operations must be a list."}, status=status.HTTP_400_BAD_REQUEST)
+
+        return StreamingHttpResponse(
+            iter_batch_lines(operations),
+            content_type='application/x-ndjson',
+            status=status.HTTP_200_OK,
+        )
+
+    return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
+
+
+@limit_request_body(MAX_REQUEST_BODY_SIZE)
+@csrf_protect
+@api_view(['POST'])
+@permission_classes([AllowAny,])
+def caesar_crack_view(request):
+    if request.method == 'POST':
+        text = request.data.get('text', '')
+        top = request.data.get('top', 26)
+
+        if not isinstance(text, str):
+            return Response({"error": "Wrong data type! text must be a string."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if exceeds_text_limit(text):
+            return Response({"error": "Text size exceeds the allowed limit."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            candidates = crack_caesar(text, top=int(top))
+        except (TypeError, ValueError) as e:
+            return Response({"error": f"Wrong top value! {e}"}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"error": f"An unexpected error occurred. {e}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        return Response({"candidates": candidates}, status=status.HTTP_200_OK)
+
+    return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
+
+
+@limit_request_body(MAX_REQUEST_BODY_SIZE)
+@csrf_protect
+@api_view(['POST'])
+@permission_classes([AllowAny,])
+def vigenere_crack_view(request):
+    if request.method == 'POST':
+        text = request.data.get('text', '')
+        max_key_length = request.data.get('max_key_length', MAX_KEY_LENGTH)
+        top = request.data.get('top', 3)
+
+        if not isinstance(text, str):
+            return Response({"error": "Wrong data type! text must be a string."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if exceeds_text_limit(text):
+            return Response({"error": "Text size exceeds the allowed limit."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            # The cost grows with the square of the key length, so it is capped
+            max_key_length = int(max_key_length)
+            if max_key_length > MAX_KEY_LENGTH:
+                return Response({"error": f"max_key_length cannot be more than {MAX_KEY_LENGTH}"}, status=status.HTTP_400_BAD_REQUEST)
+            elif max_key_length <= 0:
+                return Response({"error": "max_key_length cannot be less or equal 0"}, status=status.HTTP_400_BAD_REQUEST)
+
+            result = crack_vigenere(text, max_key_length=max_key_length, top=top)
+        except (TypeError, ValueError) as e:
+            return Response({"error": f"Wrong parameter! {e}"}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"error": f"An unexpected error occurred. {e}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        return Response(result, status=status.HTTP_200_OK)
+
+    return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
+
+
+@limit_request_body(MAX_REQUEST_BODY_SIZE)
+@csrf_protect
+@api_view(['POST'])
+@permission_classes([AllowAny,])
+def text_statistics_view(request):
+    if request.method == 'POST':
+        text = request.data.get('text', '')
+
+        if not isinstance(text, str):
+            return Response({"error": "Wrong data type! text must be a string."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if exceeds_text_limit(text):
+            return Response({"error": "Text size exceeds the allowed limit."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            statistics = text_statistics(text)
+        except Exception as e:
+            return Response({"error": f"An unexpected error occurred. {e}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        return Response(statistics, status=status.HTTP_200_OK)
+
+    return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny,])
+def cache_stats_view(request):
+    if request.method == 'GET':
+        return Response(result_cache.stats(), status=status.HTTP_200_OK)
+
+    return Response({"error": "Invalid request method."}, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,50 @@
+"""
+Throughput of the ASCII and non-ASCII paths of both cipher engines.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_ascii_paths
+"""
+import time
+
+from backend.tests.config.config_reference_ciphers import reference_caesar_cipher, reference_vigenere_cipher
+from backend.utils.caesar_cipher import caesar_cipher
+from backend.utils.vigenere_cipher import vigenere_cipher
+
+
+SIZE = 4 * 1024 * 1024
+
+SAMPLES = {
+    'ascii': "The quick brown fox jumps over the lazy dog, 1234567890! ",
+    'accented': "Le cœur a ses raisons que la raison ne connaît point. Déjà vu! ",
+    'cyrillic': "Съешь же ещё этих мягких французских булок, да выпей чаю. abc ",
+}
+
+
+def measure(function, text, argument):
+    """Returns the best wall time of function over three runs"""
+
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        function(text, argument)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    megabytes = SIZE / (1024 * 1024)
+    print(f"{'input':>9} {'cipher':>9} {'legacy MB/s':>12} {'engine MB/s':>12}")
+    for label, sample in SAMPLES.items():
+        text = (sample * (SIZE // len(sample) + 1))[:SIZE]
+        for name, engine, legacy, argument in (
+            ('caesar', caesar_cipher, reference_caesar_cipher, 3),
+            ('vigenere', vigenere_cipher, reference_vigenere_cipher, 'LEMON'),
+        ):
+            legacy_time = measure(legacy, text[:SIZE // 16], argument) * 16
+            engine_time = measure(engine, text, argument)
+            print(f"{label:>9} {name:>9} {megabytes / legacy_time:12.1f} {megabytes / engine_time:12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Latency of small cipher requests while large ones run, sync vs async views.
+
+Both sets of views are driven through the ASGI handler. Sync views share
+one thread under ASGI, so a small request queues behind every large one;
+the async views keep small requests on the event loop and ship large ones
+to the process pool.
+
+Run from the repository root, optionally with the large request size in MB:
+
+    python -m benchmarks.bench_async_views 4
+"""
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'eye_diskage.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import AsyncClient  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.urls import reverse  # noqa: E402
+
+from backend.utils.parallel_cipher import get_pool, shutdown_pool  # noqa: E402
+from benchmarks.bench_caesar_cipher import make_text  # noqa: E402
+
+
+SMALL_REQUESTS = 200
+LARGE_CONCURRENCY = 2
+KEY = 'LEMONADEWITHSUGAR'
+
+
+async def post(client, url, text):
+    """Posts one Vigenère request and returns its latency in seconds"""
+
+    body = json.dumps({'text': text, 'key': KEY})
+    start = time.perf_counter()
+    response = await client.post(url, data=body, content_type='application/json')
+    elapsed = time.perf_counter() - start
+    assert response.status_code == 200, response.content[:200]
+    return elapsed
+
+
+async def large_traffic(client, url, text, stop):
+    while not stop.is_set():
+        await post(client, url, text)
+
+
+async def measure(url, large_text):
+    """Returns the small request latencies while large requests keep running"""
+
+    client = AsyncClient()
+    stop = asyncio.Event()
+    background = [asyncio.create_task(large_traffic(client, url, large_text, stop)) for _ in range(LARGE_CONCURRENCY)]
+
+    # Let the large requests get going first
+    await asyncio.sleep(0.05)
+    latencies = [await post(client, url, 'Attack at dawn') for _ in range(SMALL_REQUESTS)]
+
+    stop.set()
+    await asyncio.gather(*background)
+    return latencies
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    large_text = make_text(megabytes * 1024 * 1024)
+    setup_test_environment()
+    print(f"{SMALL_REQUESTS} small requests next to {LARGE_CONCURRENCY} streams of {megabytes} MB requests, "
+          f"{os.cpu_count()} CPUs")
+
+    # Start the pool workers before timing anything
+    get_pool().submit(int).result()
+
+    for name, url_name in (('sync', 'eye-vigenere-text'), ('async', 'eye-async-vigenere-text')):
+        latencies = asyncio.run(measure(reverse(url_name), large_text))
+        print(f"{name:>6} p50 {statistics.median(latencies) * 1000:8.1f} ms"
+              f"  p99 {percentile(latencies, 0.99) * 1000:8.1f} ms"
+              f"  max {max(latencies) * 1000:8.1f} ms")
+
+    shutdown_pool()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Throughput of the table driven Caesar engine against the original
+character by character loop.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_caesar_cipher
+"""
+import time
+
+from backend.tests.config.config_reference_ciphers import reference_caesar_cipher
+from backend.utils.caesar_cipher import caesar_cipher
+
+
+SIZES = {
+    '1 KB': 1024,
+    '1 MB': 1024 * 1024,
+    '10 MB': 10 * 1024 * 1024,
+}
+
+SAMPLE = "The quick brown fox jumps over the lazy dog, 1234567890! "
+
+
+def make_text(size):
+    """Returns mixed case ASCII text of exactly size characters"""
+
+    return (SAMPLE * (size // len(SAMPLE) + 1))[:size]
+
+
+def measure(function, text, repeat):
+    """Returns the best wall time of function over repeat runs"""
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(text, 3)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'size':>6} {'legacy MB/s':>12} {'table MB/s':>12} {'speedup':>9}")
+    for label, size in SIZES.items():
+        text = make_text(size)
+        repeat = 5 if size <= 1024 * 1024 else 1
+        legacy = measure(reference_caesar_cipher, text, repeat)
+        table = measure(caesar_cipher, text, repeat)
+        megabytes = size / (1024 * 1024)
+        print(f"{label:>6} {megabytes / legacy:12.1f} {megabytes / table:12.1f} {legacy / table:8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Speedup of the process pool cipher engines over the inline engines.
+
+Run from the repository root, optionally with the input size in MB:
+
+    python -m benchmarks.bench_parallel_cipher 100
+"""
+import os
+import sys
+import time
+
+from backend.utils.caesar_cipher import caesar_cipher
+from backend.utils.parallel_cipher import get_pool, parallel_caesar_cipher, parallel_vigenere_cipher, shutdown_pool
+from backend.utils.vigenere_cipher import vigenere_cipher
+from benchmarks.bench_caesar_cipher import make_text
+
+
+WORKER_COUNTS = (1, 2, 4, 8)
+KEY = 'LEMONADEWITHSUGAR'
+
+
+def measure(function, *args, **kwargs):
+    """Returns the best wall time of function over three runs"""
+
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    text = make_text(megabytes * 1024 * 1024)
+    print(f"{megabytes} MB ASCII input, {os.cpu_count()} CPUs")
+
+    # Start the pool workers before timing anything
+    get_pool().submit(int).result()
+
+    for name, inline, parallel, argument in (
+        ('caesar', caesar_cipher, parallel_caesar_cipher, 3),
+        ('vigenere', vigenere_cipher, parallel_vigenere_cipher, KEY),
+    ):
+        baseline = measure(inline, text, argument)
+        print(f"{name:>9} inline   {megabytes / baseline:8.1f} MB/s")
+        for workers in WORKER_COUNTS:
+            elapsed = measure(parallel, text, argument, workers=workers)
+            print(f"{name:>9} {workers} chunks {megabytes / elapsed:8.1f} MB/s {baseline / elapsed:6.2f}x")
+
+    shutdown_pool()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Throughput of the constructive password generator against a rejection loop
+that draws whole passwords until one meets the policy, for increasingly
+tight policies, on one core.
+
+Run from the repository root, optionally with the number of passwords:
+
+    python -m benchmarks.bench_passwords 20000
+"""
+import secrets
+import sys
+import time
+
+from backend.utils.passwords import generate_passwords, password_classes
+
+# (length, min_upper, min_lower, min_digits, min_special)
+POLICIES = [
+    (16, 1, 1, 1, 1),
+    (12, 2, 2, 2, 2),
+    (12, 3, 3, 3, 3),
+    (10, 2, 2, 3, 3),
+]
+
+
+def rejection_passwords(count, length, *minimums):
+    classes = list(password_classes().values())
+    alphabet = ''.join(classes)
+    passwords = []
+    while len(passwords) < count:
+        password = ''.join(secrets.choice(alphabet) for _ in range(length))
+        if all(sum(char in chars for char in password) >= minimum for chars, minimum in zip(classes, minimums)):
+            passwords.append(password)
+    return passwords
+
+
+def rate(function, count, policy):
+    start = time.perf_counter()
+    function(count, *policy)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"{count} passwords per policy")
+    print(f"{'length, minimums':>20} {'rejection':>14} {'constructive':>14}")
+    for policy in POLICIES:
+        rejection = rate(rejection_passwords, count, policy)
+        constructive = rate(lambda n, *args: generate_passwords(n, *args), count, policy)
+        label = f"{policy[0]}, {'/'.join(map(str, policy[1:]))}"
+        print(f"{label:>20} {rejection:12,.0f}/s {constructive:12,.0f}/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Cost of generating random numbers: secrets.randbelow per number vs bulk entropy.
+
+Counts reads from the OS RNG alongside wall time, for unique and non-unique
+numbers at a few range densities.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_random_numbers
+"""
+import os
+import secrets
+import time
+
+from backend.utils import entropy as entropy_module
+from backend.utils.random_numbers import generate_random_numbers, sample_unique
+
+
+COUNT = 50000
+
+CASES = [
+    ('non-unique', 10 ** 9, False),
+    ('unique, sparse', 10 ** 9, True),
+    ('unique, medium', 10 * COUNT, True),
+    ('unique, dense', COUNT, True),
+]
+
+
+class CountingUrandom:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, size):
+        self.calls += 1
+        return os.urandom(size)
+
+
+def per_number(size, unique):
+    """The previous approach: one secrets.randbelow call per number"""
+
+    if unique:
+        return sample_unique(size, COUNT, secrets.randbelow)
+    return [secrets.randbelow(size) for _ in range(COUNT)]
+
+
+def best_time(function, *args):
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    urandom = CountingUrandom()
+    entropy_module.entropy.source = urandom
+
+    print(f"{COUNT} numbers")
+    print(f"{'case':>16} {'randbelow ms':>13} {'bulk ms':>9} {'bulk OS reads':>14}")
+    for label, size, unique in CASES:
+        legacy = best_time(per_number, size, unique)
+        urandom.calls = 0
+        bulk = best_time(generate_random_numbers, 1, size, COUNT, unique)
+        print(f"{label:>16} {legacy * 1000:13.1f} {bulk * 1000:9.1f} {urandom.calls / 3:14.1f}")
+
+
+if __name__ == '__main__':
+    main()
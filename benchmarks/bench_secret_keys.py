@@ -0,0 +1,57 @@
+"""
+Latency of secret key generation in bursts: get_random_secret_key vs the key queue.
+
+Each burst asks for many keys back to back, then pauses long enough for
+the background thread to top the queue up again, which is how bursts of
+requests reach /django-ker-generate/.
+
+Run from the repository root, optionally with the burst size:
+
+    python -m benchmarks.bench_secret_keys 200
+"""
+import statistics
+import sys
+import time
+
+from django.core.management.utils import get_random_secret_key
+
+from backend.utils.entropy import secret_keys
+
+
+BURSTS = 20
+PAUSE = 0.05
+
+
+def measure(get_key, burst):
+    latencies = []
+    for _ in range(BURSTS):
+        for _ in range(burst):
+            start = time.perf_counter()
+            get_key()
+            latencies.append(time.perf_counter() - start)
+        time.sleep(PAUSE)
+    return latencies
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    burst = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"{BURSTS} bursts of {burst} keys, queue of {secret_keys.size}")
+
+    # Let the queue fill before timing it
+    secret_keys.get()
+    time.sleep(PAUSE)
+
+    for name, get_key in (('get_random_secret_key', get_random_secret_key), ('queue', secret_keys.get)):
+        latencies = measure(get_key, burst)
+        print(f"{name:>22} p50 {statistics.median(latencies) * 1e6:8.1f} us"
+              f"  p99 {percentile(latencies, 0.99) * 1e6:8.1f} us"
+              f"  max {max(latencies) * 1e6:8.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+"""
+Throughput of the token generator, per format, on one core.
+
+Run from the repository root, optionally with the number of tokens:
+
+    python -m benchmarks.bench_tokens 200000
+"""
+import sys
+import time
+
+from backend.utils.tokens import TOKEN_FORMATS, iter_tokens
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"{count} tokens per format")
+    for token_format in TOKEN_FORMATS:
+        start = time.perf_counter()
+        for _ in iter_tokens(token_format, count):
+            pass
+        elapsed = time.perf_counter() - start
+        print(f"{token_format:>8} {count / elapsed:12,.0f} tokens/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Throughput of the column strided Vigenère engine against the original
+character by character loop.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_vigenere_cipher
+"""
+import time
+
+from backend.tests.config.config_reference_ciphers import reference_vigenere_cipher
+from backend.utils.vigenere_cipher import vigenere_cipher
+from benchmarks.bench_caesar_cipher import make_text
+
+
+SIZES = {
+    '1 KB': 1024,
+    '1 MB': 1024 * 1024,
+    '4 MB': 4 * 1024 * 1024,
+}
+
+KEYS = ('KEY', 'LEMONADEWITHSUGAR')
+
+
+def measure(function, text, key, repeat):
+    """Returns the best wall time of function over repeat runs"""
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(text, key)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'size':>6} {'key':>18} {'legacy MB/s':>12} {'strided MB/s':>13} {'speedup':>9}")
+    for label, size in SIZES.items():
+        text = make_text(size)
+        repeat = 5 if size <= 1024 * 1024 else 1
+        for key in KEYS:
+            legacy = measure(reference_vigenere_cipher, text, key, repeat)
+            strided = measure(vigenere_cipher, text, key, repeat)
+            megabytes = size / (1024 * 1024)
+            print(
+                f"{label:>6} {key:>18} {megabytes / legacy:12.1f} "
+                f"{megabytes / strided:13.1f} {legacy / strided:8.0f}x"
+            )
+
+
+if __name__ == '__main__':
+    main()
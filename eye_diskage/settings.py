@@ -51,6 +51,8 @@ CORS_ALLOWED_ORIGINS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'backend.middleware.ResponseCompressionMiddleware',
+    'backend.middleware.RequestDecompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -140,3 +142,39 @@ MEDIA_URL = '/media/'
 
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10 MB
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10 MB
+
+
+# Number of Vigenère key schedules kept in each process's LRU cache
+VIGENERE_KEY_SCHEDULE_CACHE_SIZE = int(os.environ.get("VIGENERE_KEY_SCHEDULE_CACHE_SIZE", 128))
+
+# Number of ready-made secret keys each process keeps for the generator
+SECRET_KEY_QUEUE_SIZE = int(os.environ.get("SECRET_KEY_QUEUE_SIZE", 256))
+
+# Largest body a gzip or deflate request may inflate to; unset or 0 uses
+# the body limit of the text endpoints
+REQUEST_DECOMPRESSION_MAX_SIZE = int(os.environ.get("REQUEST_DECOMPRESSION_MAX_SIZE", 0)) or None
+
+# Responses shorter than this many bytes are never gzipped
+RESPONSE_COMPRESSION_MIN_SIZE = int(os.environ.get("RESPONSE_COMPRESSION_MIN_SIZE", 1024))
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Cipher results, keyed by a hash of the inputs; point this alias at a
+    # shared backend such as Redis to share results across workers
+    'cipher_results': {
+        'BACKEND': 'backend.cache.ByteBudgetLocMemCache',
+        'LOCATION': 'cipher-results',
+        'TIMEOUT': None,
+        'OPTIONS': {
+            'MAX_ENTRIES': 100000,
+            'MAX_BYTES': int(os.environ.get("CIPHER_RESULT_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
+        },
+    },
+}
+
+CIPHER_RESULT_CACHE_ALIAS = 'cipher_results'
+
+# Texts longer than this many characters skip the result cache
+CIPHER_RESULT_CACHE_MAX_TEXT_SIZE = int(os.environ.get("CIPHER_RESULT_CACHE_MAX_TEXT_SIZE", 1024 * 1024))